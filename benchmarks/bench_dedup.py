@@ -0,0 +1,98 @@
+"""
+Mükerrer kayıt birleştirme benchmark'ı
+
+Sentetik işletmelerin bir kısmı farklı biçimlerde tekrar üretilir (telefon
+yazımı, eksik alanlar, "www." öneki, büyük/küçük harf, e-posta alt kümeleri).
+Her kaydın hangi işletmeden geldiği bilindiği için süre, doğruluk
+(yanlış birleştirme) ve kapsama (kaçırılan mükerrer) birlikte raporlanır.
+
+Kullanım:
+    python benchmarks/bench_dedup.py
+    python benchmarks/bench_dedup.py --rows 100000 --duplicate-ratio 0.3
+"""
+import time
+import random
+import argparse
+
+from common import make_businesses, measure, print_table
+
+from core.dedup import Deduplicator
+from core.models import BusinessRecord
+
+def make_variant(record, rng):
+    """Aynı işletmenin başka bir taramada görülebilecek bir kopyasını üretir"""
+    phone = record.phone
+    if rng.random() < 0.5:
+        phone = "+90 " + phone.replace("0(", "(").replace("(", "").replace(")", "")
+    return BusinessRecord(
+        name=record.name.upper() if rng.random() < 0.3 else record.name,
+        address=record.address if rng.random() < 0.8 else None,
+        phone=phone if rng.random() < 0.7 else None,
+        website=record.website.replace("https://www.", "http://") if rng.random() < 0.6 else None,
+        emails=record.emails[:1] if record.emails else None,
+        # Kopyaların bir kısmı detay URL'siz gelir, böylece place_id dışındaki anahtarlar da sınanır
+        detail_url=record.detail_url if rng.random() < 0.5 else None,
+    )
+
+def make_dataset(rows, duplicate_ratio, seed=7):
+    """
+    Mükerrerler içeren karışık kayıt listesi ve her kaydın gerçek işletme indeksini üretir
+    
+    Returns:
+        tuple: (kayıtlar, gerçek işletme indeksleri)
+    """
+    rng = random.Random(seed)
+    unique_count = int(rows / (1 + duplicate_ratio))
+    originals = make_businesses(unique_count, seed)
+    records = list(originals)
+    truth = list(range(unique_count))
+    while len(records) < rows:
+        source = rng.randrange(unique_count)
+        records.append(make_variant(originals[source], rng))
+        truth.append(source)
+        
+    order = list(range(len(records)))
+    rng.shuffle(order)
+    return [records[i] for i in order], [truth[i] for i in order]
+
+def score(groups, truth):
+    """
+    Bulunan grupları gerçek işletmelerle karşılaştırır
+    
+    Returns:
+        tuple: (yanlış birleştirilen grup sayısı, fazladan kalan kayıt sayısı)
+    """
+    wrong_merges = sum(1 for group in groups if len({truth[i] for i in group}) > 1)
+    return wrong_merges, len(groups) - len(set(truth))
+
+def main():
+    parser = argparse.ArgumentParser(description="Mükerrer kayıt benchmark'ı")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--duplicate-ratio", type=float, default=0.25)
+    args = parser.parse_args()
+    
+    rows = []
+    for count in args.rows:
+        records, truth = make_dataset(count, args.duplicate_ratio)
+        deduplicator = Deduplicator()
+        
+        # Süre tracemalloc olmadan ölçülür (izleme Python kodunu belirgin şekilde yavaşlatır)
+        started = time.perf_counter()
+        groups = deduplicator.find_groups(records)
+        elapsed = time.perf_counter() - started
+        wrong_merges, missed = score(groups, truth)
+        
+        merged = deduplicator.deduplicate(records)
+        merge_elapsed = deduplicator.stats["seconds"]
+        _, _, peak_mb = measure(deduplicator.deduplicate, records)
+        rows.append((
+            count, len(set(truth)), len(merged), wrong_merges, missed,
+            deduplicator.stats["comparisons"], f"{elapsed:.2f} sn", f"{merge_elapsed:.2f} sn",
+            f"{peak_mb:.0f} MB",
+        ))
+        
+    print_table(["Kayıt", "Gerçek", "Sonuç", "Yanlış birleşme", "Kaçırılan", "Karşılaştırma",
+                 "Gruplama", "Gruplama+birleştirme", "Tepe bellek"], rows)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""
+Uçtan uca tarama benchmark'ı: gerçek MapsScraper, başsız Chrome ve yerel sahte Maps
+
+fake_maps.FakeMapsServer yerel portta arama sayfasını, detay panellerini ve
+işletme websitelerini sunar; MAPS_CONFIG["base_url"] bu sunucuya çevrilir.
+İnternet erişimi gerekmez, yalnızca Chrome ve chromedriver gerekir.
+
+Her senaryo için dakikadaki işletme, işletme başına süre (p50/p95), Chrome
+süreç ağacının tepe belleği, Python tarafındaki tepe bellek ve sahte verinin
+bilinen değerlerine göre alan doğruluğu raporlanır. Rastgele beklemeler
+--sleep-scale ile küçültülür; 1 verilirse gerçek bekleme süreleri kullanılır.
+
+Kullanım:
+    python benchmarks/bench_e2e.py
+    python benchmarks/bench_e2e.py --businesses 60 --latency-ms 20 200 --failure-rate 0 0.05
+    python benchmarks/bench_e2e.py --prefetch-depth 0 2 --no-email
+"""
+import argparse
+import itertools
+
+from common import measure, print_table
+from fake_maps import FakeMapsServer
+
+from core.config import BROWSER_CONFIG, MAPS_CONFIG, HISTORY_CONFIG
+from core.events import EventBus, BUSINESS_FINISHED, DEBUG
+from core.scraper import MapsScraper
+from core.tracing import percentile
+
+def field_accuracy(server, records):
+    """
+    Toplanan kayıtların sahte verideki değerlerle eşleşme oranı
+    
+    Returns:
+        float: Doğru alan / kontrol edilen alan (0-1)
+    """
+    expected = {business["record"].name: server.expected(business) for business in server.businesses}
+    checked = correct = 0
+    for record in records:
+        truth = expected.get(record.name)
+        if truth is None:
+            checked += 1
+            continue
+        for field in ("phone", "address", "website"):
+            checked += 1
+            correct += getattr(record, field) == truth[field]
+        checked += 1
+        correct += sorted(record.emails) == sorted(truth["emails"])
+    return correct / checked if checked else 0.0
+
+def run(args, latency_ms, failure_rate, prefetch_depth):
+    """
+    Tek senaryoyu çalıştırır
+    
+    Returns:
+        tuple: Tablo satırı
+    """
+    server = FakeMapsServer(businesses=args.businesses, page_size=args.page_size, latency_ms=latency_ms,
+                            failure_rate=failure_rate, seed=args.seed).start()
+    MAPS_CONFIG["base_url"] = server.search_base_url
+    MAPS_CONFIG["prefetch_depth"] = prefetch_depth
+    
+    events = EventBus()
+    scraper = MapsScraper(event_bus=events)
+    durations = []
+    peak_chrome = [0.0]
+    
+    def on_finished(event):
+        durations.append(event.payload["seconds"])
+        if scraper.maps_browser:
+            peak_chrome[0] = max(peak_chrome[0], scraper.maps_browser.get_memory_usage_mb())
+            
+    events.subscribe(on_finished, min_level=DEBUG, kinds=(BUSINESS_FINISHED,))
+    if args.verbose:
+        events.subscribe(lambda event: print(event.format_line()))
+        
+    try:
+        records, elapsed, python_peak = measure(
+            scraper.scrape, search_term="kafe", city="İstanbul", max_items=args.max_items,
+            data_options={'collect_address': True, 'collect_phone': True, 'collect_website': True,
+                          'collect_email': not args.no_email}
+        )
+    finally:
+        server.stop()
+        
+    durations.sort()
+    per_minute = len(records) / (elapsed / 60) if elapsed else 0.0
+    return (
+        f"{latency_ms:g} ms", f"%{failure_rate * 100:g}", prefetch_depth, len(records),
+        f"{elapsed:.1f} s", f"{per_minute:.1f}",
+        f"{percentile(durations, 50):.2f} s", f"{percentile(durations, 95):.2f} s",
+        f"{peak_chrome[0]:.0f} MB" if peak_chrome[0] else "-", f"{python_peak:.1f} MB",
+        f"%{field_accuracy(server, records) * 100:.0f}", server.failures,
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description="Uçtan uca tarama benchmark'ı (yerel sahte Maps)")
+    parser.add_argument("--businesses", type=int, default=60, help="Sahte aramadaki işletme sayısı")
+    parser.add_argument("--max-items", type=int, default=30, help="Toplanacak işletme sayısı")
+    parser.add_argument("--page-size", type=int, default=10, help="Kaydırma başına yüklenen kart")
+    parser.add_argument("--latency-ms", type=float, nargs="+", default=[50], help="İstek gecikmesi")
+    parser.add_argument("--failure-rate", type=float, nargs="+", default=[0.0], help="503 dönen istek oranı")
+    parser.add_argument("--prefetch-depth", type=int, nargs="+", default=[MAPS_CONFIG["prefetch_depth"]])
+    parser.add_argument("--sleep-scale", type=float, default=0.1, help="Rastgele beklemelerin çarpanı")
+    parser.add_argument("--no-email", action="store_true", help="Websitelerinde e-posta arama")
+    parser.add_argument("--headed", action="store_true", help="Chrome penceresini göster")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--verbose", action="store_true", help="Tarama olaylarını yazdır")
+    args = parser.parse_args()
+    
+    BROWSER_CONFIG["headless"] = not args.headed
+    BROWSER_CONFIG["sleep_scale"] = args.sleep_scale
+    # Benchmark çalıştırmaları gerçek taramaların geçmişine karışmasın
+    HISTORY_CONFIG["enabled"] = False
+    
+    rows = [run(args, latency, failure, depth) for latency, failure, depth in
+            itertools.product(args.latency_ms, args.failure_rate, args.prefetch_depth)]
+    
+    print_table(["Gecikme", "Hata", "Ön yükleme", "İşletme", "Süre", "İşletme/dk", "p50", "p95",
+                 "Chrome tepe", "Python tepe", "Doğruluk", "503"], rows)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
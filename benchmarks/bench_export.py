@@ -0,0 +1,75 @@
+"""
+Dışa aktarma karşılaştırması: mevcut pandas yolu ve akışlı (streaming) yol
+
+Her senaryo için duvar saati süresi ve dışa aktarma sırasındaki ek tepe bellek
+(tracemalloc) ölçülür. Kayıtlar ölçüm başlamadan önce bellekte hazırdır; böylece
+yalnızca dışa aktarmanın maliyeti karşılaştırılır.
+
+Kullanım:
+    python benchmarks/bench_export.py
+    python benchmarks/bench_export.py --rows 10000 100000 --keep
+"""
+import os
+import argparse
+import tempfile
+
+from common import make_businesses, measure, print_table
+
+from core.data_manager import DataManager
+
+def pandas_excel(data):
+    import pandas as pd
+    pd.DataFrame([record.to_row() for record in data]).to_excel("pandas.xlsx", index=False)
+
+def pandas_csv(data):
+    import pandas as pd
+    pd.DataFrame([record.to_row() for record in data]).to_csv("pandas.csv", index=False)
+
+def stream(data, stream_format, compress=False, rotate_rows=0):
+    manager = DataManager()
+    return manager.export_streaming(data, stream_format=stream_format, rotate_rows=rotate_rows,
+                                    compress=compress)
+
+def main():
+    parser = argparse.ArgumentParser(description="Dışa aktarma benchmark'ı")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--keep", action="store_true", help="Çıktı dosyalarını silme")
+    args = parser.parse_args()
+    
+    manager = DataManager()
+    scenarios = []
+    if manager.has_pandas:
+        scenarios.append(("pandas csv", pandas_csv))
+        if manager.has_openpyxl:
+            scenarios.append(("pandas xlsx (mevcut yol)", pandas_excel))
+    scenarios.append(("akış csv", lambda d: stream(d, "csv")))
+    scenarios.append(("akış jsonl", lambda d: stream(d, "jsonl")))
+    scenarios.append(("akış jsonl.gz", lambda d: stream(d, "jsonl", compress=True)))
+    scenarios.append(("akış csv, 25k döndürme", lambda d: stream(d, "csv", rotate_rows=25000)))
+    if manager.has_openpyxl:
+        scenarios.append(("akış xlsx (write-only)", lambda d: stream(d, "xlsx")))
+        
+    workdir = tempfile.mkdtemp(prefix="bench_export_")
+    original_dir = os.getcwd()
+    os.chdir(workdir)
+    
+    rows = []
+    try:
+        for count in args.rows:
+            data = make_businesses(count)
+            for name, func in scenarios:
+                _, elapsed, peak_mb = measure(func, data)
+                rows.append((count, name, f"{elapsed:.2f} sn", f"{peak_mb:.1f} MB"))
+    finally:
+        os.chdir(original_dir)
+        if not args.keep:
+            for filename in os.listdir(workdir):
+                os.remove(os.path.join(workdir, filename))
+            os.rmdir(workdir)
+            
+    print_table(["Satır", "Yöntem", "Süre", "Ek tepe bellek"], rows)
+    if not manager.has_pandas:
+        print("\nNot: pandas kurulu değil, mevcut yol ölçülemedi.")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,158 @@
+"""
+Çıkarıcı mikro benchmark'ı: tarayıcısız, HTML fikstürleri üzerinde
+
+utils.html_driver.HtmlDriver, fake_maps'in ürettiği detay paneli ve website
+sayfalarını bellekte yanıtlar. Her çıkarıcı için çağrı başına sürücü komutu
+(gerçek tarayıcıdaki gidiş-dönüş), çıkarıcının kendi işlemci süresi (sahte
+DOM'un arama/metin süresi düşülerek) ve verilen gidiş-dönüş gecikmesiyle
+tahmini duvar saati süresi raporlanır.
+
+"yedek" fikstürlerinde aria-label, data-item-id ve data-tooltip öznitelikleri
+kaldırılır; böylece çıkarıcıların yavaş yedek yolları da ölçülür.
+
+Kullanım:
+    python benchmarks/bench_extractors.py
+    python benchmarks/bench_extractors.py --cards 100 --repeat 200 --latency-ms 2 10
+    python benchmarks/bench_extractors.py --simulate-latency 5
+    python benchmarks/bench_extractors.py --snapshots snapshots.db
+"""
+import re
+import time
+import argparse
+import statistics
+
+from common import print_table
+from fake_maps import FakeMapsServer
+
+from core.extractors.phone_extractor import PhoneExtractor
+from core.extractors.address_extractor import AddressExtractor
+from core.extractors.business_extractor import BusinessInfoExtractor
+from core.extractors.email_extractor import EmailExtractor
+from core.snapshots import iter_snapshots
+from utils.html_driver import HtmlDriver, HtmlBrowser
+
+FALLBACK_PATTERN = re.compile(r' (?:aria-label|data-item-id|data-tooltip)="[^"]*"')
+
+# Snapshot sayfa türü -> fikstür adı
+SNAPSHOT_FIXTURES = {
+    "maps_detail": "maps paneli",
+    "website": "website ana sayfa",
+    "contact": "website iletişim",
+}
+
+def make_fixtures(cards):
+    """
+    Returns:
+        dict: Fikstür adı -> (HTML, URL)
+    """
+    fake = FakeMapsServer(businesses=max(cards, 12), page_size=cards, port=8765)
+    business = next(b for b in fake.businesses if b["email_page"] == "home")
+    contact = next(b for b in fake.businesses if b["email_page"] == "contact")
+    place_url = f"http://127.0.0.1:{fake.port}{fake.place_href(business)}"
+    panel_page = fake.search_html("kafe İstanbul", panel_business=business)
+    return {
+        "maps paneli": (panel_page, place_url),
+        "maps paneli (yedek)": (FALLBACK_PATTERN.sub("", panel_page), place_url),
+        "website ana sayfa": (fake.site_html(business, "/"), fake.website_url(business)),
+        "website iletişim": (fake.site_html(contact, "/iletisim"), fake.website_url(contact) + "iletisim"),
+    }
+
+def load_snapshot_fixtures(path):
+    """
+    Gerçek taramada kaydedilmiş sayfalardan fikstür oluşturur (her türün ilk sayfası)
+    
+    Returns:
+        dict: Fikstür adı -> (HTML, URL)
+    """
+    fixtures = {}
+    for _, kind, url, html in iter_snapshots(path):
+        name = SNAPSHOT_FIXTURES.get(kind)
+        if name and name not in fixtures:
+            fixtures[name] = (html, url)
+            if len(fixtures) == len(SNAPSHOT_FIXTURES):
+                break
+    if "maps paneli" in fixtures:
+        html, url = fixtures["maps paneli"]
+        fixtures["maps paneli (yedek)"] = (FALLBACK_PATTERN.sub("", html), url)
+    return fixtures
+
+def make_cases(browser):
+    """
+    Returns:
+        list: (çıkarıcı adı, fikstür adı, fonksiyon)
+    """
+    phone = PhoneExtractor(browser)
+    address = AddressExtractor(browser)
+    business = BusinessInfoExtractor(browser)
+    email = EmailExtractor(browser)
+    cases = []
+    for fixture in ("maps paneli", "maps paneli (yedek)"):
+        cases.append(("PhoneExtractor.extract_phone_number", fixture, phone.extract_phone_number))
+        cases.append(("AddressExtractor.extract_address", fixture, address.extract_address))
+        cases.append(("BusinessInfoExtractor._extract_business_name", fixture, business._extract_business_name))
+        cases.append(("BusinessInfoExtractor._extract_website_direct", fixture, business._extract_website_direct))
+    for fixture in ("website ana sayfa", "website iletişim"):
+        cases.append(("EmailExtractor._find_emails_on_page", fixture, email._find_emails_on_page))
+    cases.append(("EmailExtractor._find_contact_links", "website ana sayfa",
+                  lambda: email._find_contact_links(browser.driver.url)))
+    return cases
+
+def run_case(driver, func, repeat):
+    """
+    Fonksiyonu tekrar tekrar çalıştırır
+    
+    Returns:
+        tuple: (çağrı başına komut, çıkarıcı işlemci süresi medyanı sn, sahte DOM süresi medyanı sn,
+                duvar saati medyanı sn)
+    """
+    own, dom, wall = [], [], []
+    commands = 0
+    for _ in range(repeat):
+        driver.reset_commands()
+        started_cpu = time.process_time()
+        started_wall = time.perf_counter()
+        func()
+        wall.append(time.perf_counter() - started_wall)
+        total = time.process_time() - started_cpu
+        own.append(max(0.0, total - driver.busy_seconds))
+        dom.append(driver.busy_seconds)
+        commands = driver.command_count
+    return commands, statistics.median(own), statistics.median(dom), statistics.median(wall)
+
+def main():
+    parser = argparse.ArgumentParser(description="Çıkarıcı mikro benchmark'ı (HTML fikstürleri)")
+    parser.add_argument("--cards", type=int, default=40, help="Arama sayfasındaki kart sayısı (DOM boyutu)")
+    parser.add_argument("--repeat", type=int, default=100, help="Her ölçümün tekrar sayısı")
+    parser.add_argument("--latency-ms", type=float, nargs="+", default=[2, 10],
+                        help="Tahmini süre için komut başına gidiş-dönüş gecikmeleri")
+    parser.add_argument("--simulate-latency", type=float, default=0,
+                        help="Gecikmeyi sürücüde gerçekten beklet (ms); duvar saati süresi ölçülür")
+    parser.add_argument("--snapshots", metavar="DOSYA",
+                        help="Fikstürleri sahte sayfalar yerine snapshot veritabanından al (--snapshots ile kaydedilen)")
+    args = parser.parse_args()
+    
+    fixtures = load_snapshot_fixtures(args.snapshots) if args.snapshots else make_fixtures(args.cards)
+    driver = HtmlDriver(latency_ms=args.simulate_latency)
+    browser = HtmlBrowser(driver)
+    repeat = args.repeat if not args.simulate_latency else max(1, args.repeat // 20)
+    
+    rows = []
+    for name, fixture, func in make_cases(browser):
+        if fixture not in fixtures:
+            continue
+        driver.load(*fixtures[fixture])
+        commands, own, dom, wall = run_case(driver, func, repeat)
+        row = [name, fixture, commands, f"{own * 1e6:.0f} µs", f"{dom * 1e6:.0f} µs"]
+        row.extend(f"{(own + commands * latency / 1000) * 1000:.1f} ms" for latency in args.latency_ms)
+        if args.simulate_latency:
+            row.append(f"{wall * 1000:.1f} ms")
+        rows.append(row)
+        
+    headers = ["Çıkarıcı", "Fikstür", "Komut", "Python CPU", "Sahte DOM"]
+    headers.extend(f"@{latency:g} ms" for latency in args.latency_ms)
+    if args.simulate_latency:
+        headers.append(f"Ölçülen (@{args.simulate_latency:g} ms)")
+    print_table(headers, rows)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
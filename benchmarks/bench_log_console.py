@@ -0,0 +1,111 @@
+"""
+İşlem detayları konsolu benchmark'ı: mesaj başına ekleme ve tur başına toplu ekleme
+
+Bir üretici iş parçacığı kuyruğa saniyede belirli sayıda durum mesajı ekler;
+arayüz iş parçacığı kuyruğu her 100 ms'de boşaltır. Aynı anda 20 ms'lik bir
+kalp atışı zamanlayıcısı çalışır; gecikmesi, ana döngünün ne kadar süre
+bloklandığını (arayüzün donma süresini) gösterir.
+
+Ekran (DISPLAY) gerektirir.
+
+Kullanım:
+    python benchmarks/bench_log_console.py
+    python benchmarks/bench_log_console.py --rate 1000 5000 --seconds 10
+"""
+import time
+import queue
+import argparse
+import threading
+import tkinter as tk
+
+from common import print_table
+
+from ui.components import LogConsole
+
+HEARTBEAT_MS = 20
+POLL_MS = 100
+
+def produce(message_queue, rate, seconds):
+    """Saniyede rate mesajı 10 ms'lik gruplar halinde kuyruğa ekler"""
+    per_slice = max(1, rate // 100)
+    started = time.perf_counter()
+    sent = 0
+    while time.perf_counter() - started < seconds:
+        for _ in range(per_slice):
+            message_queue.put(("status", f"İşletme {sent} işleniyor: adres, telefon ve website alındı"))
+            sent += 1
+        time.sleep(0.01)
+    message_queue.put(("done", None))
+
+def run(root, mode, rate, seconds, max_lines):
+    """
+    Tek senaryoyu çalıştırır
+    
+    Returns:
+        tuple: (en büyük kalp atışı gecikmesi ms, ortalama gecikme ms, konsol satır sayısı)
+    """
+    console = LogConsole(root, max_lines=max_lines)
+    console.pack()
+    message_queue = queue.Queue()
+    delays = []
+    state = {"done": False, "expected": None}
+    
+    def heartbeat():
+        now = time.perf_counter()
+        if state["expected"] is not None:
+            delays.append((now - state["expected"]) * 1000)
+        state["expected"] = now + HEARTBEAT_MS / 1000
+        if not state["done"]:
+            root.after(HEARTBEAT_MS, heartbeat)
+            
+    def poll():
+        messages = []
+        try:
+            while True:
+                msg_type, msg = message_queue.get_nowait()
+                if msg_type == "done":
+                    state["done"] = True
+                elif mode == "mesaj başına":
+                    # Önceki davranış: her mesajda ekleme, sona kaydırma ve etiket güncellemesi
+                    console.configure(state='normal')
+                    console.insert(tk.END, f"{time.strftime('%H:%M:%S')} - {msg}\n")
+                    console.see(tk.END)
+                    console.configure(state='disabled')
+                else:
+                    messages.append(msg)
+        except queue.Empty:
+            pass
+        console.log_many(messages)
+        if state["done"]:
+            root.quit()
+        else:
+            root.after(POLL_MS, poll)
+            
+    threading.Thread(target=produce, args=(message_queue, rate, seconds), daemon=True).start()
+    root.after(HEARTBEAT_MS, heartbeat)
+    root.after(POLL_MS, poll)
+    root.mainloop()
+    
+    lines = int(console.index('end-1c').split('.')[0])
+    console.destroy()
+    return max(delays or [0]), sum(delays) / max(len(delays), 1), lines
+
+def main():
+    parser = argparse.ArgumentParser(description="Log konsolu benchmark'ı")
+    parser.add_argument("--rate", type=int, nargs="+", default=[1000, 5000], help="Saniyedeki mesaj sayısı")
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--max-lines", type=int, default=5000)
+    args = parser.parse_args()
+    
+    root = tk.Tk()
+    rows = []
+    for rate in args.rate:
+        for mode in ("mesaj başına", "tur başına toplu"):
+            worst, average, lines = run(root, mode, rate, args.seconds, args.max_lines)
+            rows.append((rate, mode, f"{worst:.0f} ms", f"{average:.1f} ms", lines))
+    root.destroy()
+    
+    print_table(["Mesaj/sn", "Yöntem", "En büyük gecikme", "Ortalama gecikme", "Konsol satırı"], rows)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
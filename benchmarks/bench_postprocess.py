@@ -0,0 +1,86 @@
+"""
+Son işleme benchmark'ı: kayıt kayıt normalleştirme ve pandas ile vektörel normalleştirme
+
+Sentetik kayıtlara farklı telefon yazımları, izleme parametreli / büyük harfli
+URL'ler ve tekrar eden büyük harfli e-postalar eklenir. Her iki yol aynı
+kayıtların kopyaları üzerinde çalıştırılır ve sonuçların aynı olduğu doğrulanır.
+Ayrıca e-posta doğrulamasında desenin her çağrıda derlenmesi ile önceden
+derlenmiş desen karşılaştırılır.
+
+Kullanım:
+    python benchmarks/bench_postprocess.py
+    python benchmarks/bench_postprocess.py --rows 10000 100000
+"""
+import re
+import copy
+import time
+import random
+import argparse
+
+from common import make_businesses, print_table
+
+from core.postprocess import PostProcessor
+from utils.validators import is_valid_email
+
+PHONE_FORMATS = ["0(216) {a} {b} {c}", "+90 216 {a} {b} {c}", "216{a}{b}{c}", "0090 216 {a}-{b}-{c}"]
+
+def make_messy_records(count, seed=11):
+    """Gerçek taramalarda görülen biçim farklılıklarını içeren kayıtlar üretir"""
+    rng = random.Random(seed)
+    records = make_businesses(count, seed)
+    for record in records:
+        record.phone = rng.choice(PHONE_FORMATS).format(
+            a=rng.randint(200, 999), b=rng.randint(10, 99), c=rng.randint(10, 99)
+        )
+        if rng.random() < 0.3:
+            record.website = record.website.upper().rstrip('/') + "/?utm_source=google&ref=maps"
+        if record.emails:
+            record.emails = record.emails + [record.emails[0].upper(), "gecersiz@adres"]
+    return records
+
+def legacy_is_valid_email(email):
+    """Desenin her çağrıda derlendiği önceki doğrulama"""
+    pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+    return bool(pattern.match(email))
+
+def time_call(func, *args):
+    started = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - started
+
+def snapshot(records):
+    return [(r.phone, r.website, r.domain, tuple(r.emails)) for r in records]
+
+def main():
+    parser = argparse.ArgumentParser(description="Son işleme benchmark'ı")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+    
+    python_engine = PostProcessor(use_pandas=False)
+    pandas_engine = PostProcessor(use_pandas=True)
+    
+    rows = []
+    for count in args.rows:
+        records = make_messy_records(count)
+        by_record = copy.deepcopy(records)
+        elapsed = time_call(python_engine.process, by_record)
+        rows.append((count, "kayıt kayıt (python)", f"{elapsed:.2f} sn", "-"))
+        
+        if pandas_engine.has_pandas:
+            vectorized = copy.deepcopy(records)
+            elapsed = time_call(pandas_engine.process, vectorized)
+            same = "evet" if snapshot(vectorized) == snapshot(by_record) else "HAYIR"
+            rows.append((count, "vektörel (pandas)", f"{elapsed:.2f} sn", same))
+            
+        emails = [email for record in records for email in record.emails]
+        for name, func in (("is_valid_email (her çağrıda derleme)", legacy_is_valid_email),
+                           ("is_valid_email (önceden derlenmiş)", is_valid_email)):
+            elapsed = time_call(lambda: [func(email) for email in emails])
+            rows.append((count, name, f"{elapsed:.2f} sn", "-"))
+            
+    print_table(["Kayıt", "Yöntem", "Süre", "Aynı sonuç"], rows)
+    if not pandas_engine.has_pandas:
+        print("\nNot: pandas kurulu değil, vektörel yol ölçülemedi.")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+Kayıt başına bellek karşılaştırması: eski sözlük biçimi ve BusinessRecord
+
+Aynı sentetik işletmeler bir kez eski biçimde (yerelleştirilmiş anahtarlı,
+"Bulunamadı" yer tutuculu, e-postaları birleştirilmiş sözlük), bir kez de
+BusinessRecord olarak bellekte tutulur. Her iki biçim de aynı alanları taşır
+(kimlik ve koordinat dahil). Her biri için tracemalloc ile kalıcı bellek
+ölçülür ve kayıt başına bayt hesaplanır.
+
+Kullanım:
+    python benchmarks/bench_records.py
+    python benchmarks/bench_records.py --rows 100000
+"""
+import gc
+import argparse
+import tracemalloc
+
+from common import make_businesses, print_table
+
+def to_legacy(record):
+    """Kaydı uygulamanın önceden ürettiği sözlük biçimine çevirir"""
+    return record.to_row()
+
+def retained_bytes(build):
+    """
+    Oluşturulan nesnelerin bellekte kalan boyutunu ölçer
+    
+    Returns:
+        tuple: (nesneler, bayt)
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return objects, after - before
+
+def main():
+    parser = argparse.ArgumentParser(description="Kayıt belleği benchmark'ı")
+    parser.add_argument("--rows", type=int, default=50000)
+    args = parser.parse_args()
+    
+    # Kaynak kayıtlar ölçümden önce hazırlanır; her iki biçim de kendi kopyasını üretir
+    source = make_businesses(args.rows)
+    
+    legacy, legacy_bytes = retained_bytes(lambda: [to_legacy(record) for record in source])
+    del legacy
+    records, record_bytes = retained_bytes(
+        lambda: [record.__class__.coerce(to_legacy(record)) for record in source]
+    )
+    del records
+    
+    rows = [
+        ("dict (eski biçim)", f"{legacy_bytes / args.rows:.0f} B", f"{legacy_bytes / 1048576:.1f} MB"),
+        ("BusinessRecord", f"{record_bytes / args.rows:.0f} B", f"{record_bytes / 1048576:.1f} MB"),
+    ]
+    print_table(["Biçim", "Kayıt başına", f"Toplam ({args.rows} kayıt)"], rows)
+    print(f"\nKazanç: %{100 * (1 - record_bytes / legacy_bytes):.1f}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""
+Benchmark betikleri için ortak yardımcılar
+"""
+import os
+import sys
+import time
+import random
+import tracemalloc
+
+# Betikler depo kökünden bağımsız çalıştırılabilsin
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.models import BusinessRecord
+
+DISTRICTS = ["Kadıköy", "Beşiktaş", "Şişli", "Üsküdar", "Bakırköy", "Çankaya", "Konak", "Nilüfer"]
+WORDS = ["Kafe", "Diş", "Kliniği", "Restoran", "Oto", "Yıkama", "Kuaför", "Eczane", "Market", "Ajans",
+         "Hukuk", "Bürosu", "Veteriner", "Pastane", "Mimarlık", "Yazılım", "Fırın", "Optik"]
+
+def make_business(index, rng=None):
+    """
+    Gerçekçi alanlara sahip sentetik bir işletme kaydı üretir
+    
+    Args:
+        index: Kayıt sırası (benzersiz değerler için)
+        rng: random.Random nesnesi
+        
+    Returns:
+        BusinessRecord: Uygulamanın ürettiği biçimde işletme kaydı
+    """
+    rng = rng or random
+    name = " ".join(rng.sample(WORDS, 2)) + f" {index}"
+    district = rng.choice(DISTRICTS)
+    domain = f"isletme{index}.com.tr"
+    return BusinessRecord(
+        detail_url=f"https://www.google.com/maps/place/{name.replace(' ', '+')}/@41.0{index % 1000:03d},28.9{index % 997:03d},17z/data=!3m1!4b1!4m6!3m5!1s0x14cab{index:09x}:0x{index * 7919:x}!8m2!3d41.0{index % 1000:03d}!4d28.9{index % 997:03d}",
+        name=name,
+        address=f"Caferağa, Moda Cd. No:{index % 300}, 34710 {district}/İstanbul",
+        phone=f"0(216) {rng.randint(200, 999)} {rng.randint(10, 99)} {rng.randint(10, 99)}",
+        website=f"https://www.{domain}/",
+        emails=[f"info@{domain}", f"satis@{domain}"] if index % 3 else None,
+    )
+
+def make_businesses(count, seed=42):
+    """Belirli sayıda sentetik işletme kaydı üretir"""
+    rng = random.Random(seed)
+    return [make_business(i, rng) for i in range(count)]
+
+def measure(func, *args, **kwargs):
+    """
+    Fonksiyonun duvar saati süresini ve ek tepe bellek kullanımını ölçer
+    
+    Returns:
+        tuple: (dönüş değeri, süre saniye, tepe bellek MB)
+    """
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    started = time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result, elapsed, peak / (1024 * 1024)
+
+def print_table(headers, rows):
+    """Sonuçları hizalı tablo olarak yazdırır"""
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(str(c).ljust(w) for c, w in zip(row, widths)))
\ No newline at end of file
@@ -0,0 +1,354 @@
+"""
+Uçtan uca benchmark için yerel sahte Google Maps ve işletme websiteleri
+
+Tek bir HTTP sunucusu iki rolü birden üstlenir:
+- 127.0.0.1:<port>/maps/...: CSS_SELECTORS'taki sınıf adlarını kullanan arama
+  sayfası (sonsuz kaydırmalı liste), tıklanınca adresi /maps/place/... olan
+  detay paneli ve doğrudan açılan detay sayfası (ön yükleme sekmeleri için)
+- isletme<N>.localhost:<port>: işletme websiteleri; e-posta ana sayfada,
+  yalnızca iletişim sayfasında veya hiç bulunmaz. Chrome *.localhost adlarını
+  yerel adrese çözdüğünden DNS veya ağ erişimi gerekmez.
+
+Gecikme ve hata oranı ayarlanabilir; hatalı istekler 503 döner.
+
+Elle incelemek için:
+    python benchmarks/fake_maps.py --port 8765
+    (tarayıcıda http://127.0.0.1:8765/maps/search/kafe+İstanbul)
+"""
+import re
+import html
+import json
+import time
+import random
+import argparse
+import threading
+from urllib.parse import urlsplit, parse_qs, quote, unquote
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from common import make_businesses
+
+SITE_HOST_PATTERN = re.compile(r'^isletme(\d+)\.localhost$')
+PLACE_ID_PATTERN = re.compile(r'!1s(0x[0-9a-f]+:0x[0-9a-f]+)')
+
+# Arama sayfası: liste ve detay paneli tek belgede (gerçek Maps gibi adres pushState ile değişir)
+SEARCH_PAGE = """<!DOCTYPE html>
+<html lang="tr"><head><meta charset="utf-8"><title>{query} - Google Haritalar</title>
+<style>
+body {{ margin: 0; font-family: sans-serif; display: flex; }}
+div.ecceSd {{ width: 420px; height: 100vh; overflow-y: auto; }}
+div.Nv2PK {{ position: relative; height: 96px; border-bottom: 1px solid #ddd; padding: 8px; cursor: pointer; }}
+a.hfpxzc {{ position: absolute; inset: 0; }}
+#panel {{ flex: 1; padding: 16px; }}
+</style></head>
+<body>
+<div class="ecceSd" role="feed" aria-label="{query} için sonuçlar">{cards}</div>
+<div id="panel" role="main"></div>
+<script>
+var feed = document.querySelector('div[role=feed]');
+var panel = document.getElementById('panel');
+var searchUrl = location.href;
+var loading = false, finished = false;
+function loadMore() {{
+  if (loading || finished) return;
+  loading = true;
+  var offset = feed.querySelectorAll('div.Nv2PK').length;
+  fetch('/maps/api/feed?offset=' + offset)
+    .then(function (r) {{ if (!r.ok) throw new Error(r.status); return r.text(); }})
+    .then(function (text) {{
+      if (!text.trim()) {{ finished = true; return; }}
+      feed.insertAdjacentHTML('beforeend', text);
+    }})
+    .catch(function () {{}})
+    .then(function () {{ loading = false; }});
+}}
+feed.addEventListener('scroll', function () {{
+  if (feed.scrollTop + feed.clientHeight >= feed.scrollHeight - 300) loadMore();
+}});
+feed.addEventListener('click', function (e) {{
+  var card = e.target.closest('div.Nv2PK');
+  if (!card) return;
+  e.preventDefault();
+  var href = card.querySelector('a.hfpxzc').getAttribute('href');
+  fetch('/maps/api/place?path=' + encodeURIComponent(href))
+    .then(function (r) {{ if (!r.ok) throw new Error(r.status); return r.text(); }})
+    .then(function (text) {{
+      panel.innerHTML = text;
+      history.pushState({{}}, '', href);
+    }})
+    .catch(function () {{}});
+}});
+document.addEventListener('keydown', function (e) {{
+  if (e.key === 'Escape' && panel.innerHTML) {{
+    panel.innerHTML = '';
+    history.pushState({{}}, '', searchUrl);
+  }}
+}});
+</script>
+</body></html>"""
+
+PLACE_PAGE = """<!DOCTYPE html>
+<html lang="tr"><head><meta charset="utf-8"><title>{name} - Google Haritalar</title></head>
+<body><div id="panel" role="main">{panel}</div></body></html>"""
+
+SITE_PAGE = """<!DOCTYPE html>
+<html lang="tr"><head><meta charset="utf-8"><title>{title}</title></head>
+<body>
+<nav><a href="/">Ana Sayfa</a> <a href="/hakkimizda">Hakkımızda</a> <a href="/iletisim">İletişim</a></nav>
+<h1>{name}</h1>
+<p>{text}</p>
+<footer>{footer}</footer>
+</body></html>"""
+
+class FakeMapsServer:
+    """
+    Sahte Maps ve işletme websitelerini sunan yerel HTTP sunucusu
+    
+    İşletmeler common.make_businesses ile belirli bir tohumdan üretilir; her
+    işletmenin websitesi olup olmadığı ve e-postasının nerede durduğu da aynı
+    tohumla seçildiğinden sonuçlar beklenen değerlerle karşılaştırılabilir.
+    """
+    def __init__(self, businesses=100, page_size=10, latency_ms=50, jitter_ms=20, failure_rate=0.0,
+                 website_ratio=0.8, seed=42, port=0):
+        """
+        Args:
+            businesses: Aramada bulunan toplam işletme sayısı
+            page_size: Sayfa açılışında ve her kaydırmada yüklenen kart sayısı
+            latency_ms: Her isteğe eklenen ortalama gecikme
+            jitter_ms: Gecikmeye eklenen rastgele sapma (±)
+            failure_rate: Liste, detay ve website isteklerinin 503 dönme olasılığı
+            website_ratio: Websitesi olan işletme oranı
+            seed: Veri ve hata üretimi için tohum
+            port: Dinlenecek port (0 = start() sırasında boş port seçilir)
+        """
+        self.page_size = page_size
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+        
+        layout = random.Random(seed + 1)
+        self.businesses = []
+        for index, record in enumerate(make_businesses(businesses, seed=seed)):
+            has_website = layout.random() < website_ratio
+            # E-posta yeri: ana sayfa altbilgisi, yalnızca iletişim sayfası veya yok
+            email_page = layout.choice(("home", "contact", "contact", None)) if has_website else None
+            self.businesses.append({
+                "index": index,
+                "record": record,
+                "place_id": f"0x14cab{index:09x}:0x{index * 7919:x}",
+                "has_website": has_website,
+                "email_page": email_page if record.emails else None,
+            })
+        self.by_place_id = {business["place_id"]: business for business in self.businesses}
+        
+        # Sunucu start() ile açılır; başlatılmadan yalnızca HTML üretmek için de kullanılabilir
+        self.port = port
+        self.httpd = None
+        self.thread = None
+        
+    @property
+    def search_base_url(self):
+        """MAPS_CONFIG["base_url"] yerine kullanılacak arama adresi"""
+        return f"http://127.0.0.1:{self.port}/maps/search/"
+        
+    def website_url(self, business):
+        return f"http://isletme{business['index']}.localhost:{self.port}/"
+        
+    def expected(self, business):
+        """
+        Kazıyıcının bu işletme için bulması beklenen değerler
+        
+        Returns:
+            dict: name, phone, address, website, emails
+        """
+        record = business["record"]
+        return {
+            "name": record.name,
+            "phone": record.phone,
+            "address": record.address,
+            "website": self.website_url(business) if business["has_website"] else None,
+            "emails": list(record.emails) if business["email_page"] else [],
+        }
+        
+    def start(self):
+        """Sunucuyu arka plan iş parçacığında başlatır"""
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", self.port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.fake = self
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="fake-maps", daemon=True)
+        self.thread.start()
+        return self
+        
+    def stop(self):
+        if self.httpd is None:
+            return
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        
+    # --- Gecikme ve hata ---
+    
+    def delay(self):
+        with self.rng_lock:
+            self.requests += 1
+            jitter = self.rng.uniform(-self.jitter_ms, self.jitter_ms)
+        seconds = max(0.0, self.latency_ms + jitter) / 1000
+        if seconds:
+            time.sleep(seconds)
+            
+    def should_fail(self):
+        if not self.failure_rate:
+            return False
+        with self.rng_lock:
+            failed = self.rng.random() < self.failure_rate
+            if failed:
+                self.failures += 1
+        return failed
+        
+    # --- HTML ---
+    
+    def place_href(self, business):
+        record = business["record"]
+        return f"/maps/place/{quote(record.name.replace(' ', '+'), safe='+')}/data=!4m2!3m1!1s{business['place_id']}"
+        
+    def card_html(self, business):
+        record = business["record"]
+        name = html.escape(record.name)
+        return (
+            f'<div class="Nv2PK" data-result-index="{business["index"]}" jsaction="mouseover:pane.wfvdle">'
+            f'<a class="hfpxzc" aria-label="{name}" href="{self.place_href(business)}"></a>'
+            f'<div class="qBF1Pd fontHeadlineSmall">{name}</div>'
+            f'<span class="MW4etd">4,{business["index"] % 10}</span>'
+            f'</div>'
+        )
+        
+    def search_html(self, query, panel_business=None):
+        """Arama sayfası; panel_business verilirse detay paneli açık haliyle"""
+        page = SEARCH_PAGE.format(query=html.escape(query), cards=self.cards_html(0))
+        if panel_business is not None:
+            page = page.replace('<div id="panel" role="main"></div>',
+                                f'<div id="panel" role="main">{self.panel_html(panel_business)}</div>')
+        return page
+        
+    def cards_html(self, offset):
+        return "".join(self.card_html(business) for business in self.businesses[offset:offset + self.page_size])
+        
+    def panel_html(self, business):
+        record = business["record"]
+        name = html.escape(record.name)
+        address = html.escape(record.address)
+        phone = html.escape(record.phone)
+        digits = re.sub(r'\D', '', record.phone)
+        parts = [
+            '<div class="m6QErb" role="region">',
+            f'<h1 class="DUwDvf lfPIob">{name}</h1>',
+            f'<button class="CsEnBe" data-item-id="address" data-tooltip="Adresi kopyala" '
+            f'aria-label="Adres: {address}"><div class="Io6YTe">{address}</div></button>',
+        ]
+        if business["has_website"]:
+            url = self.website_url(business)
+            parts.append(f'<a class="CsEnBe" data-item-id="authority" data-tooltip="Web sitesi" '
+                         f'aria-label="Web sitesi: {url}" href="{url}"><div class="Io6YTe">'
+                         f'isletme{business["index"]}.localhost</div></a>')
+        parts.append(f'<button class="CsEnBe" data-item-id="phone:tel:{digits}" '
+                     f'data-tooltip="Telefon numarasını kopyala" aria-label="Telefon: {phone}">'
+                     f'<div class="Io6YTe">{phone}</div></button>')
+        parts.append('</div>')
+        return "".join(parts)
+        
+    def site_html(self, business, path):
+        record = business["record"]
+        name = html.escape(record.name)
+        emails = record.emails or []
+        mailto = " ".join(f'<a href="mailto:{email}">{email}</a>' for email in emails)
+        if path in ("/", ""):
+            footer = mailto if business["email_page"] == "home" else "Tüm hakları saklıdır."
+            return SITE_PAGE.format(title=name, name=name, text="Hizmetlerimiz hakkında bilgi.", footer=footer)
+        if path.rstrip("/") == "/iletisim":
+            text = f"Adres: {html.escape(record.address)} Telefon: {html.escape(record.phone)}"
+            footer = mailto if business["email_page"] else ""
+            return SITE_PAGE.format(title=f"İletişim - {name}", name="İletişim", text=text, footer=footer)
+        if path.rstrip("/") == "/hakkimizda":
+            return SITE_PAGE.format(title=f"Hakkımızda - {name}", name="Hakkımızda",
+                                    text="1998'den beri hizmetinizdeyiz.", footer="")
+        return None
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    
+    def log_message(self, format, *args):
+        pass
+        
+    def _send(self, status, body="", content_type="text/html; charset=utf-8"):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(data)
+        
+    def do_GET(self):
+        fake = self.server.fake
+        fake.delay()
+        parts = urlsplit(self.path)
+        host = (self.headers.get("Host") or "").split(":")[0].lower()
+        
+        site = SITE_HOST_PATTERN.match(host)
+        if site:
+            index = int(site.group(1))
+            if index >= len(fake.businesses) or not fake.businesses[index]["has_website"]:
+                return self._send(404, "Bulunamadı")
+            if fake.should_fail():
+                return self._send(503, "Servis kullanılamıyor")
+            page = fake.site_html(fake.businesses[index], parts.path)
+            return self._send(200, page) if page else self._send(404, "Bulunamadı")
+            
+        path = parts.path
+        if path.startswith("/maps/search/"):
+            query = unquote(path[len("/maps/search/"):]).replace("+", " ")
+            return self._send(200, fake.search_html(query))
+        if path == "/maps/api/feed":
+            if fake.should_fail():
+                return self._send(503, "")
+            offset = int(parse_qs(parts.query).get("offset", ["0"])[0])
+            return self._send(200, fake.cards_html(offset))
+        if path == "/maps/api/place" or path.startswith("/maps/place/"):
+            source = parse_qs(parts.query).get("path", [""])[0] if path == "/maps/api/place" else path
+            match = PLACE_ID_PATTERN.search(source)
+            business = fake.by_place_id.get(match.group(1)) if match else None
+            if business is None:
+                return self._send(404, "Bulunamadı")
+            if fake.should_fail():
+                return self._send(503, "")
+            panel = fake.panel_html(business)
+            if path == "/maps/api/place":
+                return self._send(200, panel)
+            return self._send(200, PLACE_PAGE.format(name=html.escape(business["record"].name), panel=panel))
+        if path == "/maps/api/stats":
+            return self._send(200, json.dumps({"requests": fake.requests, "failures": fake.failures}),
+                              "application/json")
+        return self._send(404, "Bulunamadı")
+
+def main():
+    parser = argparse.ArgumentParser(description="Sahte Google Maps sunucusu")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--businesses", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    
+    server = FakeMapsServer(businesses=args.businesses, latency_ms=args.latency_ms,
+                            failure_rate=args.failure_rate, port=args.port).start()
+    print(f"Arama sayfası: {server.search_base_url}kafe+İstanbul (Ctrl+C ile durdurun)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -3,28 +3,110 @@ Tarayıcı yönetimi sınıfı
 """
 import time
 import random
+import threading
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, NoSuchElementException
 
-from .config import BROWSER_CONFIG, CSS_SELECTORS
+from .config import BROWSER_CONFIG, CSS_SELECTORS, DENSITY_CONFIG, PAGE_METRICS_CONFIG
+from . import driver_service
+from .retry import call_with_retry, get_policy
+from .cancellation import CancellationToken, OperationCancelled
+from .tracing import tracer
+from .command_tracer import command_tracer
+from .page_metrics import page_metrics_stats, collect_page_metrics, enable_performance_domain
+from .snapshots import snapshot_recorder
+from .metrics import BROWSER_RESTARTS
+from utils import process_memory
+
+# Tıklama yöntemleri (varsayılan deneme sırası)
+CLICK_STRATEGIES = ("actions", "js", "native")
+
+# Tıklaması yeni pencere açan öğeler: tıklama gönderildikten sonra doğrulanamasa da
+# tekrar tıklanmaz (her tıklama ayrı bir pencere açardı)
+WINDOW_OPENING_CLICKS = frozenset(("website_button",))
+
+# Geri dönüş yöntemleri (varsayılan deneme sırası)
+BACK_METHODS = ("button", "history", "driver")
+
+class ClickStrategyStats:
+    """
+    Sayfa türü bazında tıklama yöntemlerinin başarı istatistiklerini tutan sınıf
+    """
+    def __init__(self):
+        self.stats = {}  # (sayfa türü, yöntem) -> [başarı, deneme]
+        
+    def record(self, page_type, strategy, success):
+        """
+        Bir tıklama denemesinin sonucunu kaydeder
+        
+        Args:
+            page_type: Sayfa/öğe türü
+            strategy: Kullanılan yöntem
+            success: Deneme başarılı mı
+        """
+        entry = self.stats.setdefault((page_type, strategy), [0, 0])
+        entry[1] += 1
+        if success:
+            entry[0] += 1
+            
+    def success_rate(self, page_type, strategy):
+        """Yöntemin bu sayfa türündeki (yumuşatılmış) başarı oranı"""
+        successes, attempts = self.stats.get((page_type, strategy), (0, 0))
+        return (successes + 1) / (attempts + 2)
+        
+    def ordered(self, page_type, strategies):
+        """
+        Yöntemleri başarı oranına göre sıralar (eşitlikte varsayılan sıra korunur)
+        
+        Args:
+            page_type: Sayfa/öğe türü
+            strategies: Varsayılan sıradaki yöntemler
+            
+        Returns:
+            list: En başarılı yöntem önce olacak şekilde sıralı liste
+        """
+        return sorted(strategies, key=lambda strategy: -self.success_rate(page_type, strategy))
 
 class BrowserManager:
     """
     Tarayıcı işlemlerini yöneten sınıf
     """
-    def __init__(self, update_status_callback=None):
+    def __init__(self, update_status_callback=None, cancel_token=None):
         """
         Tarayıcı yöneticisini başlat
         
         Args:
             update_status_callback: Durum güncellemesi yapacak callback fonksiyonu
+            cancel_token: Beklemeleri ve sayfa yüklemelerini kesen iptal belirteci
+                (None = iptal edilmeyen yeni belirteç)
         """
         self.driver = None
+        self.cancel_token = cancel_token or CancellationToken()
+        self.navigation_thread = None  # Süren (veya iptalde yarım bırakılan) sayfa yüklemesi
+        self.service = None         # Oturumun bağlı olduğu chromedriver servisi
+        self.startup_seconds = 0.0  # Son tarayıcı başlatma süresi
         self.update_status = update_status_callback or (lambda msg: None)
+        self.browser_pid = None     # Chrome ana sürecinin kimliği (bellek takibi için)
+        self.last_rss_mb = 0.0      # Son ölçülen süreç ağacı belleği
+        self.peak_rss_mb = 0.0      # Oturum boyunca ölçülen en yüksek bellek
+        self.recycle_count = 0      # Bellek sınırı nedeniyle yeniden başlatma sayısı
+        self.sleep_seconds = 0.0    # sleep() ile beklenen toplam süre (çalıştırma geçmişi için)
+        self.click_stats = ClickStrategyStats()  # Sayfa türü bazında tıklama yöntemi istatistikleri
+        self.cdp_performance = False  # DevTools Performance alanı açık mı
+        self.cdp_error = None         # Açılamadıysa nedeni
+        
+    def is_density_mode(self):
+        """Düşük bellek profili açık mı kontrol et"""
+        return DENSITY_CONFIG.get('enabled', False)
+        
+    def get_memory_limit_mb(self):
+        """Geçerli profile göre tarayıcı bellek sınırını döndür (0 = sınırsız)"""
+        if self.is_density_mode():
+            return DENSITY_CONFIG.get('max_rss_mb', 0)
+        return BROWSER_CONFIG.get('max_rss_mb', 0)
         
     def initialize(self):
         """
@@ -35,20 +117,39 @@ class BrowserManager:
             
         # Chrome seçeneklerini ayarla
         options = webdriver.ChromeOptions()
+        window_size = DENSITY_CONFIG['window_size'] if self.is_density_mode() else BROWSER_CONFIG['window_size']
         options.add_argument(f"user-agent={BROWSER_CONFIG['user_agent']}")
-        options.add_argument(f"window-size={BROWSER_CONFIG['window_size'][0]},{BROWSER_CONFIG['window_size'][1]}")
+        options.add_argument(f"window-size={window_size[0]},{window_size[1]}")
         options.add_argument('--disable-blink-features=AutomationControlled')
         options.add_experimental_option('excludeSwitches', ['enable-automation'])
         options.add_experimental_option('useAutomationExtension', False)
         options.add_argument('--disable-notifications')
         options.add_argument('--log-level=3')
         
+        # Düşük bellek profili: headless-new, sınırlı renderer ve kapalı arka plan servisleri
+        if self.is_density_mode():
+            options.add_argument('--headless=new')
+            options.add_argument(f"--renderer-process-limit={DENSITY_CONFIG['renderer_process_limit']}")
+            options.add_argument(f"--disk-cache-size={DENSITY_CONFIG['disk_cache_mb'] * 1024 * 1024}")
+            for argument in DENSITY_CONFIG['arguments']:
+                options.add_argument(argument)
         # Headless mod gerekirse ekle
-        if BROWSER_CONFIG['headless']:
+        elif BROWSER_CONFIG['headless']:
             options.add_argument('--headless')
         
-        # Chrome tarayıcıyı başlat
-        self.driver = webdriver.Chrome(options=options)
+        # Chrome tarayıcıyı başlat (önbelleklenmiş sürücü yolu ve paylaşılan servis ile)
+        self.driver, self.service, self.startup_seconds = driver_service.create_driver(options)
+        
+        # Komut izleme açıksa her WebDriver komutu sayılır
+        command_tracer.attach(self.driver)
+        
+        # Sayfa ölçümleri açıksa DevTools Performance alanını aç
+        self.cdp_performance = False
+        self.cdp_error = None
+        if page_metrics_stats.enabled and PAGE_METRICS_CONFIG['use_cdp']:
+            self.cdp_error = enable_performance_domain(self.driver)
+            self.cdp_performance = self.cdp_error is None
+            self._report_cdp_error(self.cdp_error)
         
         # Timeout ayarları
         self.driver.set_page_load_timeout(BROWSER_CONFIG['timeout'])
@@ -56,20 +157,107 @@ class BrowserManager:
         # Bot tespitini engelle
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
-        self.update_status("Tarayıcı başlatıldı")
+        # Bellek takibi için Chrome ana sürecini bul
+        self.browser_pid = self._find_browser_pid()
+        
+        self.update_status(f"Tarayıcı başlatıldı ({self.startup_seconds:.1f} sn)")
         return self.driver
     
+    def _find_browser_pid(self):
+        """
+        Bu oturuma ait Chrome ana sürecini bulur
+        
+        Returns:
+            int: Süreç kimliği, bulunamazsa chromedriver süreci veya None
+        """
+        try:
+            driver_pid = self.service.process.pid
+        except Exception:
+            return None
+            
+        try:
+            user_data_dir = self.driver.capabilities.get('chrome', {}).get('userDataDir')
+            browser_pid = process_memory.find_process_by_marker(driver_pid, user_data_dir)
+            if browser_pid:
+                return browser_pid
+        except Exception:
+            pass
+            
+        # Chrome süreci ayırt edilemezse chromedriver ağacının tamamını ölç
+        return driver_pid
+    
+    def get_memory_usage_mb(self):
+        """
+        Chrome süreç ağacının toplam RSS değerini ölçer
+        
+        Returns:
+            float: MB cinsinden bellek kullanımı (ölçülemezse 0)
+        """
+        if not self.driver or not self.browser_pid:
+            return 0.0
+            
+        rss_mb = process_memory.get_tree_rss(self.browser_pid) / (1024 * 1024)
+        self.last_rss_mb = rss_mb
+        self.peak_rss_mb = max(self.peak_rss_mb, rss_mb)
+        return rss_mb
+    
+    def check_memory(self):
+        """
+        Tarayıcı belleğini ölçer, loglar ve sınırın aşılıp aşılmadığını bildirir
+        
+        Ölçüm her sayfadan sonra yapılır; sınır (max_rss_mb) yalnızca tarayıcının
+        yeniden başlatılıp başlatılmayacağını belirler (0 = yeniden başlatma yok).
+        
+        Returns:
+            bool: Bellek sınırı aşıldıysa (tarayıcı yeniden başlatılmalıysa) True
+        """
+        rss_mb = self.get_memory_usage_mb()
+        if not rss_mb:
+            return False
+            
+        self.update_status(f"Tarayıcı belleği: {rss_mb:.0f} MB (en yüksek: {self.peak_rss_mb:.0f} MB)")
+        
+        limit_mb = self.get_memory_limit_mb()
+        if limit_mb and rss_mb > limit_mb:
+            self.update_status(f"Tarayıcı bellek sınırını aştı ({rss_mb:.0f} MB > {limit_mb} MB)")
+            return True
+        return False
+    
+    def recycle(self):
+        """
+        Tarayıcıyı kapatıp yeniden başlatır (bellek sınırı aşıldığında)
+        
+        Returns:
+            WebDriver: Yeni tarayıcı sürücüsü
+        """
+        self.update_status("Tarayıcı bellek nedeniyle yeniden başlatılıyor...")
+        with tracer.span("browser.recycle"):
+            self.close()
+            self.recycle_count += 1
+            BROWSER_RESTARTS.inc()
+            return self.initialize()
+    
     def close(self):
         """
         Tarayıcıyı kapat
+        
+        İptal nedeniyle yarım bırakılan bir sayfa yüklemesi sürüyorsa chromedriver
+        quit komutunu yükleme bitene kadar bekletir; bu durumda kapatma arka planda
+        yapılır ve çağıran taraf beklemez.
         """
         if self.driver:
             try:
-                self.driver.quit()
-            except:
+                if self.is_navigating():
+                    threading.Thread(target=self._quit_quietly, args=(self.driver,),
+                                     name="browser-quit", daemon=True).start()
+                else:
+                    self.driver.quit()
+            except Exception:
                 pass
             finally:
                 self.driver = None
+                self.service = None
+                self.browser_pid = None
                 
     def random_sleep(self, min_time=None, max_time=None):
         """
@@ -77,7 +265,170 @@ class BrowserManager:
         """
         min_time = min_time or BROWSER_CONFIG['sleep_min']
         max_time = max_time or BROWSER_CONFIG['sleep_max']
-        time.sleep(random.uniform(min_time, max_time))
+        with tracer.span("sleep"):
+            self.sleep(random.uniform(min_time, max_time) * BROWSER_CONFIG.get('sleep_scale', 1.0))
+        
+    def sleep(self, seconds):
+        """
+        İptal edilebilir bekleme (time.sleep yerine)
+        
+        Raises:
+            OperationCancelled: Bekleme sırasında iptal istenirse (hemen)
+        """
+        started = time.perf_counter()
+        try:
+            self.cancel_token.sleep(seconds)
+        finally:
+            # İptalde istenen değil, gerçekten beklenen süre sayılır
+            self.sleep_seconds += time.perf_counter() - started
+        
+    @staticmethod
+    def _quit_quietly(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+            
+    def is_navigating(self):
+        """Bir sayfa yüklemesi hâlâ sürüyor mu"""
+        return self.navigation_thread is not None and self.navigation_thread.is_alive()
+        
+    def get(self, url):
+        """
+        URL'yi iptal edilebilir şekilde yükler (driver.get yerine)
+        
+        Args:
+            url: Yüklenecek URL
+            
+        Raises:
+            OperationCancelled: Yükleme sırasında iptal istenirse (yükleme bitmeden)
+        """
+        with tracer.span("browser.page_load", url=url):
+            self._navigate(self.driver.get, url)
+        
+    def refresh(self):
+        """Sayfayı iptal edilebilir şekilde yeniler (driver.refresh yerine)"""
+        with tracer.span("browser.refresh"):
+            self._navigate(self.driver.refresh)
+        
+    def _navigate(self, action, *args):
+        """
+        Sayfa yükleme komutunu yardımcı iş parçacığında çalıştırıp iptali dinler
+        
+        chromedriver bir oturumun komutlarını sırayla işler; yükleme sürerken
+        gönderilen window.stop() gibi komutlar da yüklemenin bitmesini bekler.
+        Bu yüzden yükleme kesilmez, bırakılır: iptalde çağıran taraf hemen
+        OperationCancelled alır, yükleme (en fazla sayfa zaman aşımı kadar)
+        arka planda tamamlanır ve close() onu beklemez.
+        """
+        self.cancel_token.raise_if_cancelled()
+        done = threading.Event()
+        outcome = {}
+        
+        def navigate():
+            try:
+                action(*args)
+            except Exception as exc:
+                outcome['error'] = exc
+            finally:
+                outcome['finished'] = True
+                done.set()
+                
+        thread = threading.Thread(target=navigate, name="browser-navigation", daemon=True)
+        self.navigation_thread = thread
+        self.cancel_token.on_cancel(done.set)
+        try:
+            thread.start()
+            done.wait()
+        finally:
+            self.cancel_token.remove_callback(done.set)
+            
+        if not outcome.get('finished'):
+            raise OperationCancelled()
+        if 'error' in outcome:
+            raise outcome['error']
+            
+    def collect_page_metrics(self, kind):
+        """
+        Aktif sayfanın ağırlık ve performans ölçümlerini alır (ölçüm açıksa)
+        
+        Ölçümler iz dosyasındaki (trace) işletme spanına eklenir ve alan adı
+        bazında toplanır.
+        
+        Args:
+            kind: Sayfa türü (ör. "maps_detail", "website", "contact")
+            
+        Returns:
+            dict: Ölçümler veya None
+        """
+        if not page_metrics_stats.enabled or not self.driver:
+            return None
+        with tracer.span("browser.page_metrics", kind=kind) as span:
+            try:
+                metrics = collect_page_metrics(self.driver, kind, use_cdp=self.cdp_performance)
+            except Exception:
+                return None
+            if self.cdp_error:
+                metrics["cdp_error"] = self.cdp_error
+            span.set(**metrics)
+        self._report_cdp_error(metrics.get("cdp_error"))
+        page_metrics_stats.record(metrics)
+        return metrics
+        
+    def _report_cdp_error(self, reason):
+        """DevTools ölçümlerinin neden alınamadığını çalışma başına bir kez loglar"""
+        if page_metrics_stats.note_cdp_error(reason):
+            self.update_status(f"DevTools ölçümleri alınamıyor, JS heap ve getMetrics değerleri "
+                               f"kaydedilmeyecek: {reason}")
+        
+    def snapshot_page(self, kind):
+        """
+        Aktif sayfanın HTML'ini snapshot veritabanına kaydeder (kayıt açıksa)
+        
+        Args:
+            kind: Sayfa türü (ör. "maps_detail", "website", "contact")
+            
+        Returns:
+            bool: Kaydedildiyse True
+        """
+        if not snapshot_recorder.enabled or not self.driver:
+            return False
+        with tracer.span("browser.snapshot", kind=kind):
+            try:
+                return snapshot_recorder.capture(kind, self.driver.current_url, self.driver.page_source)
+            except Exception:
+                return False
+                
+    def wait_until(self, condition, timeout=None, poll_frequency=0.25):
+        """
+        Koşul sağlanana kadar iptal edilebilir şekilde bekler (WebDriverWait yerine)
+        
+        Args:
+            condition: Driver alan fonksiyon (ör. expected_conditions koşulları)
+            timeout: Maksimum bekleme süresi (saniye, None = click_verify_timeout)
+            poll_frequency: Kontrol aralığı (saniye)
+            
+        Returns:
+            Koşulun ilk doğru (truthy) dönüş değeri
+            
+        Raises:
+            TimeoutException: Koşul süre içinde sağlanmazsa
+            OperationCancelled: Bekleme sırasında iptal istenirse
+        """
+        timeout = timeout or BROWSER_CONFIG['click_verify_timeout']
+        deadline = time.monotonic() + timeout
+        with tracer.span("browser.wait"):
+            while True:
+                try:
+                    value = condition(self.driver)
+                    if value:
+                        return value
+                except NoSuchElementException:
+                    pass
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutException(f"Koşul {timeout} sn içinde sağlanmadı")
+                self.sleep(min(poll_frequency, remaining))
         
     def open_new_window(self, url):
         """
@@ -103,7 +454,7 @@ class BrowserManager:
             self.driver.switch_to.window(self.driver.window_handles[-1])
             
             # URL'yi yükle
-            self.driver.get(url)
+            self.get(url)
             self.random_sleep()
             
             return original_window
@@ -130,68 +481,109 @@ class BrowserManager:
             self.random_sleep(1, 2)
         except Exception as e:
             self.update_status(f"Pencere kapatma hatası: {str(e)}")
-    
-    def safely_navigate_back(self, original_url=None):
+            
+    def open_background_tab(self, url):
         """
-        Güvenli bir şekilde geri navigasyonu sağlar
+        URL'yi arka plan sekmesinde yüklemeye başlar, aktif sekme değişmez
         
         Args:
-            original_url: Başarısızlık durumunda kullanılacak URL
+            url: Yüklenecek URL
             
         Returns:
-            bool: İşlemin başarılı olup olmadığı
+            str: Yeni sekmenin tanımlayıcısı veya None
         """
         if not self.driver:
-            return False
+            return None
             
         try:
-            # Önce back butonunu dene
-            back_buttons = self.driver.find_elements(
-                By.CSS_SELECTOR, ", ".join(CSS_SELECTORS["back_buttons"])
-            )
+            original_handles = set(self.driver.window_handles)
+            self.driver.execute_script("window.open(arguments[0], '_blank');", url)
             
-            if back_buttons and len(back_buttons) > 0:
-                try:
-                    self.update_status("Geri düğmesi bulundu, tıklanıyor...")
-                    # Try with ActionChains
-                    ActionChains(self.driver).move_to_element(back_buttons[0]).click().perform()
-                    self.random_sleep(BROWSER_CONFIG['sleep_click_min'], BROWSER_CONFIG['sleep_click_max'])
-                    return True
-                except:
-                    try:
-                        # Try with JavaScript
-                        self.update_status("ActionChains başarısız, JavaScript ile deneniyor...")
-                        self.driver.execute_script("arguments[0].click();", back_buttons[0])
-                        self.random_sleep(BROWSER_CONFIG['sleep_click_min'], BROWSER_CONFIG['sleep_click_max'])
-                        return True
-                    except:
-                        pass
+            new_handles = [handle for handle in self.driver.window_handles
+                           if handle not in original_handles]
+            return new_handles[0] if new_handles else None
         except Exception as e:
-            self.update_status(f"Geri butonu hatası: {str(e)}")
+            self.update_status(f"Arka plan sekmesi açma hatası: {str(e)}")
+            return None
+            
+    def close_tab(self, handle):
+        """
+        Belirtilen sekmeyi kapatır ve aktif sekmeye geri döner
+        
+        Args:
+            handle: Kapatılacak sekmenin tanımlayıcısı
+        """
+        if not self.driver or not handle:
+            return
             
-        # JavaScript back kullan
         try:
-            self.update_status("JavaScript history.back() kullanılıyor...")
-            self.driver.execute_script("window.history.back();")
-            self.random_sleep(BROWSER_CONFIG['sleep_click_min'], BROWSER_CONFIG['sleep_click_max'])
-            return True
+            current_window = self.driver.current_window_handle
+            if handle not in self.driver.window_handles:
+                return
+                
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+            
+            if current_window != handle:
+                self.driver.switch_to.window(current_window)
         except Exception as e:
-            self.update_status(f"JavaScript geri hatası: {str(e)}")
+            self.update_status(f"Sekme kapatma hatası: {str(e)}")
+            
+    def safely_navigate_back(self, original_url=None):
+        """
+        Güvenli bir şekilde geri navigasyonu sağlar
+        
+        Geri dönüş yöntemleri (geri butonu, history.back, driver.back) bu sayfa türünde
+        en çok işe yarayan önce gelecek şekilde sıralanır; başarı URL değişimiyle doğrulanır.
+        
+        Args:
+            original_url: Başarısızlık durumunda kullanılacak URL
+            
+        Returns:
+            bool: İşlemin başarılı olup olmadığı
+        """
+        if not self.driver:
+            return False
             
-        # Driver back kullan
         try:
-            self.update_status("Driver.back() kullanılıyor...")
-            self.driver.back()
-            self.random_sleep(BROWSER_CONFIG['sleep_click_min'], BROWSER_CONFIG['sleep_click_max'])
-            return True
-        except Exception as e:
-            self.update_status(f"Driver geri hatası: {str(e)}")
+            url_before = self.driver.current_url
+        except Exception:
+            url_before = None
+        url_changed = lambda driver: driver.current_url != url_before
+        
+        for method in self.click_stats.ordered("back_navigation", BACK_METHODS):
+            try:
+                if method == "button":
+                    back_buttons = self.driver.find_elements(
+                        By.CSS_SELECTOR, ", ".join(CSS_SELECTORS["back_buttons"])
+                    )
+                    if not back_buttons:
+                        continue
+                    self.update_status("Geri düğmesi bulundu, tıklanıyor...")
+                    success = self.safe_click(
+                        back_buttons[0], retry_count=1, page_type="back_button", verify=url_changed
+                    )
+                elif method == "history":
+                    self.update_status("JavaScript history.back() kullanılıyor...")
+                    self.driver.execute_script("window.history.back();")
+                    success = self._wait_for_condition(url_changed)
+                else:
+                    self.update_status("Driver.back() kullanılıyor...")
+                    self._navigate(self.driver.back)
+                    success = self._wait_for_condition(url_changed)
+            except Exception as e:
+                self.update_status(f"Geri dönüş hatası ({method}): {str(e)}")
+                success = False
+                
+            self.click_stats.record("back_navigation", method, success)
+            if success:
+                return True
             
         # Son çare olarak orijinal URL'ye git
         if original_url:
             try:
                 self.update_status(f"Orijinal URL'ye geri dönülüyor: {original_url}")
-                self.driver.get(original_url)
+                self.get(original_url)
                 self.random_sleep()
                 return True
             except Exception as e:
@@ -214,7 +606,7 @@ class BrowserManager:
             if element:
                 return element.text
             return default
-        except:
+        except Exception:
             return default
 
     def safe_find_element(self, by, value, timeout=5, default=None):
@@ -234,20 +626,25 @@ class BrowserManager:
             return default
             
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((by, value))
-            )
+            element = self.wait_until(EC.presence_of_element_located((by, value)), timeout)
             return element
-        except:
+        except Exception:
             return default
     
-    def safe_click(self, element, retry_count=3):
+    def safe_click(self, element, retry_count=3, page_type="default", verify=None):
         """
         Güvenli bir şekilde elemente tıklama yapar
         
+        Tıklama yöntemleri (ActionChains, JavaScript, doğrudan tıklama) sayfa türü bazında
+        kaydedilen başarı oranına göre sıralanır. Doğrulama fonksiyonu verilirse sabit
+        bekleme yerine bu koşulun sağlanması beklenir.
+        
         Args:
             element: Tıklanacak web elementi
             retry_count: Başarısız durumda deneme sayısı
+            page_type: Tıklama istatistiklerinin tutulacağı sayfa/öğe türü
+                (ör. "list_card", "back_button", "website_button")
+            verify: Tıklamanın işe yaradığını doğrulayan fonksiyon (driver alır, bool döner)
             
         Returns:
             bool: İşlemin başarılı olup olmadığı
@@ -255,33 +652,109 @@ class BrowserManager:
         if not element or not self.driver:
             return False
             
-        for attempt in range(retry_count):
-            try:
-                # Scroll element into view
-                self.driver.execute_script(
-                    "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", 
-                    element
+        policy = get_policy("click").with_attempts(retry_count)
+        try:
+            with tracer.span(f"browser.click.{page_type}"):
+                return call_with_retry(
+                    f"browser.click.{page_type}", self._click_once, element, page_type, verify,
+                    policy=policy, sleep=self.sleep
                 )
-                self.random_sleep(0.5, 1)
+        except Exception:
+            return False
+            
+    def _click_once(self, element, page_type, verify):
+        """
+        Tıklama yöntemlerini başarı sırasına göre bir kez dener
+        
+        Bir yöntemin tıklaması hata vermeden gönderildi ama doğrulama süresi
+        dolduysa, sonraki yönteme geçmeden önce koşula bir kez daha bakılır.
+        Yeni pencere açan öğelerde (WINDOW_OPENING_CLICKS) tekrar tıklanmaz.
+        
+        Returns:
+            bool: Tıklama başarılıysa True (yeni pencere açan öğe doğrulanamadıysa False)
+            
+        Raises:
+            Exception: Hiçbir yöntem işe yaramazsa son hata (yeniden deneme kararı için)
+        """
+        try:
+            # Elementi anında görünür alana kaydır (yumuşak kaydırma beklemesi olmadan)
+            self.driver.execute_script(
+                "arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});", 
+                element
+            )
+        except StaleElementReferenceException:
+            raise
+        except Exception:
+            pass
+            
+        last_error = None
+        for strategy in self.click_stats.ordered(page_type, CLICK_STRATEGIES):
+            try:
+                self._perform_click(strategy, element)
+            except StaleElementReferenceException:
+                # Bayat elemente başka yöntemle tıklamak da işe yaramaz
+                self.click_stats.record(page_type, strategy, False)
+                raise
+            except Exception as e:
+                self.click_stats.record(page_type, strategy, False)
+                last_error = e
+                continue
                 
-                # Try action chains first
-                ActionChains(self.driver).move_to_element(element).click().perform()
+            if verify is None:
+                # Doğrulama koşulu yoksa eski davranış: sabit bekleme
                 self.random_sleep(BROWSER_CONFIG['sleep_click_min'], BROWSER_CONFIG['sleep_click_max'])
+                success = True
+            else:
+                # Süre dolduysa koşula son bir kez bak: tıklama geç de olsa işe yaramış olabilir
+                success = self._wait_for_condition(verify) or self._condition_met(verify)
+                
+            self.click_stats.record(page_type, strategy, success)
+            if success:
                 return True
-            except:
-                try:
-                    # Try JavaScript click
-                    self.driver.execute_script("arguments[0].click();", element)
-                    self.random_sleep(BROWSER_CONFIG['sleep_click_min'], BROWSER_CONFIG['sleep_click_max'])
-                    return True
-                except:
-                    try:
-                        # Try direct click
-                        element.click()
-                        self.random_sleep(BROWSER_CONFIG['sleep_click_min'], BROWSER_CONFIG['sleep_click_max'])
-                        return True
-                    except:
-                        if attempt < retry_count - 1:
-                            self.random_sleep(0.5, 1)  # Kısa bekle ve tekrar dene
-        
-        return False
\ No newline at end of file
+            if page_type in WINDOW_OPENING_CLICKS:
+                # Tıklama gönderildi; başka yöntemle veya yeniden denemeyle ikinci pencere açılmasın
+                return False
+            last_error = TimeoutException(f"Tıklama doğrulanamadı ({strategy})")
+            
+        raise last_error or TimeoutException("Tıklama yapılamadı")
+        
+    def _perform_click(self, strategy, element):
+        """
+        Elemente belirtilen yöntemle tıklar
+        
+        Args:
+            strategy: "actions", "js" veya "native"
+            element: Tıklanacak web elementi
+        """
+        if strategy == "actions":
+            ActionChains(self.driver).move_to_element(element).click().perform()
+        elif strategy == "js":
+            self.driver.execute_script("arguments[0].click();", element)
+        else:
+            element.click()
+            
+    def _condition_met(self, condition):
+        """Koşulu beklemeden bir kez kontrol eder (hata başarısızlık sayılır)"""
+        try:
+            return bool(condition(self.driver))
+        except Exception:
+            return False
+            
+    def _wait_for_condition(self, condition, timeout=None):
+        """
+        Koşul sağlanana kadar kısa aralıklarla bekler
+        
+        Args:
+            condition: Driver alan ve bool dönen fonksiyon
+            timeout: Maksimum bekleme süresi (saniye)
+            
+        Returns:
+            bool: Koşul süre dolmadan sağlandıysa True
+        """
+        timeout = timeout or BROWSER_CONFIG['click_verify_timeout']
+        try:
+            self.wait_until(condition, timeout, poll_frequency=0.1)
+            return True
+        except Exception:
+            # Zaman aşımı veya sayfa değişimi sırasında oluşan hatalar başarısızlık sayılır
+            return False
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""
+İşbirlikçi iptal (cooperative cancellation) - durdurma isteğinin beklemeleri anında kesmesi
+"""
+import threading
+
+class OperationCancelled(BaseException):
+    """
+    İşlem kullanıcı tarafından iptal edildi
+    
+    Exception yerine BaseException'dan türetilir (asyncio.CancelledError gibi);
+    böylece çıkarıcılardaki genel "except Exception" blokları iptali yutmaz ve
+    iptal doğrudan scrape döngüsüne ulaşır.
+    """
+
+class CancellationToken:
+    """
+    İptal isteğini iş parçacıkları arasında taşıyan belirteç
+    
+    Tüm beklemeler threading.Event üzerinde yapılır; cancel() çağrıldığında
+    bekleyen her sleep/wait hemen uyanır. İptal edilen belirteç tekrar
+    kullanılmaz, her çalıştırma için yeni belirteç oluşturulur.
+    """
+    def __init__(self):
+        self.event = threading.Event()
+        self.callbacks = []
+        self.lock = threading.Lock()
+        
+    @property
+    def is_cancelled(self):
+        """İptal istendi mi"""
+        return self.event.is_set()
+        
+    def cancel(self):
+        """
+        İptal ister; bekleyenleri uyandırır ve kayıtlı geri çağırmaları çalıştırır
+        
+        Geri çağırmalar cancel() çağıran iş parçacığında (ör. arayüz) çalışır.
+        """
+        with self.lock:
+            if self.event.is_set():
+                return
+            self.event.set()
+            callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+                
+    def on_cancel(self, callback):
+        """
+        İptal anında çağrılacak fonksiyonu kaydeder (zaten iptal edildiyse hemen çağrılır)
+        
+        Args:
+            callback: Argümansız fonksiyon
+        """
+        with self.lock:
+            if not self.event.is_set():
+                self.callbacks.append(callback)
+                return
+        callback()
+        
+    def remove_callback(self, callback):
+        """Kayıtlı geri çağırmayı kaldırır"""
+        with self.lock:
+            if callback in self.callbacks:
+                self.callbacks.remove(callback)
+                
+    def wait(self, seconds):
+        """
+        En fazla verilen süre kadar bekler, iptal edilirse hemen döner
+        
+        Returns:
+            bool: İptal edildiyse True
+        """
+        return self.event.wait(max(0.0, seconds))
+        
+    def sleep(self, seconds):
+        """
+        İptal edilebilir bekleme (time.sleep yerine)
+        
+        Raises:
+            OperationCancelled: Bekleme sırasında veya öncesinde iptal edildiyse
+        """
+        if self.event.wait(max(0.0, seconds)):
+            raise OperationCancelled()
+            
+    def raise_if_cancelled(self):
+        """
+        Raises:
+            OperationCancelled: İptal istendiyse
+        """
+        if self.event.is_set():
+            raise OperationCancelled()
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""
+WebDriver komut izleyici - chromedriver'a yapılan her HTTP çağrısını sayar ve süresini ölçer
+"""
+import os
+import sys
+import time
+import threading
+from collections import Counter, defaultdict
+
+import selenium
+
+from .config import COMMAND_TRACE_CONFIG
+from .tracing import percentile
+
+SELENIUM_DIR = os.path.dirname(os.path.abspath(selenium.__file__))
+THIS_FILE = os.path.abspath(__file__)
+
+def _caller_site():
+    """
+    Komutu gönderen ilk uygulama kodu satırını bulur (selenium içindeki çerçeveler atlanır)
+    
+    Returns:
+        tuple: (dosya adı, fonksiyon adı, satır numarası)
+    """
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not filename.startswith(SELENIUM_DIR) and filename != THIS_FILE:
+            return (os.path.basename(filename), frame.f_code.co_name, frame.f_lineno)
+        frame = frame.f_back
+    return ("?", "?", 0)
+
+class CommandTracer:
+    """
+    WebDriver komutlarını tür, çağrı noktası ve işletme bazında sayan izleyici
+    
+    Selenium'da find_elements, get_attribute, .text, execute_script gibi her
+    işlem tek bir driver.execute çağrısına (chromedriver'a bir HTTP isteğine)
+    dönüşür; WebElement komutları da sürücünün execute metodundan geçer. attach()
+    bu metodu örnek (instance) düzeyinde sarar, böylece tüm komutlar tek noktadan
+    izlenir.
+    """
+    def __init__(self, enabled=False):
+        """
+        Args:
+            enabled: İzleme açık mı (kapalıyken yalnızca toplam komut sayısı tutulur, işletme
+                işaretleri bir şey yapmaz)
+        """
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.reset()
+        
+    def reset(self, enabled=None):
+        """Sayaçları sıfırlar (enabled verilirse açık/kapalı durumunu da değiştirir)"""
+        if enabled is not None:
+            self.enabled = enabled
+        with self.lock:
+            self.total_calls = 0
+            self.total_seconds = 0.0
+            self.commands = Counter()                 # komut -> çağrı sayısı
+            self.command_seconds = defaultdict(float)  # komut -> toplam süre
+            self.sites = {}                           # (dosya, fonksiyon, satır) -> [çağrı, süre, Counter]
+            self.businesses = []                      # (işletme, çağrı, süre)
+            self.current_business = None
+            self.business_calls = 0
+            self.business_seconds = 0.0
+            
+    def attach(self, driver):
+        """
+        Sürücünün execute metodunu izleyen sarmalayıcıyla değiştirir
+        
+        Args:
+            driver: WebDriver nesnesi (tarayıcı yeniden başlatılınca yenisi için tekrar çağrılır)
+        """
+        if driver is None:
+            return
+        original = driver.execute
+        if getattr(original, 'command_tracer', None) is self:
+            return
+            
+        def execute(driver_command, params=None):
+            if not self.enabled:
+                # Kapalıyken çağrı noktası aranmaz; toplam sayı çalıştırma geçmişine yazılır
+                with self.lock:
+                    self.total_calls += 1
+                return original(driver_command, params)
+            started = time.perf_counter()
+            try:
+                return original(driver_command, params)
+            finally:
+                self.record(driver_command, time.perf_counter() - started, _caller_site())
+                
+        execute.command_tracer = self
+        driver.execute = execute
+        
+    def record(self, command, seconds, site):
+        """Tek bir komutu kaydeder"""
+        with self.lock:
+            self.total_calls += 1
+            self.total_seconds += seconds
+            self.commands[command] += 1
+            self.command_seconds[command] += seconds
+            entry = self.sites.get(site)
+            if entry is None:
+                entry = self.sites[site] = [0, 0.0, Counter()]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2][command] += 1
+            if self.current_business is not None:
+                self.business_calls += 1
+                self.business_seconds += seconds
+                
+    def begin_business(self, label):
+        """Sonraki komutları bu işletmeye yaz"""
+        if not self.enabled:
+            return
+        with self.lock:
+            self.current_business = label
+            self.business_calls = 0
+            self.business_seconds = 0.0
+            
+    def end_business(self):
+        """İşletmenin komut sayısını kaydet"""
+        if not self.enabled:
+            return
+        with self.lock:
+            if self.current_business is not None:
+                self.businesses.append((self.current_business, self.business_calls, self.business_seconds))
+            self.current_business = None
+            
+    def round_trips_per_business(self):
+        """
+        Returns:
+            dict: İşletme başına komut sayısı istatistikleri (mean, p50, p95, max, seconds_mean)
+        """
+        with self.lock:
+            counts = sorted(calls for _, calls, _ in self.businesses)
+            seconds = [spent for _, _, spent in self.businesses]
+        if not counts:
+            return {"businesses": 0, "mean": 0.0, "p50": 0, "p95": 0, "max": 0, "seconds_mean": 0.0}
+        return {
+            "businesses": len(counts),
+            "mean": sum(counts) / len(counts),
+            "p50": percentile(counts, 50),
+            "p95": percentile(counts, 95),
+            "max": counts[-1],
+            "seconds_mean": sum(seconds) / len(seconds),
+        }
+        
+    def top_sites(self, limit=None):
+        """
+        En çok komut gönderen çağrı noktaları
+        
+        Returns:
+            list: (çağrı noktası metni, çağrı, süre, en sık 3 komut) satırları
+        """
+        limit = limit or COMMAND_TRACE_CONFIG["top_sites"]
+        with self.lock:
+            rows = sorted(self.sites.items(), key=lambda item: -item[1][0])[:limit]
+        return [(f"{filename}:{line} {function}", calls, spent, commands.most_common(3))
+                for (filename, function, line), (calls, spent, commands) in rows]
+        
+    def format_report(self):
+        """
+        Returns:
+            str: Komut raporu (komut yoksa boş)
+        """
+        if not self.total_calls:
+            return ""
+        per_business = self.round_trips_per_business()
+        lines = [f"WebDriver komutları: {self.total_calls} çağrı, {self.total_seconds:.1f} sn"]
+        if per_business["businesses"]:
+            lines.append(
+                f"İşletme başına: ort. {per_business['mean']:.1f} çağrı "
+                f"(p50 {per_business['p50']}, p95 {per_business['p95']}, en çok {per_business['max']}), "
+                f"ort. {per_business['seconds_mean']:.2f} sn"
+            )
+        lines.append("Komut türleri: " + ", ".join(
+            f"{command} {count} ({self.command_seconds[command]:.1f} sn)"
+            for command, count in self.commands.most_common(8)
+        ))
+        lines.append("En çok çağrı yapan noktalar:")
+        for site, calls, spent, commands in self.top_sites():
+            detail = ", ".join(f"{command} {count}" for command, count in commands)
+            lines.append(f"  {site}: {calls} çağrı, {spent:.2f} sn ({detail})")
+        return "\n".join(lines)
+
+# Uygulama genelinde paylaşılan izleyici
+command_tracer = CommandTracer(enabled=COMMAND_TRACE_CONFIG["enabled"])
\ No newline at end of file
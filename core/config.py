@@ -1,6 +1,7 @@
 """
 Konfigürasyon sabitleri
 """
+import os
 import re
 
 # Tarayıcı ayarları
@@ -13,6 +14,41 @@ BROWSER_CONFIG = {
     "sleep_max": 5,                # Maksimum bekleme süresi (saniye) 
     "sleep_click_min": 1,          # Tıklama sonrası minimum bekleme
     "sleep_click_max": 2,          # Tıklama sonrası maksimum bekleme
+    "sleep_scale": 1.0,            # Rastgele beklemelerin çarpanı (yerel benchmark'ta küçültülür)
+    "click_verify_timeout": 5,     # Tıklama sonrası doğrulama koşulu için maksimum bekleme
+    "max_rss_mb": 0,               # Chrome süreç ağacı bu belleği aşarsa tarayıcı yeniden başlatılır (0 = yeniden başlatma yok,
+                                   # bellek yine her sayfadan sonra ölçülüp loglanır;
+                                   # düşük bellek profilinde DENSITY_CONFIG["max_rss_mb"] geçerlidir)
+}
+
+# Düşük bellek (yoğunluk) profili - aynı makinede çok sayıda tarayıcı çalıştırmak için
+DENSITY_CONFIG = {
+    "enabled": False,              # Düşük bellek profili açık mı
+    "window_size": (800, 600),     # Küçük pencere boyutu
+    "renderer_process_limit": 2,   # Maksimum renderer süreç sayısı
+    "disk_cache_mb": 32,           # Disk önbelleği sınırı (MB)
+    "max_rss_mb": 700,             # Bu profilde geçerli bellek sınırı (MB)
+    "arguments": [                 # Arka plan servislerini kapatan ek Chrome argümanları
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-component-update",
+        "--disable-default-apps",
+        "--disable-sync",
+        "--disable-translate",
+        "--disable-dev-shm-usage",
+        "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication",
+        "--metrics-recording-only",
+        "--mute-audio",
+        "--no-first-run",
+    ],
+}
+
+# Chromedriver çözümleme ve servis ayarları
+DRIVER_CONFIG = {
+    "driver_path": None,           # Elle verilen chromedriver yolu (None = otomatik çözümle)
+    "cache_file": os.path.join(os.path.expanduser("~"), ".cache", "maps_scraper", "driver_paths.json"),
+    "cache_ttl_hours": 24,         # Önbellekteki sürücü yolunun geçerlilik süresi
+    "shared_service": True,        # Tüm oturumlar için tek chromedriver süreci kullan
 }
 
 # Google Maps ayarları
@@ -20,6 +56,36 @@ MAPS_CONFIG = {
     "base_url": "https://www.google.com/maps/search/",
     "max_retry": 3,                # Maksimum yeniden deneme sayısı
     "max_scroll": 20,              # Maksimum kaydırma sayısı
+    "prefetch_depth": 0,           # Arka plan sekmelerinde önceden yüklenecek detay sayfası sayısı (0 = kapalı)
+}
+
+# Yeniden deneme politikaları (işlem türüne göre)
+# retry_on: yeniden denenecek hata türleri (stale_element, timeout, not_interactable, webdriver, no_such_element)
+RETRY_CONFIG = {
+    "default": {
+        "max_attempts": 3, "base_delay": 0.5, "max_delay": 8.0, "jitter": 0.3, "budget_seconds": 30,
+        "retry_on": ["stale_element", "timeout", "not_interactable", "webdriver"],
+    },
+    "page_load": {                 # driver.get ile sayfa yükleme
+        "max_attempts": 3, "base_delay": 1.0, "max_delay": 10.0, "jitter": 0.3, "budget_seconds": 90,
+        "retry_on": ["timeout", "webdriver"],
+    },
+    "website_load": {              # İşletme websitesi yükleme (yavaş siteyi tekrar denemek işe yaramaz)
+        "max_attempts": 2, "base_delay": 1.0, "max_delay": 4.0, "jitter": 0.3, "budget_seconds": 45,
+        "retry_on": ["webdriver"],
+    },
+    "find_list": {                 # Arama sonuç listesini bulma
+        "max_attempts": MAPS_CONFIG["max_retry"], "base_delay": 1.0, "max_delay": 6.0, "jitter": 0.3,
+        "budget_seconds": 60, "retry_on": ["timeout", "no_such_element"],
+    },
+    "click": {                     # Element tıklama
+        "max_attempts": 3, "base_delay": 0.3, "max_delay": 2.0, "jitter": 0.3, "budget_seconds": 15,
+        "retry_on": ["timeout", "not_interactable", "webdriver"],
+    },
+    "extract": {                   # Detay panelinden alan çıkarma
+        "max_attempts": 2, "base_delay": 0.2, "max_delay": 1.0, "jitter": 0.3, "budget_seconds": 10,
+        "retry_on": ["stale_element"],
+    },
 }
 
 # CSS Seçiciler (Google Maps'teki elementleri bulmak için)
@@ -100,5 +166,117 @@ REGEX_PATTERNS = {
 EXPORT_CONFIG = {
     "excel_filename_pattern": "isletmeler_detayli_{timestamp}.xlsx",
     "csv_filename_pattern": "isletmeler_detayli_{timestamp}.csv",
-    "backup_filename_pattern": "isletmeler_yedek_{timestamp}.txt"
+    "backup_filename_pattern": "isletmeler_yedek_{timestamp}.txt",
+    "stream_filename_pattern": "isletmeler_akis_{timestamp}_{part:03d}.{extension}",
+    "stream_enabled": False,       # Kayıtları geldikçe diske yaz (tarama sonunu beklemeden)
+    "stream_format": "csv",        # Akış formatı: csv, jsonl (satır satır diske) veya xlsx (parça parça, aşağıya bakın)
+    "stream_gzip": False,          # JSON Lines dosyalarını gzip ile sıkıştır
+    "stream_rotate_rows": 0,       # Her N satırda yeni dosyaya geç (0 = döndürme yok)
+    "stream_xlsx_save_rows": 200,  # XLSX yalnızca kaydedilince diske yazılır; canlı akışta her N satırda parça
+                                   # kaydedilip yenisine geçilir (0 = yalnızca kapanışta, kesilirse satırlar kaybolur)
+}
+
+# Sonuç deposu ayarları
+STORAGE_CONFIG = {
+    "backend": "memory",           # memory (liste) veya sqlite
+    "sqlite_path": "isletmeler.db",  # SQLite veritabanı dosyası
+    "batch_size": 200,             # Toplu ekleme boyutu
+}
+
+# Mükerrer kayıt tespiti ayarları
+DEDUP_CONFIG = {
+    "enabled": False,              # Tarama sonunda mükerrer kayıtları birleştir (--dedup / arayüz seçeneğiyle de açılır)
+    "name_threshold": 0.85,        # Aynı ilçede isim benzerliği (trigram Jaccard) eşiği
+    "key_name_threshold": 0.5,     # Telefon/alan adı ortakken aranan asgari isim benzerliği
+    "max_block_size": 500,         # Bundan büyük bloklar karşılaştırılmaz (ör. ortak santral numarası)
+}
+
+# Son işleme (toplu normalleştirme) ayarları
+POSTPROCESS_CONFIG = {
+    "enabled": False,              # Tarama sonunda telefon, e-posta ve URL'leri normalleştir (--postprocess / arayüz)
+    "country_code": "90",          # Ülke kodu olmayan telefonlara eklenecek kod
+    "use_pandas": False,           # pandas sütun işlemlerini kullan; hız seçeneği değil, kayıt kayıt yoldan
+                                   # ~2,5 kat yavaş (benchmarks/bench_postprocess.py)
+}
+
+# Alan adı sınıflandırma ayarları
+DOMAIN_CONFIG = {
+    "rules_file": None,            # Ek sosyal/platform/harita/işletme kuralları içeren JSON dosyası
+}
+
+# Arayüz günlük/ilerleme güncelleme ayarları
+UI_CONFIG = {
+    "queue_poll_ms": 100,          # İleti kuyruğunun boşaltılma aralığı (ms)
+    "max_messages_per_tick": 5000, # Bir turda işlenecek en fazla ileti (kalanlar hemen sonraki turda)
+    "event_queue_size": 10000,     # Arayüz olay kuyruğu; doluyken düşük öncelikli olaylar atlanır
+    "log_max_lines": 5000,         # İşlem detayları konsolunda tutulacak en fazla satır
+    "status_update_ms": 250,       # Durum etiketi ve ilerleme çubuğunun en sık güncellenme aralığı (ms)
+    "log_to_file": True,           # Tüm durum mesajlarını arka planda dosyaya yaz
+    "log_dir": "logs",             # Günlük dosyalarının klasörü
+}
+
+# Aşama süresi izleme ayarları (core/tracing.py)
+TRACE_CONFIG = {
+    "enabled": False,              # Aşama sürelerini topla (--trace ile de açılır)
+    "output_dir": "traces",        # Chrome trace JSON dosyalarının klasörü (chrome://tracing, Perfetto)
+    "max_spans": 200000,           # Bellekte tutulacak en fazla span
+}
+
+# WebDriver komut izleme ayarları (core/command_tracer.py)
+COMMAND_TRACE_CONFIG = {
+    "enabled": False,              # Her WebDriver komutunu say ve süresini ölç (--trace-commands ile de açılır)
+    "top_sites": 15,               # Raporda gösterilecek en çok çağrı yapan nokta sayısı
+}
+
+# Profilleme ayarları (core/profiling.py)
+PROFILE_CONFIG = {
+    "mode": None,                  # None (kapalı), "cprofile", "sample" veya "both" (--profile ile de seçilir)
+    "stages": [],                  # Boş değilse yalnızca bu aşamalar cProfile ile ölçülür
+                                   # ("postprocess", "dedup", "export", "email.scan_page")
+    "sample_interval_ms": 10,      # Yığın örnekleme aralığı
+    "max_depth": 64,               # Örneklenecek en fazla çerçeve derinliği
+    "output_dir": "profiles",      # .pstats ve .collapsed dosyalarının klasörü
+}
+
+# Bellek izleme ayarları (core/memory_monitor.py)
+MEMORY_CONFIG = {
+    "enabled": False,              # tracemalloc ile bellek izle (--memory ile de açılır; yavaşlatır)
+    "interval_seconds": 60,        # Periyodik snapshot aralığı (0 = yalnızca aşama sınırlarında)
+    "top_n": 10,                   # Raporlarda gösterilecek satır sayısı
+    "frames": 1,                   # Ayırma başına tutulan çağrı yığını derinliği
+}
+
+# Sayfa ağırlığı / tarayıcı performans ölçümleri (core/page_metrics.py)
+PAGE_METRICS_CONFIG = {
+    "enabled": False,              # Her detay sayfası ve ziyaret edilen website için ölçüm al (--page-metrics)
+    "use_cdp": True,               # DevTools Performance.getMetrics (JS heap, DOM düğümü, betik süresi)
+    "report_domains": 20,          # Raporda gösterilecek alan adı sayısı
+}
+
+# Canlı metrik ayarları (core/metrics.py)
+METRICS_CONFIG = {
+    "enabled": False,              # Metrikleri topla ve HTTP ucunu aç (CLI'de --metrics-port da açar)
+    "port": 9464,                  # Prometheus metin biçimi için HTTP portu (/metrics)
+    "host": "127.0.0.1",           # Yalnızca yerel erişim
+}
+
+# Çalıştırma geçmişi ayarları (core/run_history.py)
+HISTORY_CONFIG = {
+    "enabled": False,              # Her taramanın özetini geçmiş veritabanına yaz (--history / arayüz seçeneğiyle de açılır)
+    "path": "run_history.db",      # SQLite veritabanı dosyası
+    "report_runs": 10,             # Raporda listelenen son çalıştırma sayısı
+    "compare_latest": 3,           # Gerileme kontrolünde karşılaştırılan son çalıştırma sayısı
+    "baseline_runs": 10,           # Taban çizgisini oluşturan önceki çalıştırma sayısı
+    "regression_threshold": 0.2,   # Bu oranın üzerindeki kötüleşme gerileme sayılır (%20)
+    "min_runs_for_estimate": 2,    # Süre tahmini için gereken en az benzer çalıştırma
+    "startup_seconds": 15,         # Tahminde varsayılan başlangıç süresi (tarayıcı ve arama sayfası)
+}
+
+# Sayfa snapshot ayarları (core/snapshots.py)
+SNAPSHOT_CONFIG = {
+    "enabled": False,              # Detay panelleri ve website sayfalarının HTML'ini kaydet (--snapshots)
+    "path": "snapshots.db",        # Sıkıştırılmış sayfaların SQLite dosyası
+    "compress_level": 6,           # zlib düzeyi (1 = hızlı, 9 = küçük)
+    "workers": 0,                  # Yeniden çıkarımda işçi işlem sayısı (0 = işlemci sayısı)
+    "chunk_size": 20,              # İşçiye bir seferde verilen işletme sayısı
 }
\ No newline at end of file
@@ -4,16 +4,41 @@ Veri yönetimi ve dışa aktarma sınıfı
 import os
 import time
 import csv
+import threading
 
-from .config import EXPORT_CONFIG
+from .config import EXPORT_CONFIG, STORAGE_CONFIG, DOMAIN_CONFIG
+from .streaming_export import create_stream_writer
+from .sqlite_store import SQLiteStore
+from .models import BusinessRecord, EXPORT_COLUMNS
+from .dedup import Deduplicator
+from .postprocess import PostProcessor
+from .profiling import profiled
+from .memory_monitor import memory_monitor
+from utils.domain_index import configure_domain_index
 
 class DataManager:
     """
     Veri yönetimi ve dışa aktarma işlemleri
     """
-    def __init__(self):
+    def __init__(self, store=None):
+        """
+        Args:
+            store: Kayıtların tutulacağı SQLiteStore (None = STORAGE_CONFIG'e göre)
+        """
         self.data = []
         
+        # Son işleme ve mükerrer kayıt birleştirme aynı alan adı kurallarını kullanır
+        configure_domain_index(DOMAIN_CONFIG["rules_file"])
+        
+        # SQLite deposu varsa kayıtlar listede değil veritabanında tutulur
+        if store is None and STORAGE_CONFIG["backend"] == "sqlite":
+            store = SQLiteStore()
+        self.store = store
+        self.run_id = SQLiteStore.new_run_id()  # Depoda bu çalıştırmanın kayıtlarını ayırır
+        
+        self.stream = None               # Açık akış yazıcısı (kayıtlar geldikçe diske yazılır)
+        self.stream_lock = threading.Lock()
+        
         # Excel desteği kontrol et
         self.has_pandas = False
         self.has_openpyxl = False
@@ -35,34 +60,181 @@ class DataManager:
         return self.has_pandas and self.has_openpyxl
     
     def set_data(self, data):
-        """Veri kaydet"""
-        self.data = data
+        """Veri kaydet (BusinessRecord veya eski biçim sözlük listesi)"""
+        data = [BusinessRecord.coerce(item) for item in data]
+        if self.store:
+            # Satırlar yerinde güncellenir; önceki çalıştırmalardan gelen geçmiş (first_seen) korunur
+            self.store.replace_run(data, self.run_id)
+        else:
+            self.data = data
     
     def get_data(self):
         """Veriyi getir"""
+        if self.store:
+            return list(self.store.iter_records(self.run_id))
         return self.data
     
+    def iter_data(self):
+        """Veriyi belleğe toplamadan sırayla döndür"""
+        if self.store:
+            return self.store.iter_records(self.run_id)
+        return iter(self.data)
+    
     def has_data(self):
         """Veri var mı kontrol et"""
+        if self.store:
+            return self.store.count(self.run_id) > 0
         return len(self.data) > 0
     
     def clear_data(self):
-        """Veriyi temizle"""
+        """Veriyi temizle (depoda geçmiş korunur, yeni çalıştırma başlatılır)"""
         self.data = []
+        if self.store:
+            self.store.flush()
+            self.run_id = SQLiteStore.new_run_id()
+    
+    @profiled("postprocess")
+    def postprocess(self, update_status_callback=None):
+        """
+        Mevcut çalıştırmanın telefon, e-posta ve website alanlarını toplu normalleştirir
+        
+        Args:
+            update_status_callback: Durum güncellemesi yapacak callback fonksiyonu
+            
+        Returns:
+            dict: İşlem istatistikleri (kayıt sayısı, kullanılan yöntem, süre)
+        """
+        processor = PostProcessor(update_status_callback=update_status_callback)
+        records = processor.process(self.iter_data())
+        if self.store:
+            self.set_data(records)
+        memory_monitor.checkpoint("postprocess")
+        return processor.stats
     
-    def export_data(self):
+    @profiled("dedup")
+    def deduplicate(self, update_status_callback=None):
+        """
+        Mevcut çalıştırmanın mükerrer kayıtlarını birleştirir
+        
+        Args:
+            update_status_callback: Durum güncellemesi yapacak callback fonksiyonu
+            
+        Returns:
+            dict: Birleştirme istatistikleri (girdi, çıktı, birleştirilen grup sayısı, süre)
+        """
+        deduplicator = Deduplicator(update_status_callback=update_status_callback)
+        merged = deduplicator.deduplicate(self.iter_data())
+        self.set_data(merged)
+        memory_monitor.checkpoint("dedup")
+        return deduplicator.stats
+    
+    def flush(self):
+        """Depoda bekleyen kayıtları veritabanına yaz"""
+        if self.store:
+            self.store.flush()
+    
+    def close(self):
+        """Depoyu kapat"""
+        if self.store:
+            self.store.close()
+            self.store = None
+    
+    def add_record(self, record):
+        """
+        Tek bir kaydı ekler, akış açıksa hemen diske yazar
+        
+        Args:
+            record: BusinessRecord (veya eski biçim sözlük)
+        """
+        record = BusinessRecord.coerce(record)
+        if self.store:
+            self.store.add(record, self.run_id)
+        else:
+            self.data.append(record)
+        with self.stream_lock:
+            if self.stream:
+                self.stream.write(record.to_row())
+    
+    def start_stream(self, stream_format=None, rotate_rows=None, compress=None):
+        """
+        Kayıtların geldikçe dosyaya yazılacağı akışı başlatır
+        
+        Args:
+            stream_format: csv, jsonl veya xlsx (None = EXPORT_CONFIG)
+            rotate_rows: Her N satırda dosya döndür (None = EXPORT_CONFIG)
+            compress: JSON Lines için gzip (None = EXPORT_CONFIG)
+        """
+        self.close_stream()
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        with self.stream_lock:
+            self.stream = create_stream_writer(timestamp, stream_format, rotate_rows, compress)
+    
+    def close_stream(self):
+        """
+        Açık akışı kapatır
+        
+        Returns:
+            list: Akışın yazdığı dosya adları
+        """
+        with self.stream_lock:
+            if not self.stream:
+                return []
+            files = self.stream.close()
+            self.stream = None
+            return files
+    
+    @profiled("export")
+    def export_streaming(self, records=None, stream_format=None, rotate_rows=None, compress=None):
+        """
+        Kayıtları DataFrame oluşturmadan satır satır dosyaya aktarır
+        
+        Args:
+            records: Aktarılacak BusinessRecord dizisi (None = mevcut veri, depo varsa veritabanından okunur)
+            stream_format: csv, jsonl veya xlsx (None = EXPORT_CONFIG)
+            rotate_rows: Her N satırda dosya döndür (None = EXPORT_CONFIG)
+            compress: JSON Lines için gzip (None = EXPORT_CONFIG)
+            
+        Returns:
+            list: Oluşturulan dosya adları
+        """
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        writer = create_stream_writer(timestamp, stream_format, rotate_rows, compress)
+        writer.flush_rows = False  # Toplu aktarımda satır başına diske boşaltmaya gerek yok
+        try:
+            records = self.iter_data() if records is None else records
+            # Yerelleştirilmiş başlıklar yalnızca burada, satır satır uygulanır
+            writer.write_many(BusinessRecord.coerce(record).to_row() for record in records)
+        finally:
+            files = writer.close()
+        return files
+    
+    @profiled("export")
+    def export_data(self, records=None):
         """
         Veriyi dışa aktar - Excel veya CSV olarak
         
+        Args:
+            records: Yalnızca bu kayıtları aktar (ör. sonuç tablosunun filtrelenmiş görünümü)
+        
         Returns:
             str: Dışa aktarılan dosyanın adı
         
         Raises:
             Exception: Dışa aktarma hatası durumunda
         """
-        if not self.data:
+        # Verilen kayıt dizisi (görünüm) belleğe kopyalanmadan satır satır yazılır
+        if records is not None:
+            stream_format = "xlsx" if self.has_openpyxl else "csv"
+            return self.export_streaming(records, stream_format=stream_format, rotate_rows=0)[0]
+            
+        if not self.has_data():
             raise Exception("Dışa aktarılacak veri bulunamadı!")
             
+        # Depodaki kayıtlar DataFrame'e yüklenmeden doğrudan veritabanından dosyaya akar
+        if self.store:
+            stream_format = "xlsx" if self.has_openpyxl else "csv"
+            return self.export_streaming(stream_format=stream_format, rotate_rows=0)[0]
+            
         timestamp = time.strftime('%Y%m%d_%H%M%S')
         
         # Excel modülleri varsa Excel olarak kaydet, yoksa CSV
@@ -71,7 +243,7 @@ class DataManager:
                 import pandas as pd
                 
                 filename = EXPORT_CONFIG["excel_filename_pattern"].format(timestamp=timestamp)
-                df = pd.DataFrame(self.data)
+                df = pd.DataFrame([record.to_row() for record in self.data])
                 df.to_excel(filename, index=False)
                 return filename
             else:
@@ -80,18 +252,18 @@ class DataManager:
                 with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
                     if self.data:
                         # Sütun başlıklarını al
-                        fieldnames = self.data[0].keys()
+                        fieldnames = [header for header, _ in EXPORT_COLUMNS]
                         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                         
                         # Başlıkları ve verileri yaz
                         writer.writeheader()
                         for business in self.data:
-                            writer.writerow(business)
+                            writer.writerow(business.to_row())
                 return filename
         except Exception as e:
             # Hata durumunda en basit formatta kaydetmeye çalış
             backup_file = EXPORT_CONFIG["backup_filename_pattern"].format(timestamp=timestamp)
             with open(backup_file, 'w', encoding='utf-8') as f:
                 for business in self.data:
-                    f.write(str(business) + "\n\n")
+                    f.write(str(business.to_row()) + "\n\n")
             return backup_file
\ No newline at end of file
@@ -0,0 +1,292 @@
+"""
+Mükerrer işletme kayıtlarını tespit etme ve birleştirme
+"""
+import re
+import math
+import time
+from collections import defaultdict
+
+from .config import DEDUP_CONFIG
+from .models import BusinessRecord
+from utils.normalizers import normalize_phone, registrable_domain
+from utils.domain_index import get_domain_index
+
+# Birleştirmede "en dolu kayıt" seçilirken sayılan alanlar
+MERGE_FIELDS = ('name', 'address', 'phone', 'website', 'detail_url', 'place_id', 'latitude', 'longitude',
+                'domain')
+
+NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+SPACE_PATTERN = re.compile(r'\s+')
+POSTAL_CODE_PATTERN = re.compile(r'\b\d{5}\b')
+NUMBER_PATTERN = re.compile(r'\d+')
+
+def normalize_name(name):
+    """
+    İşletme adını karşılaştırma için sadeleştirir (Türkçe küçük harf, noktalama yok)
+    
+    Args:
+        name: İşletme adı
+        
+    Returns:
+        str: Sadeleştirilmiş ad veya None
+    """
+    if not name:
+        return None
+    name = name.replace('İ', 'i').replace('I', 'ı').lower()
+    name = NON_WORD_PATTERN.sub(' ', name)
+    name = SPACE_PATTERN.sub(' ', name).strip()
+    return name or None
+
+def extract_district(address):
+    """
+    "..., 34710 Kadıköy/İstanbul" biçimindeki adresten ilçeyi çıkarır
+    
+    Args:
+        address: Adres metni
+        
+    Returns:
+        str: Küçük harfli ilçe adı veya None
+    """
+    if not address:
+        return None
+    last_part = address.rsplit(',', 1)[-1]
+    last_part = POSTAL_CODE_PATTERN.sub('', last_part)
+    district = last_part.split('/')[0].strip()
+    return normalize_name(district)
+
+def trigrams(text):
+    """Metnin karakter trigram kümesini döndürür"""
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def name_numbers(name):
+    """İsimdeki sayılar (şube numarası vb.); sayıları farklı isimler aynı işletme sayılmaz"""
+    return tuple(sorted(NUMBER_PATTERN.findall(name))) if name else ()
+
+def jaccard(first, second):
+    """İki kümenin Jaccard benzerliği"""
+    if not first or not second:
+        return 0.0
+    intersection = len(first & second)
+    return intersection / (len(first) + len(second) - intersection)
+
+def completeness(record):
+    """Kaydın dolu alan sayısı (e-posta listesi dahil)"""
+    return sum(getattr(record, field) is not None for field in MERGE_FIELDS) + (1 if record.emails else 0)
+
+def merge_records(records):
+    """
+    Aynı işletmeye ait kayıtları tek kayıtta birleştirir
+    
+    En dolu kayıt esas alınır; eksik alanları sırayla diğer kayıtlardan
+    tamamlanır, e-posta listeleri birleştirilir.
+    
+    Args:
+        records: Aynı işletmeye ait BusinessRecord listesi
+        
+    Returns:
+        BusinessRecord: Birleştirilmiş kayıt
+    """
+    if len(records) == 1:
+        return records[0]
+        
+    ordered = sorted(records, key=lambda record: (completeness(record), record.timestamp), reverse=True)
+    
+    values = {}
+    for field in MERGE_FIELDS:
+        values[field] = next((getattr(r, field) for r in ordered if getattr(r, field) is not None), None)
+        
+    emails = []
+    seen = set()
+    for record in ordered:
+        for email in record.emails:
+            key = email.lower()
+            if key not in seen:
+                seen.add(key)
+                emails.append(email)
+                
+    return BusinessRecord(
+        emails=emails,
+        timestamp=max(record.timestamp for record in records),
+        email_error=not emails and all(record.email_error for record in records),
+        **values
+    )
+
+class UnionFind:
+    """Yol sıkıştırmalı ayrık küme yapısı"""
+    def __init__(self, size):
+        self.parent = list(range(size))
+        
+    def find(self, item):
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+        
+    def union(self, first, second):
+        first_root = self.find(first)
+        second_root = self.find(second)
+        if first_root == second_root:
+            return False
+        self.parent[max(first_root, second_root)] = min(first_root, second_root)
+        return True
+
+class Deduplicator:
+    """
+    Bloklama anahtarlarıyla mükerrer kayıtları bulan ve birleştiren sınıf
+    
+    Kayıtlar yalnızca ortak bir anahtarı paylaştıklarında karşılaştırılır:
+    - place_id: aynıysa doğrudan birleştirilir
+    - normalleştirilmiş telefon / website alan adı: isimler de benzerse birleştirilir
+    - aynı ilçede isim trigramları: Jaccard benzerliği eşiği geçerse birleştirilir
+    
+    İsim blokları için en nadir trigramlardan oluşan önek kullanılır (prefix
+    filtering); eşiği geçen her çift en az bir önek trigramını paylaşır, böylece
+    sık geçen trigramlar devasa bloklar oluşturmaz. İsimdeki sayılar ("Şube 2")
+    blok anahtarına eklenir; sayıları farklı isimler hiç karşılaştırılmaz.
+    """
+    def __init__(self, name_threshold=None, key_name_threshold=None, max_block_size=None,
+                 update_status_callback=None):
+        """
+        Args:
+            name_threshold: Aynı ilçede isim eşleşmesi için Jaccard eşiği (None = DEDUP_CONFIG)
+            key_name_threshold: Telefon/alan adı ortakken isim eşiği (None = DEDUP_CONFIG)
+            max_block_size: Karşılaştırılacak en büyük blok (None = DEDUP_CONFIG)
+            update_status_callback: Durum güncellemesi yapacak callback fonksiyonu
+        """
+        self.name_threshold = name_threshold or DEDUP_CONFIG["name_threshold"]
+        self.key_name_threshold = key_name_threshold or DEDUP_CONFIG["key_name_threshold"]
+        self.max_block_size = max_block_size or DEDUP_CONFIG["max_block_size"]
+        self.update_status = update_status_callback or (lambda msg: None)
+        self.stats = {}
+        
+    def find_groups(self, records):
+        """
+        Aynı işletmeye ait kayıt gruplarını bulur
+        
+        Args:
+            records: BusinessRecord listesi
+            
+        Returns:
+            list: Kayıt indeksi listelerinin listesi (tekil kayıtlar dahil)
+        """
+        count = len(records)
+        sets = UnionFind(count)
+        comparisons = 0
+        skipped_blocks = 0
+        
+        names = [normalize_name(record.name) for record in records]
+        grams = [trigrams(name) if name else set() for name in names]
+        numbers = [name_numbers(name) for name in names]
+        
+        # 1) place_id ortaksa kesin olarak aynı işletme
+        place_blocks = defaultdict(list)
+        # 2) telefon / alan adı ortaksa isim benzerliğiyle doğrula
+        # (sosyal medya ve platform adresleri birçok işletmede ortak olduğundan anahtar sayılmaz)
+        key_blocks = defaultdict(list)
+        domains = get_domain_index()
+        for index, record in enumerate(records):
+            if record.place_id:
+                place_blocks[record.place_id].append(index)
+            phone = normalize_phone(record.phone)
+            if phone:
+                key_blocks[('phone', phone)].append(index)
+            domain = record.domain or registrable_domain(record.website)
+            if domain and domains.is_business(domain):
+                key_blocks[('domain', domain)].append(index)
+                
+        for members in place_blocks.values():
+            for other in members[1:]:
+                sets.union(members[0], other)
+                
+        for members in key_blocks.values():
+            if len(members) < 2:
+                continue
+            if len(members) > self.max_block_size:
+                skipped_blocks += 1
+                continue
+            for position, first in enumerate(members):
+                for second in members[position + 1:]:
+                    if sets.find(first) == sets.find(second):
+                        continue
+                    comparisons += 1
+                    # İsimlerden biri yoksa ortak anahtar yeterli kabul edilir
+                    if not grams[first] or not grams[second]:
+                        sets.union(first, second)
+                    elif numbers[first] == numbers[second] and \
+                            jaccard(grams[first], grams[second]) >= self.key_name_threshold:
+                        sets.union(first, second)
+                        
+        # 3) Aynı ilçede benzer isim: nadir trigram önekleriyle bloklama
+        frequency = defaultdict(int)
+        for gram_set in grams:
+            for gram in gram_set:
+                frequency[gram] += 1
+        # Tüm kayıtlar için aynı toplam sıra: önce nadir trigramlar
+        rank = {gram: position for position, gram in
+                enumerate(sorted(frequency, key=lambda gram: (frequency[gram], gram)))}
+                
+        name_blocks = defaultdict(list)
+        for index, gram_set in enumerate(grams):
+            if not gram_set:
+                continue
+            district = extract_district(records[index].address)
+            ordered = sorted(gram_set, key=rank.__getitem__)
+            prefix_length = len(ordered) - math.ceil(self.name_threshold * len(ordered)) + 1
+            for gram in ordered[:prefix_length]:
+                name_blocks[(district, numbers[index], gram)].append(index)
+                
+        for members in name_blocks.values():
+            if len(members) < 2:
+                continue
+            if len(members) > self.max_block_size:
+                skipped_blocks += 1
+                continue
+            for position, first in enumerate(members):
+                for second in members[position + 1:]:
+                    if sets.find(first) == sets.find(second):
+                        continue
+                    comparisons += 1
+                    if jaccard(grams[first], grams[second]) >= self.name_threshold:
+                        sets.union(first, second)
+                        
+        groups = defaultdict(list)
+        for index in range(count):
+            groups[sets.find(index)].append(index)
+            
+        self.stats = {
+            "comparisons": comparisons,
+            "skipped_blocks": skipped_blocks,
+        }
+        return list(groups.values())
+        
+    def deduplicate(self, records):
+        """
+        Mükerrer kayıtları birleştirerek tekil kayıt listesi döndürür
+        
+        Args:
+            records: BusinessRecord listesi
+            
+        Returns:
+            list: Birleştirilmiş BusinessRecord listesi (ilk görülme sırasıyla)
+        """
+        started = time.perf_counter()
+        records = list(records)
+        groups = self.find_groups(records)
+        groups.sort(key=lambda group: group[0])
+        merged = [merge_records([records[index] for index in group]) for group in groups]
+        
+        self.stats.update({
+            "input": len(records),
+            "output": len(merged),
+            "merged_groups": sum(1 for group in groups if len(group) > 1),
+            "seconds": time.perf_counter() - started,
+        })
+        if len(merged) < len(records):
+            self.update_status(
+                f"Mükerrer kayıt: {len(records)} kayıt {len(merged)} işletmeye birleştirildi "
+                f"({self.stats['seconds']:.2f} sn)"
+            )
+        return merged
\ No newline at end of file
@@ -0,0 +1,224 @@
+"""
+Chromedriver çözümleme önbelleği ve paylaşılan servis yönetimi
+"""
+import os
+import json
+import time
+import atexit
+import threading
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+from selenium.common.exceptions import SessionNotCreatedException
+
+from .config import DRIVER_CONFIG
+
+_lock = threading.Lock()
+_resolved_paths = None     # Bu süreçte çözümlenmiş yollar (diskteki önbelleğin bellek kopyası)
+_shared_service = None     # Tüm oturumların paylaştığı chromedriver servisi
+
+def _load_cache():
+    """Diskteki sürücü yolu önbelleğini okur, geçersizse None döner"""
+    cache_file = DRIVER_CONFIG['cache_file']
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+        
+    max_age = DRIVER_CONFIG['cache_ttl_hours'] * 3600
+    if time.time() - cache.get('resolved_at', 0) > max_age:
+        return None
+        
+    driver_path = cache.get('driver_path')
+    browser_path = cache.get('browser_path')
+    if not driver_path or not os.path.isfile(driver_path):
+        return None
+    if browser_path and not os.path.isfile(browser_path):
+        return None
+        
+    return cache
+
+def _save_cache(paths):
+    """Çözümlenen sürücü yollarını diske yazar"""
+    cache_file = DRIVER_CONFIG['cache_file']
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(paths, f)
+    except OSError:
+        pass
+
+def _resolve_with_selenium_manager(options):
+    """Selenium Manager ile sürücü (ve gerekiyorsa tarayıcı) yolunu çözümler"""
+    from selenium.webdriver.common.selenium_manager import SeleniumManager
+    
+    result = SeleniumManager().driver_location(options)
+    
+    # Selenium sürümüne göre yalnızca yol ya da yol sözlüğü dönebilir
+    if isinstance(result, dict):
+        return {
+            'driver_path': result.get('driver_path'),
+            'browser_path': result.get('browser_path') or None,
+        }
+    return {
+        'driver_path': result,
+        'browser_path': getattr(options, 'binary_location', None) or None,
+    }
+
+def resolve_driver_paths(options, force=False):
+    """
+    Chromedriver ve Chrome yollarını önbellekten ya da Selenium Manager ile çözümler
+    
+    Aynı süreçte birden fazla tarayıcı başlatılsa da yavaş çözümleme yalnızca bir kez yapılır.
+    
+    Args:
+        options: ChromeOptions nesnesi
+        force: Önbelleği yok sayıp yeniden çözümle
+        
+    Returns:
+        dict: driver_path ve browser_path anahtarlı sözlük
+    """
+    global _resolved_paths
+    
+    with _lock:
+        if DRIVER_CONFIG.get('driver_path'):
+            return {'driver_path': DRIVER_CONFIG['driver_path'], 'browser_path': None}
+            
+        if not force:
+            if _resolved_paths:
+                return _resolved_paths
+            cached = _load_cache()
+            if cached:
+                _resolved_paths = cached
+                return cached
+                
+        paths = _resolve_with_selenium_manager(options)
+        paths['resolved_at'] = time.time()
+        _save_cache(paths)
+        _resolved_paths = paths
+        return paths
+
+def invalidate_cache():
+    """Bellekteki ve diskteki sürücü yolu önbelleğini siler"""
+    global _resolved_paths
+    
+    with _lock:
+        _resolved_paths = None
+        try:
+            os.remove(DRIVER_CONFIG['cache_file'])
+        except OSError:
+            pass
+
+def get_shared_service(driver_path):
+    """
+    Paylaşılan chromedriver servisini döndürür, çalışmıyorsa başlatır
+    
+    Args:
+        driver_path: Chromedriver yolu
+        
+    Returns:
+        Service: Çalışan chromedriver servisi
+    """
+    global _shared_service
+    
+    with _lock:
+        if _shared_service is not None and _shared_service.is_connectable():
+            return _shared_service
+            
+        if _shared_service is not None:
+            try:
+                _shared_service.stop()
+            except Exception:
+                pass
+                
+        service = Service(executable_path=driver_path)
+        service.start()
+        _shared_service = service
+        return service
+
+def stop_shared_service():
+    """Paylaşılan chromedriver servisini durdurur"""
+    global _shared_service
+    
+    with _lock:
+        if _shared_service is not None:
+            try:
+                _shared_service.stop()
+            except Exception:
+                pass
+            _shared_service = None
+
+atexit.register(stop_shared_service)
+
+class SharedServiceChrome(webdriver.Chrome):
+    """
+    Paylaşılan chromedriver servisine bağlanan Chrome sürücüsü
+    
+    webdriver.Chrome her oturum için kendi servisini başlatıp quit() ile durdurur;
+    bu sınıf çalışan servise bağlanır, quit() yalnızca oturumu kapatır. Chromium
+    komut seti (execute_cdp_cmd vb.) webdriver.Chrome ile aynıdır.
+    """
+    def __init__(self, options, service, keep_alive=True):
+        """
+        Args:
+            options: ChromeOptions nesnesi
+            service: Çalışan (paylaşılan) chromedriver servisi
+            keep_alive: HTTP bağlantısı açık tutulsun mu
+        """
+        self.vendor_prefix = "goog"
+        self.service = service
+        executor = ChromiumRemoteConnection(
+            remote_server_addr=service.service_url,
+            vendor_prefix=self.vendor_prefix,
+            browser_name=DesiredCapabilities.CHROME["browserName"],
+            keep_alive=keep_alive,
+        )
+        RemoteWebDriver.__init__(self, command_executor=executor, options=options)
+        self._is_remote = False
+        
+    def quit(self):
+        """Oturumu kapatır; paylaşılan servis diğer oturumlar için çalışmaya devam eder"""
+        try:
+            RemoteWebDriver.quit(self)
+        except Exception:
+            pass
+
+def _start_session(options, paths):
+    """Çözümlenmiş yollarla yeni bir Chrome oturumu açar"""
+    if paths.get('browser_path'):
+        options.binary_location = paths['browser_path']
+        
+    if DRIVER_CONFIG.get('shared_service', True):
+        service = get_shared_service(paths['driver_path'])
+        return SharedServiceChrome(options=options, service=service), service
+        
+    service = Service(executable_path=paths['driver_path'])
+    return webdriver.Chrome(options=options, service=service), service
+
+def create_driver(options):
+    """
+    Önbelleklenmiş sürücü yolları ve paylaşılan servis ile Chrome oturumu başlatır
+    
+    Args:
+        options: ChromeOptions nesnesi
+        
+    Returns:
+        tuple: (WebDriver, Service, başlatma süresi saniye)
+    """
+    started = time.perf_counter()
+    paths = resolve_driver_paths(options)
+    
+    try:
+        driver, service = _start_session(options, paths)
+    except SessionNotCreatedException:
+        # Chrome güncellendiyse önbellekteki sürücü uyumsuz kalabilir, bir kez yeniden çözümle
+        invalidate_cache()
+        stop_shared_service()
+        paths = resolve_driver_paths(options, force=True)
+        driver, service = _start_session(options, paths)
+        
+    return driver, service, time.perf_counter() - started
\ No newline at end of file
@@ -0,0 +1,280 @@
+"""
+Yapılandırılmış olay yolu (event bus) - metin durum mesajlarının yerine
+"""
+import sys
+import time
+import queue
+import logging
+import threading
+from collections import Counter, deque
+
+# Seviyeler logging ile aynı değerleri kullanır
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+
+# Olay türleri
+STATUS = "status"                      # Serbest metin durum mesajı (eski update_status çağrıları)
+PROGRESS = "progress"                  # İlerleme: value, total
+PAGE_LOADED = "page_loaded"            # Sayfa yüklendi: url, seconds
+BUSINESS_STARTED = "business_started"  # İşletme işlenmeye başladı: name, index, total
+BUSINESS_FINISHED = "business_finished"  # İşletme tamamlandı: record, seconds
+FIELD_FOUND = "field_found"            # Alan bulundu: field, value, source
+RETRY = "retry"                        # Geçici hata sonrası yeniden deneme: error_kind, attempt, error
+ERROR_EVENT = "error"                  # Hata: error
+DROPPED = "dropped"                    # Yoğunluk nedeniyle atlanan olayların özeti: count, details
+
+# Yoğunlukta bile atlanmayan olaylar (kayıt taşıyanlar)
+ESSENTIAL_KINDS = frozenset((BUSINESS_FINISHED,))
+
+class Event:
+    """
+    Tek bir olay
+    
+    Mesaj metni, şablon ve yük (payload) verisinden yalnızca ilk okunduğunda
+    oluşturulur; kimse okumazsa biçimlendirme maliyeti oluşmaz.
+    """
+    __slots__ = ('kind', 'level', 'timestamp', 'template', 'payload', '_message')
+    
+    def __init__(self, kind, template, level=INFO, payload=None, timestamp=None):
+        """
+        Args:
+            kind: Olay türü (ör. FIELD_FOUND)
+            template: str.format şablonu (ör. "Telefon bulundu: {value}")
+            level: Seviye (DEBUG, INFO, WARNING, ERROR)
+            payload: Şablon ve tüketiciler için alanlar
+            timestamp: Olay zamanı (epoch saniyesi, None = şimdi)
+        """
+        self.kind = kind
+        self.level = level
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.template = template
+        self.payload = payload or {}
+        self._message = None
+        
+    @property
+    def message(self):
+        """Biçimlendirilmiş mesaj (ilk erişimde oluşturulur)"""
+        if self._message is None:
+            try:
+                self._message = self.template.format(**self.payload)
+            except (KeyError, IndexError, ValueError):
+                self._message = self.template
+        return self._message
+        
+    @property
+    def level_name(self):
+        return logging.getLevelName(self.level)
+        
+    def format_line(self):
+        """Günlük satırı: zaman, seviye ve mesaj"""
+        stamp = time.strftime('%H:%M:%S', time.localtime(self.timestamp))
+        return f"{stamp} [{self.level_name}] {self.message}"
+        
+    def __str__(self):
+        return self.message
+        
+    def __repr__(self):
+        return f"Event(kind={self.kind!r}, level={self.level_name}, payload={self.payload!r})"
+
+class EventBus:
+    """
+    Olayları abonelere dağıtan yol
+    
+    Her abone bir seviye eşiği ve isteğe bağlı tür kümesiyle kaydolur. Hiçbir
+    abonenin istemediği olaylar için Event nesnesi bile oluşturulmaz. Abone
+    hataları yayını durdurmaz. Tür başına olay sayıları counts'ta tutulur.
+    """
+    def __init__(self):
+        self.subscriptions = ()          # (handler, min_level, kinds) demetleri (yazarken kopyalanır)
+        self.min_level = ERROR + 1       # Abonelerin en düşük eşiği
+        self.counts = Counter()
+        self.lock = threading.Lock()
+        
+    @classmethod
+    def for_callback(cls, update_status_callback):
+        """
+        Eski update_status_callback'e mesaj ileten yol oluşturur
+        
+        Args:
+            update_status_callback: Mesaj metniyle çağrılacak fonksiyon (None = abonesiz yol)
+            
+        Returns:
+            EventBus: Olay yolu
+        """
+        bus = cls()
+        if update_status_callback:
+            bus.subscribe(lambda event: update_status_callback(event.message))
+        return bus
+        
+    def subscribe(self, handler, min_level=INFO, kinds=None):
+        """
+        Aboneyi kaydeder
+        
+        Args:
+            handler: Event ile çağrılacak fonksiyon (yayını yapan iş parçacığında çağrılır)
+            min_level: Bu seviyenin altındaki olaylar iletilmez
+            kinds: Yalnızca bu türler iletilir (None = hepsi)
+            
+        Returns:
+            Abonelik anahtarı (unsubscribe için)
+        """
+        subscription = (handler, min_level, frozenset(kinds) if kinds else None)
+        with self.lock:
+            self.subscriptions = self.subscriptions + (subscription,)
+            self.min_level = min(s[1] for s in self.subscriptions)
+        return subscription
+        
+    def unsubscribe(self, subscription):
+        """Aboneliği kaldırır"""
+        with self.lock:
+            self.subscriptions = tuple(s for s in self.subscriptions if s is not subscription)
+            self.min_level = min((s[1] for s in self.subscriptions), default=ERROR + 1)
+            
+    def wants(self, level):
+        """Bu seviyede bir olayı dinleyen abone var mı"""
+        return level >= self.min_level
+        
+    def emit(self, kind, template, level=INFO, **payload):
+        """
+        Olay yayınlar
+        
+        Args:
+            kind: Olay türü
+            template: Mesaj şablonu (yük alanlarıyla str.format)
+            level: Seviye
+            **payload: Olay alanları
+            
+        Returns:
+            Event: Yayınlanan olay (dinleyen yoksa None)
+        """
+        self.counts[kind] += 1
+        if level < self.min_level:
+            return None
+            
+        event = Event(kind, template, level, payload)
+        for handler, min_level, kinds in self.subscriptions:
+            if level < min_level or (kinds is not None and kind not in kinds):
+                continue
+            try:
+                handler(event)
+            except Exception:
+                pass
+        return event
+        
+    def status(self, message, level=INFO):
+        """Serbest metin durum mesajı (update_status_callback yerine kullanılabilir)"""
+        return self.emit(STATUS, "{message}", level, message=message)
+        
+    def debug(self, template, **payload):
+        """Ayrıntı mesajı; dinleyen yoksa şablon hiç biçimlendirilmez"""
+        return self.emit(STATUS, template, DEBUG, **payload)
+        
+    def warning(self, template, **payload):
+        """Uyarı düzeyinde durum mesajı (hata sayacını artırmaz)"""
+        return self.emit(STATUS, template, WARNING, **payload)
+        
+    def error(self, template, **payload):
+        """Hata olayı"""
+        return self.emit(ERROR_EVENT, template, ERROR, **payload)
+
+class QueueSubscriber:
+    """
+    Olayları başka bir iş parçacığına (ör. arayüz) taşıyan sınırlı kuyruk abonesi
+    
+    Kuyruk dolduğunda WARNING altındaki olaylar atlanır ve drain sırasında tek
+    bir DROPPED özet olayı olarak bildirilir. Birleştirilen türlerde (ör.
+    ilerleme) yalnızca son olay tutulur. Önemli olaylar (kayıt taşıyanlar ve
+    uyarılar) için en fazla put_timeout kadar beklenir; tüketici yine
+    yetişemezse bunlar ek listede tutulur, yayını yapan iş parçacığı bloklanmaz.
+    """
+    def __init__(self, maxsize=10000, drop_below=WARNING, coalesce=(PROGRESS,), put_timeout=0.2):
+        """
+        Args:
+            maxsize: Kuyruk kapasitesi
+            drop_below: Kuyruk doluyken bu seviyenin altındaki olaylar atlanır
+            coalesce: Yalnızca son olayı tutulan türler
+            put_timeout: Kuyruk doluyken önemli bir olay için en uzun bekleme (saniye)
+        """
+        self.queue = queue.Queue(maxsize)
+        self.drop_below = drop_below
+        self.coalesce = frozenset(coalesce)
+        self.put_timeout = put_timeout
+        self.latest = {}
+        self.dropped = Counter()
+        self.overflow = deque()   # Kuyruğa sığmayan önemli olaylar (sıra korunarak drain'de verilir)
+        self.lock = threading.Lock()
+        
+    def __call__(self, event):
+        if event.kind in self.coalesce:
+            with self.lock:
+                self.latest[event.kind] = event
+            return
+        droppable = event.level < self.drop_below and event.kind not in ESSENTIAL_KINDS
+        if self.overflow:
+            # Ek liste boşalana kadar önemli olaylar sırayı korumak için oraya eklenir
+            with self.lock:
+                if droppable:
+                    self.dropped[event.kind] += 1
+                else:
+                    self.overflow.append(event)
+            return
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            if droppable:
+                with self.lock:
+                    self.dropped[event.kind] += 1
+                return
+            try:
+                # Önemli olaylar için tüketiciye kısa bir süre tanı
+                self.queue.put(event, timeout=self.put_timeout)
+            except queue.Full:
+                with self.lock:
+                    self.overflow.append(event)
+                    
+    def drain(self, max_items=None):
+        """
+        Bekleyen olayları alır
+        
+        Args:
+            max_items: En fazla alınacak olay sayısı (None = hepsi)
+            
+        Returns:
+            tuple: (olay listesi, kuyrukta olay kaldı mı)
+        """
+        events = []
+        backlog = False
+        try:
+            while max_items is None or len(events) < max_items:
+                events.append(self.queue.get_nowait())
+            backlog = True
+        except queue.Empty:
+            pass
+            
+        with self.lock:
+            if not backlog:
+                while self.overflow and (max_items is None or len(events) < max_items):
+                    events.append(self.overflow.popleft())
+                backlog = bool(self.overflow)
+            latest, self.latest = self.latest, {}
+            dropped, self.dropped = self.dropped, Counter()
+        events.extend(latest.values())
+        if dropped:
+            details = ", ".join(f"{kind}: {count}" for kind, count in dropped.most_common())
+            events.append(Event(DROPPED, "Yoğunluk nedeniyle {count} olay atlandı ({details})", WARNING,
+                                {"count": sum(dropped.values()), "details": details}))
+        return events, backlog
+
+class ConsoleSubscriber:
+    """Olayları satır satır akışa (varsayılan stdout) yazan abone"""
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.lock = threading.Lock()
+        
+    def __call__(self, event):
+        line = event.format_line()
+        with self.lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
\ No newline at end of file
@@ -3,20 +3,24 @@ Adres bilgisi çıkarma modülü
 """
 import re
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import StaleElementReferenceException
 from ..config import CSS_SELECTORS
+from ..events import EventBus, FIELD_FOUND
 
 class AddressExtractor:
     """
     Adres bilgisi çıkarma sınıfı
     """
-    def __init__(self, browser, update_status_callback=None):
+    def __init__(self, browser, update_status_callback=None, event_bus=None):
         """
         Args:
             browser: BrowserManager nesnesi
             update_status_callback: Durum güncellemesi yapacak callback fonksiyonu
+            event_bus: Bulunan alanların yayınlanacağı olay yolu (None = callback'e ileten yol)
         """
         self.browser = browser
         self.update_status = update_status_callback or (lambda msg: None)
+        self.events = event_bus or EventBus.for_callback(update_status_callback)
     
     def extract_address(self):
         """
@@ -37,16 +41,21 @@ class AddressExtractor:
                 aria_label = addr_elem.get_attribute('aria-label')
                 if aria_label and ('adres' in aria_label.lower() or 'konum' in aria_label.lower()):
                     address = aria_label.replace('Adres: ', '').strip()
-                    self.update_status(f"Adres bulundu (aria-label): {address}")
+                    self.events.emit(FIELD_FOUND, "Adres bulundu ({source}): {value}",
+                                     field="address", source="aria-label", value=address)
                     break
                     
                 # Seçenek 2: Element metni
                 text = addr_elem.text
                 if text and len(text) > 10:  # Basit adres kontrolü
                     address = text
-                    self.update_status(f"Adres bulundu (metin): {address}")
+                    self.events.emit(FIELD_FOUND, "Adres bulundu ({source}): {value}",
+                                     field="address", source="metin", value=address)
                     break
-            except:
+            except StaleElementReferenceException:
+                # Panel yeniden çizildi, çıkarımın tamamı yeniden denenecek
+                raise
+            except Exception:
                 continue
         
         # Yöntem 2: Adres ikonuyla ilişkili buttonlar
@@ -62,11 +71,12 @@ class AddressExtractor:
                         text = btn.text.strip()
                         if text and len(text) > 10:  # Basit adres kontrolü
                             address = text
-                            self.update_status(f"Adres bulundu (adres butonu): {address}")
+                            self.events.emit(FIELD_FOUND, "Adres bulundu ({source}): {value}",
+                                             field="address", source="adres butonu", value=address)
                             break
-                    except:
+                    except Exception:
                         continue
-            except:
+            except Exception:
                 pass
         
         # Yöntem 3: data-item-id özniteliği içeren elementler
@@ -82,11 +92,12 @@ class AddressExtractor:
                         text = item.text.strip()
                         if text and len(text) > 10:  # Basit adres kontrolü
                             address = text
-                            self.update_status(f"Adres bulundu (data-item-id): {address}")
+                            self.events.emit(FIELD_FOUND, "Adres bulundu ({source}): {value}",
+                                             field="address", source="data-item-id", value=address)
                             break
-                    except:
+                    except Exception:
                         continue
-            except:
+            except Exception:
                 pass
         
         # Yöntem 4: Konum ikonları ve benzer içerikli butonlar
@@ -100,11 +111,12 @@ class AddressExtractor:
                         text = btn.text.strip()
                         if text and len(text) > 10:  # Basit adres kontrolü
                             address = text
-                            self.update_status(f"Adres bulundu (konum ikonu): {address}")
+                            self.events.emit(FIELD_FOUND, "Adres bulundu ({source}): {value}",
+                                             field="address", source="konum ikonu", value=address)
                             break
-                    except:
+                    except Exception:
                         continue
-            except:
+            except Exception:
                 pass
         
         # Yöntem 5: Google Maps URL'inden konum bilgisini çıkarma
@@ -119,8 +131,9 @@ class AddressExtractor:
                     place_name = re.sub(r'%\d\w', ' ', place_name)
                     if len(place_name) > 5:
                         address = place_name
-                        self.update_status(f"Adres bulundu (URL'den): {address}")
-            except:
+                        self.events.emit(FIELD_FOUND, "Adres bulundu ({source}): {value}",
+                                         field="address", source="URL'den", value=address)
+            except Exception:
                 pass
         
         return address
\ No newline at end of file
@@ -8,6 +8,12 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from ..config import CSS_SELECTORS
+from ..retry import call_with_retry, classify_exception
+from ..metrics import EMAILS_PER_SITE
+from ..tracing import tracer
+from ..models import BusinessRecord
+from ..events import EventBus, DEBUG, WARNING, STATUS, FIELD_FOUND, ERROR_EVENT
+from utils.domain_index import get_domain_index
 from .phone_extractor import PhoneExtractor
 from .address_extractor import AddressExtractor
 from .email_extractor import EmailExtractor
@@ -16,19 +22,21 @@ class BusinessInfoExtractor:
     """
     İşletme detay sayfasından bilgileri çıkaran sınıf
     """
-    def __init__(self, browser, update_status_callback=None):
+    def __init__(self, browser, update_status_callback=None, event_bus=None):
         """
         Args:
             browser: BrowserManager nesnesi
             update_status_callback: Durum güncellemesi yapacak callback fonksiyonu
+            event_bus: Bulunan alanların ve hataların yayınlanacağı olay yolu (None = callback'e ileten yol)
         """
         self.browser = browser
         self.update_status = update_status_callback or (lambda msg: None)
+        self.events = event_bus or EventBus.for_callback(update_status_callback)
         
         # Alt çıkarıcılar
-        self.phone_extractor = PhoneExtractor(browser, update_status_callback)
-        self.address_extractor = AddressExtractor(browser, update_status_callback)
-        self.email_extractor = EmailExtractor(browser, update_status_callback)
+        self.phone_extractor = PhoneExtractor(browser, update_status_callback, self.events)
+        self.address_extractor = AddressExtractor(browser, update_status_callback, self.events)
+        self.email_extractor = EmailExtractor(browser, update_status_callback, self.events)
         
         # Veri toplama seçenekleri
         self.data_options = {
@@ -53,25 +61,25 @@ class BusinessInfoExtractor:
         İşletme detay sayfasından bilgileri çıkartır
         
         Returns:
-            dict: İşletme bilgileri
+            BusinessRecord: İşletme bilgileri (bulunamayan alanlar None)
         """
-        business_info = {}
-        
-        # Current URL (detay sayfası)
+        # Current URL (detay sayfası) - işletme kimliği ve konum buradan çıkarılır
         try:
-            business_info['Detay_URL'] = self.browser.driver.current_url
-        except:
-            business_info['Detay_URL'] = "Alınamadı"
+            detail_url = self.browser.driver.current_url
+        except Exception:
+            detail_url = None
+        record = BusinessRecord(detail_url=detail_url)
         
         # İşletme adı - Geliştirilmiş yöntem
         try:
-            business_name = self._extract_business_name()
+            with tracer.span("extract.name"):
+                business_name = self._extract_business_name()
             if business_name and not business_name.strip().startswith("http") and business_name != "Sonuçlar":
-                business_info['İsim'] = business_name
+                record.name = business_name
             else:
                 # URL'den işletme adı çıkarma yöntemi
                 try:
-                    url = business_info['Detay_URL']
+                    url = detail_url or ""
                     if '/place/' in url:
                         # URL'den işletme adını çıkar
                         place_match = re.search(r'/place/([^/]+)', url)
@@ -83,90 +91,94 @@ class BusinessInfoExtractor:
                             url_name = url_name.strip()
                             
                             if url_name and len(url_name) > 3:
-                                business_info['İsim'] = url_name
-                                self.update_status(f"İşletme adı URL'den alındı: {url_name}")
-                            else:
-                                business_info['İsim'] = "İsimsiz İşletme"
-                        else:
-                            business_info['İsim'] = "İsimsiz İşletme"
-                    else:
-                        business_info['İsim'] = "İsimsiz İşletme"
-                except:
-                    business_info['İsim'] = "İsimsiz İşletme"
+                                record.name = url_name
+                                self.events.emit(FIELD_FOUND, "İşletme adı URL'den alındı: {value}",
+                                                 field="name", source="URL", value=url_name)
+                except Exception:
+                    pass
         except Exception as e:
-            business_info['İsim'] = "İsimsiz İşletme"
-            self.update_status(f"İsim alınamadı: {str(e)}")
+            self.events.emit(ERROR_EVENT, "İsim alınamadı: {error}", WARNING, field="name", error=str(e))
         
         # Adres için arama (eğer seçildiyse)
-        business_info['Adres'] = "Bulunamadı"
         if self.data_options.get('collect_address', True):
             try:
-                address = self.address_extractor.extract_address()
-                business_info['Adres'] = address if address else "Bulunamadı"
+                with tracer.span("extract.address"):
+                    address = call_with_retry(
+                        "extractor.address", self.address_extractor.extract_address, policy="extract",
+                        sleep=self.browser.sleep
+                    )
+                record.address = address or None
             except Exception as e:
-                self.update_status(f"Adres bulma hatası: {str(e)}")
+                self.events.emit(ERROR_EVENT, "Adres bulma hatası: {error}", WARNING, field="address", error=str(e))
         else:
-            self.update_status("Adres toplamak seçilmedi, atlanıyor")
+            self.events.emit(STATUS, "Adres toplamak seçilmedi, atlanıyor", DEBUG)
         
         # Telefon numarası için arama (eğer seçildiyse)
-        business_info['Telefon'] = "Bulunamadı"
         if self.data_options.get('collect_phone', True):
             try:
-                phone = self.phone_extractor.extract_phone_number()
-                business_info['Telefon'] = phone if phone else "Bulunamadı"
+                with tracer.span("extract.phone"):
+                    phone = call_with_retry(
+                        "extractor.phone", self.phone_extractor.extract_phone_number, policy="extract",
+                        sleep=self.browser.sleep
+                    )
+                record.phone = phone or None
             except Exception as e:
-                self.update_status(f"Telefon bulma hatası: {str(e)}")
+                self.events.emit(ERROR_EVENT, "Telefon bulma hatası: {error}", WARNING, field="phone", error=str(e))
         else:
-            self.update_status("Telefon toplamak seçilmedi, atlanıyor")
-        
-        # Website ve e-posta işlemleri
-        business_info['Website'] = "Bulunamadı"
-        business_info['E-postalar'] = "Bulunamadı"
+            self.events.emit(STATUS, "Telefon toplamak seçilmedi, atlanıyor", DEBUG)
         
         # Website ara (eğer seçildiyse)
         website = None
         if self.data_options.get('collect_website', True):
             try:
-                website = self._extract_website_direct()
+                # _extract_website_direct hataları kendi içinde ele alır ve tıklamayla pencere
+                # açabildiğinden yeniden deneme politikasıyla sarılmaz
+                with tracer.span("extract.website"):
+                    website = self._extract_website_direct()
                 
                 # Website bulunamadıysa veya geçersizse
                 if not website:
-                    self.update_status("İşletmeye ait website bulunamadı")
-                    business_info['Website'] = "Bulunamadı"
+                    self.events.debug("İşletmeye ait website bulunamadı")
                 else:
                     # URL'nin geçerliliğini kontrol et
                     valid_website = self._validate_website_url(website)
                     
                     if valid_website:
-                        business_info['Website'] = website
-                        self.update_status(f"Geçerli website bulundu: {website}")
+                        record.website = website
+                        self.events.emit(FIELD_FOUND, "Geçerli website bulundu: {value}",
+                                         field="website", source="doğrulama", value=website)
                     else:
-                        business_info['Website'] = "Bulunamadı"
-                        self.update_status("Bulunan website geçerli değil")
+                        self.events.debug("Bulunan website geçerli değil")
             except Exception as e:
-                self.update_status(f"Website arama hatası: {str(e)}")
+                self.events.emit(ERROR_EVENT, "Website arama hatası: {error}", WARNING, field="website", error=str(e))
         else:
-            self.update_status("Website toplamak seçilmedi, atlanıyor")
+            self.events.emit(STATUS, "Website toplamak seçilmedi, atlanıyor", DEBUG)
             
         # E-posta ara (eğer seçildiyse ve geçerli bir website bulunduysa)
-        if self.data_options.get('collect_email', True) and website and business_info['Website'] != "Bulunamadı":
+        if self.data_options.get('collect_email', True) and record.website:
             try:
                 # E-posta toplama
-                emails = self.email_extractor.extract_emails_from_website(website)
-                business_info['E-postalar'] = '; '.join(emails) if emails else "Bulunamadı"
+                with tracer.span("extract.emails", website=website):
+                    emails = self.email_extractor.extract_emails_from_website(website)
+                record.emails = list(emails) if emails else []
+                EMAILS_PER_SITE.observe(len(record.emails))
+                if record.emails:
+                    self.events.emit(FIELD_FOUND, "{count} e-posta bulundu: {value}", field="emails",
+                                     source="website", value=", ".join(record.emails), count=len(record.emails))
             except Exception as email_err:
-                self.update_status(f"E-posta toplama hatası: {str(email_err)}")
-                business_info['E-postalar'] = "Hata: Toplanamadı"
+                self.events.emit(ERROR_EVENT, "E-posta toplama hatası: {error}", WARNING, field="emails",
+                                 error=str(email_err), error_kind=classify_exception(email_err))
+                record.email_error = True
         else:
             if not self.data_options.get('collect_email', True):
-                self.update_status("E-posta toplamak seçilmedi, atlanıyor")
-            elif not website or business_info['Website'] == "Bulunamadı":
-                self.update_status("Website bulunamadığı için e-posta araması yapılmıyor")
+                self.events.emit(STATUS, "E-posta toplamak seçilmedi, atlanıyor", DEBUG)
+            elif not record.website:
+                self.events.debug("Website bulunamadığı için e-posta araması yapılmıyor")
         
         # Zaman damgası ekle
-        business_info['Tarih'] = time.strftime('%Y-%m-%d %H:%M:%S')
+        record.timestamp = time.time()
         
-        return business_info
+        return record
     
     def _validate_website_url(self, url):
         """
@@ -179,23 +191,18 @@ class BusinessInfoExtractor:
             bool: URL geçerliyse True, değilse False
         """
         if not url or not isinstance(url, str) or len(url) < 5:
-            self.update_status(f"Çok kısa veya geçersiz URL: {url}")
+            self.events.debug("Çok kısa veya geçersiz URL: {url}", url=url)
             return False
             
         # http ile başlamayı kontrol et
         if not url.startswith('http'):
-            self.update_status(f"URL http ile başlamıyor: {url}")
+            self.events.debug("URL http ile başlamıyor: {url}", url=url)
             return False
             
-        # Yasaklı domainleri kontrol et
-        excluded_domains = [
-            'google.com', 'goo.gl', 'youtube.com', 'facebook.com', 'instagram.com',
-            'twitter.com', 'linkedin.com', 'maps.app.goo.gl', 'yelp.com', 'tripadvisor.com',
-            'maps.google'
-        ]
-        
-        if any(domain in url.lower() for domain in excluded_domains):
-            self.update_status(f"URL yasaklı domain içeriyor: {url}")
+        # Sosyal medya, platform ve harita adreslerini ele
+        category = get_domain_index().classify(url)
+        if category != "business":
+            self.events.debug("URL işletme sitesi değil ({category}): {url}", category=category, url=url)
             return False
             
         return True
@@ -228,9 +235,9 @@ class BusinessInfoExtractor:
                     for element in elements:
                         text = element.text.strip()
                         if text and text != "Sonuçlar" and len(text) > 2:
-                            self.update_status(f"İşletme adı bulundu (ana seçici): {text}")
+                            self.events.debug("İşletme adı bulundu (ana seçici): {value}", value=text)
                             return text
-                except:
+                except Exception:
                     continue
             
             # Google Maps panelindeki bilgilerden başlık elementini ara
@@ -249,9 +256,9 @@ class BusinessInfoExtractor:
                     for element in elements:
                         text = element.text.strip()
                         if text and text != "Sonuçlar" and len(text) > 2:
-                            self.update_status(f"İşletme adı bulundu (panel): {text}")
+                            self.events.debug("İşletme adı bulundu (panel): {value}", value=text)
                             return text
-                except:
+                except Exception:
                     continue
             
             # Son çare: sayfa başlığı
@@ -261,11 +268,11 @@ class BusinessInfoExtractor:
                 if " - Google" in page_title:
                     name = page_title.split(" - Google")[0].strip()
                     if name and len(name) > 2:
-                        self.update_status(f"İşletme adı sayfa başlığından alındı: {name}")
+                        self.events.debug("İşletme adı sayfa başlığından alındı: {value}", value=name)
                         return name
         
         except Exception as e:
-            self.update_status(f"İşletme adı çıkarma hatası: {str(e)}")
+            self.events.warning("İşletme adı çıkarma hatası: {error}", error=e)
             
         return None
     
@@ -288,13 +295,13 @@ class BusinessInfoExtractor:
                             href = elem.get_attribute('href')
                             if href and href.startswith('http'):
                                 website = href
-                                self.update_status(f"Website bulundu (seçici): {website}")
+                                self.events.debug("Website bulundu (seçici): {value}", value=website)
                                 return website
-                        except:
+                        except Exception:
                             continue
-                except:
+                except Exception:
                     continue
-        except:
+        except Exception:
             pass
         
         # Yöntem 2: Web sitesi açıkça belirtilen tüm elementleri ara
@@ -308,7 +315,7 @@ class BusinessInfoExtractor:
                     By.CSS_SELECTOR, 
                     "button[data-item-id='authority'], a[data-item-id='authority'], a[aria-label*='web'], button[aria-label*='web']"
                 ))
-            except:
+            except Exception:
                 pass
                 
             # XPath ile alternatif arama
@@ -317,7 +324,7 @@ class BusinessInfoExtractor:
                     By.XPATH, 
                     "//button[contains(text(), 'Web') or contains(., 'Site') or contains(@aria-label, 'web')]"
                 ))
-            except:
+            except Exception:
                 pass
                 
             # Her bulunan eleman için tıklama/içerik çıkarma dene
@@ -327,21 +334,26 @@ class BusinessInfoExtractor:
                     href = elem.get_attribute('href')
                     if href and href.startswith('http'):
                         website = href
-                        self.update_status(f"Website doğrudan bulundu: {website}")
+                        self.events.debug("Website doğrudan bulundu: {value}", value=website)
                         return website
                     
-                    # Yok ve tıklanabilirse tıkla
-                    elem.click()
-                    self.browser.random_sleep(1, 2)
+                    # Yok ve tıklanabilirse tıkla - başarı yeni pencerenin açılmasıyla doğrulanır
+                    # (ön yükleme sekmeleri ve liste sekmesi de açık olduğundan yalnızca tıklamayla
+                    # açılan pencereler incelenip kapatılır)
+                    handles_before = set(self.browser.driver.window_handles)
+                    self.browser.safe_click(
+                        elem, retry_count=1, page_type="website_button",
+                        verify=lambda driver: bool(set(driver.window_handles) - handles_before)
+                    )
                     
                     # Yeni pencere açıldı mı kontrol et
-                    current_handles = self.browser.driver.window_handles
-                    if len(current_handles) > 1:
-                        # Yeni pencereye geç
+                    new_handles = [handle for handle in self.browser.driver.window_handles
+                                   if handle not in handles_before]
+                    if new_handles:
                         main_window = self.browser.driver.current_window_handle
                         
                         # Yeni açılan her pencereyi kontrol et
-                        for handle in current_handles:
+                        for handle in new_handles:
                             if handle != main_window:
                                 try:
                                     self.browser.driver.switch_to.window(handle)
@@ -353,20 +365,20 @@ class BusinessInfoExtractor:
                                     
                                     # Her koşulda yeni pencereyi kapat
                                     self.browser.driver.close()
-                                except:
+                                except Exception:
                                     pass
                         
                         # Ana pencereye geri dön
                         self.browser.driver.switch_to.window(main_window)
                         
                         if website:
-                            self.update_status(f"Website yeni pencerede bulundu: {website}")
+                            self.events.debug("Website yeni pencerede bulundu: {value}", value=website)
                             return website
-                except:
+                except Exception:
                     continue
-        except:
+        except Exception:
             pass
         
         # Website bulunamadı
-        self.update_status("Website bulunamadı")
+        self.events.debug("Website bulunamadı")
         return None
\ No newline at end of file
@@ -2,23 +2,28 @@
 E-posta çıkarma modülü - İyileştirilmiş kontrol mekanizmaları eklendi
 """
 import re
-import time
 from selenium.webdriver.common.by import By
-from urllib.parse import urlparse, urljoin
 from utils.validators import is_valid_email
+from utils.domain_index import get_domain_index
+from ..retry import call_with_retry
+from ..tracing import tracer
+from ..profiling import profiled
+from ..events import EventBus, STATUS
 
 class EmailExtractor:
     """
     E-posta çıkarma sınıfı
     """
-    def __init__(self, browser, update_status_callback=None):
+    def __init__(self, browser, update_status_callback=None, event_bus=None):
         """
         Args:
             browser: BrowserManager nesnesi
             update_status_callback: Durum güncellemesi yapacak callback fonksiyonu
+            event_bus: Durum ve hata mesajlarının yayınlanacağı olay yolu (None = callback'e ileten yol)
         """
         self.browser = browser
         self.update_status = update_status_callback or (lambda msg: None)
+        self.events = event_bus or EventBus.for_callback(update_status_callback)
         self.email_pattern = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
     
     def extract_emails_from_website(self, website_url):
@@ -36,23 +41,19 @@ class EmailExtractor:
         
         # İlk olarak URL'yi doğrula
         if not website_url or not isinstance(website_url, str) or not website_url.startswith('http'):
-            self.update_status("Geçersiz website URL'si. E-posta araması yapılmayacak.")
+            self.events.debug("Geçersiz website URL'si. E-posta araması yapılmayacak.")
             return emails
             
-        # Genel websiteleri filtrele
-        excluded_domains = [
-            'google.com', 'goo.gl', 'youtube.com', 'facebook.com', 'instagram.com',
-            'twitter.com', 'linkedin.com', 'maps.app.goo.gl', 'yelp.com', 'tripadvisor.com'
-        ]
-        
-        # URL'yi kontrol et, yasaklı domainlerden biriyse hemen çık
-        if any(domain in website_url.lower() for domain in excluded_domains):
-            self.update_status(f"Bu URL ({website_url}) geçerli bir işletme websitesi değil, sosyal medya veya platform URL'si. E-posta araması yapılmayacak.")
+        # Sosyal medya, platform veya harita adresiyse hemen çık
+        domains = get_domain_index()
+        if not domains.is_business(website_url):
+            self.events.debug("Bu URL ({url}) geçerli bir işletme websitesi değil, sosyal medya veya platform URL'si. "
+                              "E-posta araması yapılmayacak.", url=website_url)
             return emails
         
         try:
             # Yeni pencere aç
-            self.update_status(f"Web sitesi ziyaret ediliyor: {website_url}")
+            self.events.debug("Web sitesi ziyaret ediliyor: {url}", url=website_url)
             
             # Mevcut sekmeleri kaydet
             original_handles = self.browser.driver.window_handles
@@ -67,7 +68,7 @@ class EmailExtractor:
                            if handle not in original_handles]
             
             if not new_handles:
-                self.update_status("Yeni sekme açılamadı! E-posta araması yapılmayacak.")
+                self.events.warning("Yeni sekme açılamadı! E-posta araması yapılmayacak.")
                 return emails
                 
             new_tab = new_handles[0]
@@ -77,45 +78,49 @@ class EmailExtractor:
             
             # URL'yi yükle
             try:
-                self.update_status(f"Website yükleniyor: {website_url}")
-                self.browser.driver.get(website_url)
-                self.browser.random_sleep(3, 5)  # Sayfanın yüklenmesi için daha uzun bekle
+                self.events.debug("Website yükleniyor: {url}", url=website_url)
+                with tracer.span("email.page", url=website_url, page="home"):
+                    call_with_retry("email.load_website", self.browser.get, website_url, policy="website_load",
+                                    sleep=self.browser.sleep)
+                    self.browser.random_sleep(3, 5)  # Sayfanın yüklenmesi için daha uzun bekle
+                    self.browser.collect_page_metrics("website")
+                    self.browser.snapshot_page("website")
                 
                 # Yüklenen URL'yi kontrol et - eğer başka bir URL'ye yönlendirildiyse
                 actual_url = self.browser.driver.current_url
                 if actual_url != website_url:
-                    self.update_status(f"URL yönlendirmesi algılandı: {actual_url}")
+                    self.events.debug("URL yönlendirmesi algılandı: {url}", url=actual_url)
                     
-                    # Yönlendirilen URL'de de yasaklı domainler var mı kontrol et
-                    if any(domain in actual_url.lower() for domain in excluded_domains):
-                        self.update_status(f"Yönlendirilen URL ({actual_url}) geçerli bir işletme websitesi değil.")
+                    # Yönlendirilen URL de işletme sitesi mi kontrol et
+                    if not domains.is_business(actual_url):
+                        self.events.debug("Yönlendirilen URL ({url}) geçerli bir işletme websitesi değil.", url=actual_url)
                         
                         # Sekmeyi kapat ve çık
                         self.browser.driver.close()
                         self.browser.driver.switch_to.window(original_window)
                         return emails
             except Exception as load_err:
-                self.update_status(f"Website yükleme hatası: {str(load_err)}")
+                self.events.warning("Website yükleme hatası: {error}", error=load_err)
                 
                 # Sekmeyi kapat ve çık
                 try:
                     self.browser.driver.close()
                     self.browser.driver.switch_to.window(original_window)
-                except:
+                except Exception:
                     pass
                     
                 return emails
             
             # Ana sayfadan e-posta adresleri topla
-            self.update_status("Ana sayfadaki e-postaları taranıyor...")
+            self.events.debug("Ana sayfadaki e-postaları taranıyor...")
             page_emails = self._find_emails_on_page()
             emails.extend(page_emails)
-            self.update_status(f"Ana sayfada {len(page_emails)} e-posta bulundu")
+            self.events.debug("Ana sayfada {count} e-posta bulundu", count=len(page_emails))
             
             # İletişim sayfası linkleri için özel arama
-            self.update_status("İletişim sayfaları aranıyor...")
+            self.events.debug("İletişim sayfaları aranıyor...")
             contact_links = self._find_contact_links(website_url)
-            self.update_status(f"{len(contact_links)} potansiyel iletişim sayfası bulundu")
+            self.events.debug("{count} potansiyel iletişim sayfası bulundu", count=len(contact_links))
             
             # İletişim sayfalarını ziyaret et (maksimum 2 sayfa)
             visited_pages = set([website_url.lower()])
@@ -124,32 +129,36 @@ class EmailExtractor:
             for i, link in enumerate(contact_links[:2]):  # Maksimum 2 iletişim sayfası
                 link_lower = link.lower()
                 if link_lower in visited_pages:
-                    self.update_status(f"Sayfa zaten ziyaret edildi: {link}")
+                    self.events.debug("Sayfa zaten ziyaret edildi: {url}", url=link)
                     continue
                     
                 try:
-                    self.update_status(f"İletişim sayfası ziyaret ediliyor ({i+1}/2): {link}")
-                    self.browser.driver.get(link)
-                    self.browser.random_sleep(2, 4)  # Sayfanın yüklenmesi için daha uzun bekle
+                    self.events.debug("İletişim sayfası ziyaret ediliyor ({index}/2): {url}", index=i + 1, url=link)
+                    with tracer.span("email.page", url=link, page="contact"):
+                        call_with_retry("email.load_contact", self.browser.get, link, policy="website_load",
+                                        sleep=self.browser.sleep)
+                        self.browser.random_sleep(2, 4)  # Sayfanın yüklenmesi için daha uzun bekle
+                        self.browser.collect_page_metrics("contact")
+                        self.browser.snapshot_page("contact")
                     
                     # Sayfadan e-posta topla
                     contact_emails = self._find_emails_on_page()
                     if contact_emails:
                         emails.extend(contact_emails)
-                        self.update_status(f"İletişim sayfasında {len(contact_emails)} e-posta bulundu")
+                        self.events.debug("İletişim sayfasında {count} e-posta bulundu", count=len(contact_emails))
                     else:
-                        self.update_status("Bu iletişim sayfasında e-posta bulunamadı")
+                        self.events.debug("Bu iletişim sayfasında e-posta bulunamadı")
                     
                     # Ziyaret edilen sayfaları işaretle
                     visited_pages.add(link_lower)
                     
                 except Exception as e:
-                    self.update_status(f"İletişim sayfası ziyaret hatası: {str(e)}")
+                    self.events.warning("İletişim sayfası ziyaret hatası: {error}", error=e)
                     continue
             
             # Eğer hala e-posta bulunamadıysa, diğer bağlantılara göz at
             if not emails:
-                self.update_status("Henüz e-posta bulunamadı, diğer sayfalar kontrol ediliyor...")
+                self.events.debug("Henüz e-posta bulunamadı, diğer sayfalar kontrol ediliyor...")
                 other_links = self._find_other_internal_links(website_url)
                 
                 for i, link in enumerate(other_links[:3]):  # Maksimum 3 ek sayfa
@@ -157,23 +166,27 @@ class EmailExtractor:
                         continue
                         
                     try:
-                        self.update_status(f"Ek sayfa ziyaret ediliyor ({i+1}/3): {link}")
-                        self.browser.driver.get(link)
-                        self.browser.random_sleep(1, 3)
+                        self.events.debug("Ek sayfa ziyaret ediliyor ({index}/3): {url}", index=i + 1, url=link)
+                        with tracer.span("email.page", url=link, page="other"):
+                            call_with_retry("email.load_page", self.browser.get, link, policy="website_load",
+                                            sleep=self.browser.sleep)
+                            self.browser.random_sleep(1, 3)
+                            self.browser.collect_page_metrics("other")
+                            self.browser.snapshot_page("other")
                         
                         # Sayfadan e-posta topla
                         page_emails = self._find_emails_on_page()
                         if page_emails:
                             emails.extend(page_emails)
-                            self.update_status(f"Bu sayfada {len(page_emails)} e-posta bulundu")
+                            self.events.debug("Bu sayfada {count} e-posta bulundu", count=len(page_emails))
                         else:
-                            self.update_status("Bu sayfada e-posta bulunamadı")
+                            self.events.debug("Bu sayfada e-posta bulunamadı")
                             
                         # Ziyaret edilen sayfaları işaretle
                         visited_pages.add(link.lower())
                         
                     except Exception as e:
-                        self.update_status(f"Sayfa ziyaret hatası: {str(e)}")
+                        self.events.warning("Sayfa ziyaret hatası: {error}", error=e)
                         continue
             
             # Tekrar eden e-postaları kaldır
@@ -184,12 +197,12 @@ class EmailExtractor:
             
             # Sonuç
             if emails:
-                self.update_status(f"Toplam {len(emails)} benzersiz e-posta bulundu")
+                self.events.emit(STATUS, "Toplam {count} benzersiz e-posta bulundu", count=len(emails))
             else:
-                self.update_status("Hiçbir e-posta bulunamadı")
+                self.events.status("Hiçbir e-posta bulunamadı")
                 
         except Exception as e:
-            self.update_status(f"E-posta toplama hatası: {str(e)}")
+            self.events.warning("E-posta toplama hatası: {error}", error=e)
         finally:
             # Yeni sekmeyi kapat ve ana sekmeye geri dön
             try:
@@ -200,15 +213,17 @@ class EmailExtractor:
                 self.browser.driver.switch_to.window(original_window)
                 self.browser.random_sleep(0.5, 1)
             except Exception as close_err:
-                self.update_status(f"Sekme kapatma hatası: {str(close_err)}")
+                self.events.warning("Sekme kapatma hatası: {error}", error=close_err)
                 # Kritik durum - pencere değiştirmeyi zorla
                 try:
                     self.browser.driver.switch_to.window(original_window)
-                except:
+                except Exception:
                     pass
         
         return emails
     
+    @tracer.traced("email.scan_page")
+    @profiled("email.scan_page")
     def _find_emails_on_page(self):
         """
         Mevcut sayfada e-posta adreslerini bulur
@@ -226,7 +241,7 @@ class EmailExtractor:
             for email in found_emails:
                 if is_valid_email(email):
                     emails.add(email)
-                    self.update_status(f"E-posta bulundu: {email}")
+                    self.events.debug("E-posta bulundu: {value}", value=email)
             
             # Metin içeriklerinde e-posta ara
             try:
@@ -238,7 +253,7 @@ class EmailExtractor:
                     for email in text_emails:
                         if is_valid_email(email):
                             emails.add(email)
-            except:
+            except Exception:
                 pass
             
             # Bağlantılarda e-posta ara (özellikle mailto: linkleri)
@@ -251,14 +266,14 @@ class EmailExtractor:
                             email = href[7:].split('?')[0]  # mailto: kısmını ve olası parametreleri kaldır
                             if is_valid_email(email):
                                 emails.add(email)
-                                self.update_status(f"Mail link'i bulundu: {email}")
-                    except:
+                                self.events.debug("Mail link'i bulundu: {value}", value=email)
+                    except Exception:
                         continue
-            except:
+            except Exception:
                 pass
             
         except Exception as e:
-            self.update_status(f"Sayfa e-posta tarama hatası: {str(e)}")
+            self.events.warning("Sayfa e-posta tarama hatası: {error}", error=e)
         
         return list(emails)
     
@@ -283,8 +298,8 @@ class EmailExtractor:
         try:
             # Tüm <a> etiketlerini bul
             links = self.browser.driver.find_elements(By.TAG_NAME, "a")
-            parsed_base = urlparse(base_url)
-            base_domain = parsed_base.netloc
+            domains = get_domain_index()
+            base_domain = domains.registrable_domain(base_url)
             
             for link in links:
                 try:
@@ -292,11 +307,8 @@ class EmailExtractor:
                     if not href or not href.startswith('http'):
                         continue
                     
-                    # URL'yi kontrol et
-                    parsed_url = urlparse(href)
-                    
-                    # Aynı domain'de olduğunu kontrol et
-                    if parsed_url.netloc != base_domain:
+                    # Aynı siteye (www. ve alt alan adları dahil) ait olduğunu kontrol et
+                    if domains.registrable_domain(href) != base_domain:
                         continue
                     
                     # Link metnini veya href değerini kontrol et
@@ -307,9 +319,9 @@ class EmailExtractor:
                     for keyword in contact_keywords:
                         if (keyword in link_text) or (keyword in href_lower):
                             contact_links.append(href)
-                            self.update_status(f"Muhtemel iletişim sayfası: {href}")
+                            self.events.debug("Muhtemel iletişim sayfası: {url}", url=href)
                             break
-                except:
+                except Exception:
                     continue
                     
             # Menu classlarını da kontrol et
@@ -325,8 +337,7 @@ class EmailExtractor:
                         if not href or not href.startswith('http'):
                             continue
                             
-                        parsed_url = urlparse(href)
-                        if parsed_url.netloc != base_domain:
+                        if domains.registrable_domain(href) != base_domain:
                             continue
                             
                         item_text = item.text.lower()
@@ -336,15 +347,15 @@ class EmailExtractor:
                             if (keyword in item_text) or (keyword in href_lower):
                                 if href not in contact_links:
                                     contact_links.append(href)
-                                    self.update_status(f"Menüden iletişim sayfası: {href}")
+                                    self.events.debug("Menüden iletişim sayfası: {url}", url=href)
                                 break
-                    except:
+                    except Exception:
                         continue
-            except:
+            except Exception:
                 pass
                 
         except Exception as e:
-            self.update_status(f"İletişim sayfası arama hatası: {str(e)}")
+            self.events.warning("İletişim sayfası arama hatası: {error}", error=e)
         
         return contact_links
         
@@ -363,8 +374,8 @@ class EmailExtractor:
         
         try:
             links = self.browser.driver.find_elements(By.TAG_NAME, "a")
-            parsed_base = urlparse(base_url)
-            base_domain = parsed_base.netloc
+            domains = get_domain_index()
+            base_domain = domains.registrable_domain(base_url)
             
             for link in links:
                 try:
@@ -376,20 +387,18 @@ class EmailExtractor:
                     if any(href.lower().endswith(ext) for ext in skip_extensions):
                         continue
                         
-                    parsed_url = urlparse(href)
-                    
-                    # Aynı domain'de olduğunu kontrol et
-                    if parsed_url.netloc != base_domain:
+                    # Aynı siteye ait olduğunu kontrol et
+                    if domains.registrable_domain(href) != base_domain:
                         continue
                         
                     # Daha önce dahil edilmediyse ekle
                     if href not in internal_links:
                         internal_links.append(href)
-                except:
+                except Exception:
                     continue
                     
         except Exception as e:
-            self.update_status(f"Dahili bağlantıları bulma hatası: {str(e)}")
+            self.events.warning("Dahili bağlantıları bulma hatası: {error}", error=e)
             
         # Sayfa sayısını sınırlandır
         return internal_links[:10]  # En fazla 10 dahili bağlantı döndür
@@ -2,20 +2,24 @@
 Telefon numarası çıkarma modülü
 """
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import StaleElementReferenceException
 from ..config import CSS_SELECTORS, REGEX_PATTERNS
+from ..events import EventBus, FIELD_FOUND
 
 class PhoneExtractor:
     """
     Telefon numarası çıkarma sınıfı
     """
-    def __init__(self, browser, update_status_callback=None):
+    def __init__(self, browser, update_status_callback=None, event_bus=None):
         """
         Args:
             browser: BrowserManager nesnesi
             update_status_callback: Durum güncellemesi yapacak callback fonksiyonu
+            event_bus: Bulunan alanların yayınlanacağı olay yolu (None = callback'e ileten yol)
         """
         self.browser = browser
         self.update_status = update_status_callback or (lambda msg: None)
+        self.events = event_bus or EventBus.for_callback(update_status_callback)
     
     def extract_phone_number(self):
         """
@@ -37,16 +41,21 @@ class PhoneExtractor:
                 if aria_label and ('telefon' in aria_label.lower() or 'ara' in aria_label.lower()):
                     # Telefon: +90 555 123 4567 formatını temizle
                     phone = aria_label.replace('Telefon: ', '').strip()
-                    self.update_status(f"Telefon bulundu (aria-label): {phone}")
+                    self.events.emit(FIELD_FOUND, "Telefon bulundu ({source}): {value}",
+                                     field="phone", source="aria-label", value=phone)
                     break
                     
                 # Seçenek 2: Element metni
                 text = phone_elem.text
                 if text and REGEX_PATTERNS["phone"].search(text) and len(text) < 30:
                     phone = text
-                    self.update_status(f"Telefon bulundu (metin): {phone}")
+                    self.events.emit(FIELD_FOUND, "Telefon bulundu ({source}): {value}",
+                                     field="phone", source="metin", value=phone)
                     break
-            except:
+            except StaleElementReferenceException:
+                # Panel yeniden çizildi, çıkarımın tamamı yeniden denenecek
+                raise
+            except Exception:
                 continue
         
         # Yöntem 2: Telefon ikonuyla ilişkili buttonlar
@@ -62,11 +71,12 @@ class PhoneExtractor:
                         text = btn.text.strip()
                         if text and REGEX_PATTERNS["phone"].search(text):
                             phone = text
-                            self.update_status(f"Telefon bulundu (telefon butonu): {phone}")
+                            self.events.emit(FIELD_FOUND, "Telefon bulundu ({source}): {value}",
+                                             field="phone", source="telefon butonu", value=phone)
                             break
-                    except:
+                    except Exception:
                         continue
-            except:
+            except Exception:
                 pass
         
         # Yöntem 3: Tüm buttonları kontrol et
@@ -81,11 +91,12 @@ class PhoneExtractor:
                             phone_match = REGEX_PATTERNS["phone"].search(text)
                             if phone_match:
                                 phone = phone_match.group(0)
-                                self.update_status(f"Telefon bulundu (genel buton): {phone}")
+                                self.events.emit(FIELD_FOUND, "Telefon bulundu ({source}): {value}",
+                                                 field="phone", source="genel buton", value=phone)
                                 break
-                    except:
+                    except Exception:
                         continue
-            except:
+            except Exception:
                 pass
         
         # Yöntem 4: Tüm sayfada regex ile telefon numarası ara
@@ -97,8 +108,9 @@ class PhoneExtractor:
                 if phone_matches:
                     # En uzun eşleşmeyi al (daha muhtemel telefon numarası)
                     phone = max(phone_matches, key=len)
-                    self.update_status(f"Telefon bulundu (sayfa kaynağı): {phone}")
-            except:
+                    self.events.emit(FIELD_FOUND, "Telefon bulundu ({source}): {value}",
+                                     field="phone", source="sayfa kaynağı", value=phone)
+            except Exception:
                 pass
         
         return phone
\ No newline at end of file
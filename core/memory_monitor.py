@@ -0,0 +1,188 @@
+"""
+tracemalloc tabanlı bellek izleme - uzun taramalarda büyüyen bellek kaynaklarını bulmak için
+"""
+import os
+import threading
+import tracemalloc
+
+from .config import MEMORY_CONFIG
+from .tracing import percentile
+
+MB = 1024 * 1024
+
+# Raporlarda gösterilmeyen (izlemenin kendisine ait) çerçeveler
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+def _format_stat(stat):
+    """Snapshot istatistik satırı: dosya:satır, boyut (ve varsa değişim)"""
+    frame = stat.traceback[0]
+    location = f"{os.path.basename(frame.filename)}:{frame.lineno}"
+    size_diff = getattr(stat, 'size_diff', None)
+    if size_diff is None:
+        return f"{location}: {stat.size / MB:.2f} MB ({stat.count} blok)"
+    return f"{location}: {size_diff / MB:+.2f} MB (toplam {stat.size / MB:.2f} MB, {stat.count_diff:+d} blok)"
+
+class MemoryMonitor:
+    """
+    Aralıklarla ve aşama sınırlarında tracemalloc snapshot'ı alan bellek izleyici
+    
+    Her snapshot bir öncekiyle karşılaştırılır ve en çok büyüyen satırlar
+    bildirilir. İşletme başına tepe bellek tracemalloc.reset_peak() ile ölçülür
+    (snapshot almadan, düşük maliyetle). Açık değilken tüm çağrılar hemen döner.
+    """
+    def __init__(self):
+        self.running = False
+        self.update_status = lambda msg: None
+        self.lock = threading.Lock()
+        self.started_tracing = False
+        self.baseline = None
+        self.previous = None
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.business_label = None
+        self.business_start = 0
+        self.business_peaks = []   # (işletme, tepe artış bayt, tepe bayt)
+        self.checkpoints = []      # (etiket, güncel bayt)
+        
+    def start(self, update_status_callback=None, interval_seconds=None, top_n=None):
+        """
+        İzlemeyi başlatır
+        
+        Args:
+            update_status_callback: Raporların gönderileceği fonksiyon
+            interval_seconds: Periyodik snapshot aralığı (None = MEMORY_CONFIG, 0 = yalnızca aşama sınırları)
+            top_n: Raporlarda gösterilecek satır sayısı
+        """
+        if self.running:
+            self.stop()
+        self.update_status = update_status_callback or (lambda msg: None)
+        self.interval_seconds = MEMORY_CONFIG["interval_seconds"] if interval_seconds is None else interval_seconds
+        self.top_n = top_n or MEMORY_CONFIG["top_n"]
+        self.business_peaks = []
+        self.checkpoints = []
+        
+        self.started_tracing = not tracemalloc.is_tracing()
+        if self.started_tracing:
+            tracemalloc.start(MEMORY_CONFIG["frames"])
+        self.baseline = self.previous = self._snapshot()
+        self.running = True
+        
+        if self.interval_seconds:
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self._run, name="memory-monitor", daemon=True)
+            self.thread.start()
+        self.update_status("Bellek izleme başladı (tracemalloc)")
+        
+    def _run(self):
+        while not self.stop_event.wait(self.interval_seconds):
+            self.checkpoint("periyodik")
+            
+    def _snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        
+    def checkpoint(self, label):
+        """
+        Snapshot alır ve bir öncekine göre en çok büyüyen satırları bildirir
+        
+        Args:
+            label: Aşama adı (ör. "arama_yüklendi", "postprocess")
+        """
+        if not self.running:
+            return
+        snapshot = self._snapshot()
+        with self.lock:
+            previous, self.previous = self.previous, snapshot
+            current, peak = tracemalloc.get_traced_memory()
+            self.checkpoints.append((label, current))
+        growth = [stat for stat in snapshot.compare_to(previous, 'lineno')[:self.top_n] if stat.size_diff > 0]
+        lines = [f"Bellek [{label}]: {current / MB:.1f} MB (tepe {peak / MB:.1f} MB)"]
+        lines.extend(f"  {_format_stat(stat)}" for stat in growth)
+        self.update_status("\n".join(lines))
+        
+    def begin_business(self, label):
+        """İşletme başında tepe değeri sıfırlar"""
+        if not self.running:
+            return
+        tracemalloc.reset_peak()
+        self.business_label = label
+        self.business_start = tracemalloc.get_traced_memory()[0]
+        
+    def end_business(self):
+        """İşletme boyunca ulaşılan tepe belleği kaydeder"""
+        if not self.running or self.business_label is None:
+            return
+        _, peak = tracemalloc.get_traced_memory()
+        self.business_peaks.append((self.business_label, peak - self.business_start, peak))
+        self.business_label = None
+        
+    def business_summary(self):
+        """
+        Returns:
+            dict: İşletme başına tepe artış istatistikleri (bayt) veya boş sözlük
+        """
+        if not self.business_peaks:
+            return {}
+        increases = sorted(increase for _, increase, _ in self.business_peaks)
+        worst = max(self.business_peaks, key=lambda entry: entry[1])
+        return {
+            "businesses": len(increases),
+            "mean": sum(increases) / len(increases),
+            "p95": percentile(increases, 95),
+            "max": increases[-1],
+            "max_business": worst[0],
+            "peak": max(peak for _, _, peak in self.business_peaks),
+        }
+        
+    def format_report(self, snapshot):
+        """Başlangıca göre büyüme, en büyük ayırma noktaları ve işletme başına tepe bellek"""
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [f"Bellek özeti: güncel {current / MB:.1f} MB, tepe {peak / MB:.1f} MB"]
+        
+        growth = [stat for stat in snapshot.compare_to(self.baseline, 'lineno')[:self.top_n] if stat.size_diff > 0]
+        if growth:
+            lines.append("Başlangıca göre en çok büyüyen satırlar:")
+            lines.extend(f"  {_format_stat(stat)}" for stat in growth)
+            
+        lines.append("En çok bellek tutan satırlar:")
+        lines.extend(f"  {_format_stat(stat)}" for stat in snapshot.statistics('lineno')[:self.top_n])
+        
+        summary = self.business_summary()
+        if summary:
+            lines.append(
+                f"İşletme başına tepe artış: ort. {summary['mean'] / MB:.2f} MB, "
+                f"p95 {summary['p95'] / MB:.2f} MB, en çok {summary['max'] / MB:.2f} MB "
+                f"({summary['max_business']}), {summary['businesses']} işletme"
+            )
+        return "\n".join(lines)
+        
+    def stop(self):
+        """
+        İzlemeyi durdurur ve özet raporu yayınlar
+        
+        Returns:
+            dict: İşletme başına tepe bellek özeti
+        """
+        if not self.running:
+            return {}
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+        self.running = False
+        
+        self.update_status(self.format_report(self._snapshot()))
+        summary = self.business_summary()
+        self.baseline = self.previous = None
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+        return summary
+
+# Uygulama genelinde paylaşılan izleyici
+memory_monitor = MemoryMonitor()
\ No newline at end of file
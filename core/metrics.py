@@ -0,0 +1,343 @@
+"""
+Prometheus biçiminde canlı metrikler - sayaç, gösterge ve histogram kaydı ve isteğe bağlı HTTP ucu
+"""
+import math
+import time
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .config import METRICS_CONFIG
+from .events import BUSINESS_FINISHED, FIELD_FOUND, RETRY, ERROR_EVENT, PAGE_LOADED, DEBUG
+from .tracing import tracer
+
+# Varsayılan histogram sınırları (saniye)
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+class _CounterChild:
+    __slots__ = ('value', 'lock')
+    
+    def __init__(self):
+        self.value = 0.0
+        self.lock = threading.Lock()
+        
+    def inc(self, amount=1):
+        with self.lock:
+            self.value += amount
+
+class _GaugeChild:
+    __slots__ = ('value', 'lock', 'function')
+    
+    def __init__(self):
+        self.value = 0.0
+        self.lock = threading.Lock()
+        self.function = None
+        
+    def set(self, value):
+        self.value = value
+        
+    def inc(self, amount=1):
+        with self.lock:
+            self.value += amount
+            
+    def dec(self, amount=1):
+        self.inc(-amount)
+        
+    def set_function(self, function):
+        """Değer, her okunuşta bu fonksiyon çağrılarak alınır (ör. kuyruk uzunluğu)"""
+        self.function = function
+        
+    def get(self):
+        if self.function is not None:
+            try:
+                return float(self.function())
+            except Exception:
+                return math.nan
+        return self.value
+
+class _HistogramChild:
+    __slots__ = ('buckets', 'counts', 'sum', 'count', 'lock')
+    
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+        self.lock = threading.Lock()
+        
+    def observe(self, value):
+        # Sınır sayısı küçük olduğundan doğrusal arama bisect kadar hızlıdır
+        position = len(self.buckets)
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                position = index
+                break
+        with self.lock:
+            if position < len(self.counts):
+                self.counts[position] += 1
+            self.sum += value
+            self.count += 1
+
+class Metric:
+    """
+    Etiketli metrik ailesi
+    
+    labels(...) ile etiket değerlerine ait alt metrik alınır; etiketsiz
+    metriklerde inc/set/observe doğrudan ailenin üzerinde çağrılabilir.
+    """
+    def __init__(self, kind, name, documentation, labelnames=(), buckets=None):
+        self.kind = kind
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets or DEFAULT_BUCKETS))
+        self.children = {}
+        self.lock = threading.Lock()
+        
+    def _new_child(self):
+        if self.kind == "counter":
+            return _CounterChild()
+        if self.kind == "gauge":
+            return _GaugeChild()
+        return _HistogramChild(self.buckets)
+        
+    def labels(self, *values, **kwargs):
+        """
+        Etiket değerlerine ait alt metriği döndürür (yoksa oluşturur)
+        
+        Args:
+            *values: Etiket değerleri (labelnames sırasıyla)
+            **kwargs: Etiket değerleri (isimle)
+        """
+        if kwargs:
+            values = tuple(kwargs[name] for name in self.labelnames)
+        key = tuple(str(value) for value in values)
+        child = self.children.get(key)
+        if child is None:
+            with self.lock:
+                child = self.children.get(key)
+                if child is None:
+                    child = self.children[key] = self._new_child()
+        return child
+        
+    # Etiketsiz kullanım kısayolları
+    def inc(self, amount=1):
+        self.labels().inc(amount)
+        
+    def dec(self, amount=1):
+        self.labels().dec(amount)
+        
+    def set(self, value):
+        self.labels().set(value)
+        
+    def set_function(self, function):
+        self.labels().set_function(function)
+        
+    def observe(self, value):
+        self.labels().observe(value)
+        
+    def render(self):
+        """
+        Returns:
+            list: Prometheus metin biçimindeki satırlar
+        """
+        # 0.0.4 metin biçiminde sayaç ailesinin adı örnek adıyla (_total) aynıdır
+        family = self.name + "_total" if self.kind == "counter" else self.name
+        lines = [f"# HELP {family} {self.documentation}", f"# TYPE {family} {self.kind}"]
+        for key, child in sorted(self.children.items()):
+            labels = _format_labels(self.labelnames, key)
+            if self.kind == "counter":
+                lines.append(f"{self.name}_total{labels} {_format_value(child.value)}")
+            elif self.kind == "gauge":
+                lines.append(f"{self.name}{labels} {_format_value(child.get())}")
+            else:
+                with child.lock:
+                    counts, total, count = list(child.counts), child.sum, child.count
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    bucket_labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                    lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+                inf_labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{inf_labels} {count}")
+                lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+                lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+class MetricsRegistry:
+    """
+    Metrik kaydı
+    
+    Güncellemeler alt metrik başına kilitle yapılır; aynı isimle tekrar
+    kaydedilen metrik mevcut olanı döndürür.
+    """
+    def __init__(self):
+        self.metrics = {}
+        self.lock = threading.Lock()
+        
+    def _register(self, kind, name, documentation, labelnames=(), buckets=None):
+        with self.lock:
+            metric = self.metrics.get(name)
+            if metric is None:
+                metric = self.metrics[name] = Metric(kind, name, documentation, labelnames, buckets)
+            return metric
+            
+    def counter(self, name, documentation, labelnames=()):
+        """Yalnızca artan sayaç (Prometheus'ta adı _total ile biter)"""
+        return self._register("counter", name, documentation, labelnames)
+        
+    def gauge(self, name, documentation, labelnames=()):
+        """Anlık değer"""
+        return self._register("gauge", name, documentation, labelnames)
+        
+    def histogram(self, name, documentation, labelnames=(), buckets=None):
+        """Dağılım (sınır başına birikimli adet, toplam ve sayı)"""
+        return self._register("histogram", name, documentation, labelnames, buckets)
+        
+    def render(self):
+        """
+        Returns:
+            str: Tüm metriklerin Prometheus metin biçimi
+        """
+        with self.lock:
+            metrics = list(self.metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+# Uygulama genelinde paylaşılan kayıt ve metrikler
+registry = MetricsRegistry()
+
+BUSINESSES = registry.counter("scraper_businesses", "Toplanan işletme sayısı")
+BUSINESSES_PER_MINUTE = registry.gauge("scraper_businesses_per_minute", "Son bir dakikada tamamlanan işletme")
+BUSINESS_SECONDS = registry.histogram("scraper_business_seconds", "İşletme başına işlem süresi")
+FIELDS_FOUND = registry.counter("scraper_fields_found", "Bulunan alanlar", ("field",))
+EMAILS_PER_SITE = registry.histogram("scraper_emails_per_site", "Taranan website başına bulunan e-posta",
+                                     buckets=(0, 1, 2, 3, 5, 10))
+ERRORS = registry.counter("scraper_errors", "Hatalar (tür bazında)", ("kind",))
+RETRIES = registry.counter("scraper_retries", "Yeniden denemeler (hata türü bazında)", ("kind",))
+BROWSER_RESTARTS = registry.counter("scraper_browser_restarts", "Bellek nedeniyle tarayıcı yeniden başlatma")
+PAGE_LOAD_SECONDS = registry.histogram("scraper_page_load_seconds", "Arama sayfası yükleme süresi")
+STAGE_SECONDS = registry.histogram("scraper_stage_seconds", "Aşama süreleri (tracing spanları)", ("stage",))
+QUEUE_DEPTH = registry.gauge("scraper_queue_depth", "Kuyruk uzunlukları", ("queue",))
+
+class MetricsSubscriber:
+    """
+    Olay yolundaki işletme, alan, yeniden deneme ve hata olaylarını metriklere çeviren abone
+    
+    Dakikadaki işletme sayısı son 60 saniyelik kayan pencereden hesaplanır.
+    """
+    KINDS = (BUSINESS_FINISHED, FIELD_FOUND, RETRY, ERROR_EVENT, PAGE_LOADED)
+    WINDOW_SECONDS = 60
+    
+    def __init__(self):
+        self.finished = deque()   # Son pencerede tamamlanan işletmelerin zamanları
+        self.lock = threading.Lock()
+        
+    def businesses_per_minute(self):
+        """Son 60 saniyede tamamlanan işletme sayısı"""
+        cutoff = time.monotonic() - self.WINDOW_SECONDS
+        with self.lock:
+            while self.finished and self.finished[0] < cutoff:
+                self.finished.popleft()
+            return len(self.finished)
+        
+    def attach(self, event_bus):
+        """Olay yoluna DEBUG seviyesinden, yalnızca ilgili türler için abone olur"""
+        return event_bus.subscribe(self, min_level=DEBUG, kinds=self.KINDS)
+        
+    def __call__(self, event):
+        payload = event.payload
+        if event.kind == BUSINESS_FINISHED:
+            with self.lock:
+                self.finished.append(time.monotonic())
+            BUSINESSES.inc()
+            BUSINESS_SECONDS.observe(payload.get("seconds", 0))
+        elif event.kind == FIELD_FOUND:
+            FIELDS_FOUND.labels(payload.get("field", "?")).inc()
+        elif event.kind == RETRY:
+            RETRIES.labels(payload.get("error_kind", "?")).inc()
+        elif event.kind == ERROR_EVENT:
+            ERRORS.labels(payload.get("error_kind") or "unknown").inc()
+        elif event.kind == PAGE_LOADED:
+            PAGE_LOAD_SECONDS.observe(payload.get("seconds", 0))
+
+def observe_stage(name, seconds):
+    """Tracing spanlarını aşama süresi histogramına aktaran gözlemci"""
+    STAGE_SECONDS.labels(name).observe(seconds)
+
+def enable_metrics(event_bus, port=None, host=None):
+    """
+    Olay yolu ve aşama sürelerinden metrik toplamayı açar
+    
+    Doğrudan güncellenen metrikler (e-posta/site, tarayıcı yeniden başlatma,
+    kuyruklar) her zaman toplanır; olaylardan ve spanlardan beslenenler için
+    bu fonksiyon çağrılmalıdır.
+    
+    Args:
+        event_bus: Tarayıcının olay yolu
+        port: Verilirse Prometheus ucu bu portta açılır
+        host: Dinlenecek adres (None = METRICS_CONFIG)
+        
+    Returns:
+        ThreadingHTTPServer: Başlatılan sunucu (port verilmediyse None)
+    """
+    subscriber = MetricsSubscriber()
+    subscriber.attach(event_bus)
+    BUSINESSES_PER_MINUTE.set_function(subscriber.businesses_per_minute)
+    tracer.add_observer(observe_stage)
+    if port is None:
+        return None
+    return start_metrics_server(port, host)
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+        body = self.server.registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        
+    def log_message(self, format, *args):
+        pass
+
+def start_metrics_server(port=None, host=None, metrics_registry=None):
+    """
+    Prometheus metin biçimini /metrics adresinde sunan HTTP sunucusunu arka planda başlatır
+    
+    Args:
+        port: Dinlenecek port (None = METRICS_CONFIG, 0 = rastgele boş port)
+        host: Dinlenecek adres (None = METRICS_CONFIG, varsayılan yalnızca yerel)
+        metrics_registry: Sunulacak kayıt (None = paylaşılan kayıt)
+        
+    Returns:
+        ThreadingHTTPServer: Sunucu (server_address ile gerçek port okunabilir, shutdown() ile durur)
+    """
+    port = METRICS_CONFIG["port"] if port is None else port
+    host = host or METRICS_CONFIG["host"]
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    server.registry = metrics_registry or registry
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""
+İşletme veri modeli
+"""
+import time
+
+from utils.normalizers import is_missing, extract_place_id, extract_coordinates
+
+# Eksik alanların dışa aktarımda görünen karşılıkları
+MISSING_TEXT = "Bulunamadı"
+UNNAMED_TEXT = "İsimsiz İşletme"
+UNAVAILABLE_TEXT = "Alınamadı"
+EMAIL_ERROR_TEXT = "Hata: Toplanamadı"
+EMAIL_SEPARATOR = "; "
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Dışa aktarma sütunları: yerelleştirilmiş başlık -> alan
+EXPORT_COLUMNS = [
+    ('Detay_URL', 'detail_url'),
+    ('İsim', 'name'),
+    ('Adres', 'address'),
+    ('Telefon', 'phone'),
+    ('Website', 'website'),
+    ('E-postalar', 'emails'),
+    ('Tarih', 'timestamp'),
+    ('Place_ID', 'place_id'),
+    ('Enlem', 'latitude'),
+    ('Boylam', 'longitude'),
+    ('Alan_Adı', 'domain'),
+]
+
+class BusinessRecord:
+    """
+    Tek bir işletmenin toplanan bilgileri
+    
+    Eksik alanlar None, e-postalar liste, zaman damgası epoch saniyesidir.
+    Yerelleştirilmiş başlıklar ve "Bulunamadı" gibi metinler yalnızca
+    dışa aktarırken (to_row) uygulanır.
+    """
+    __slots__ = ('name', 'address', 'phone', 'website', 'emails', 'detail_url',
+                 'timestamp', 'place_id', 'latitude', 'longitude', 'email_error', 'domain')
+                 
+    def __init__(self, name=None, address=None, phone=None, website=None, emails=None,
+                 detail_url=None, timestamp=None, place_id=None, latitude=None, longitude=None,
+                 email_error=False, domain=None):
+        """
+        Args:
+            name: İşletme adı
+            address: Adres
+            phone: Telefon numarası
+            website: Website URL'si
+            emails: E-posta adresleri listesi
+            detail_url: Google Maps detay sayfası URL'si
+            timestamp: Toplanma zamanı (epoch saniyesi, None = şimdi)
+            place_id: Google Maps işletme kimliği (None = detay URL'sinden)
+            latitude: Enlem (None = detay URL'sinden)
+            longitude: Boylam (None = detay URL'sinden)
+            email_error: E-posta toplama hata ile sonuçlandıysa True
+            domain: Website'nin kayıt edilebilir alan adı (son işlemede doldurulur)
+        """
+        self.name = name
+        self.address = address
+        self.phone = phone
+        self.website = website
+        self.emails = list(emails) if emails else []
+        self.detail_url = detail_url
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.place_id = place_id
+        self.latitude = latitude
+        self.longitude = longitude
+        self.email_error = email_error
+        self.domain = domain
+        
+        # Kimlik ve konum verilmediyse detay URL'sinden çıkar
+        if detail_url and place_id is None:
+            self.place_id = extract_place_id(detail_url)
+        if detail_url and latitude is None and longitude is None:
+            self.latitude, self.longitude = extract_coordinates(detail_url)
+            
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Yerelleştirilmiş başlıklı sözlükten (eski biçim) kayıt oluşturur
+        
+        Args:
+            data: 'İsim', 'Adres' vb. anahtarlı sözlük
+            
+        Returns:
+            BusinessRecord: Kayıt
+        """
+        def value(key):
+            item = data.get(key)
+            return None if is_missing(item) else item
+            
+        emails = value('E-postalar')
+        if isinstance(emails, str):
+            emails = [email.strip() for email in emails.split(';') if email.strip()]
+            
+        timestamp = data.get('Tarih')
+        if isinstance(timestamp, str):
+            try:
+                timestamp = time.mktime(time.strptime(timestamp, TIMESTAMP_FORMAT))
+            except ValueError:
+                timestamp = None
+                
+        return cls(
+            name=value('İsim'),
+            address=value('Adres'),
+            phone=value('Telefon'),
+            website=value('Website'),
+            emails=emails,
+            detail_url=value('Detay_URL'),
+            timestamp=timestamp,
+            place_id=value('Place_ID'),
+            latitude=value('Enlem'),
+            longitude=value('Boylam'),
+            email_error=data.get('E-postalar') == EMAIL_ERROR_TEXT,
+            domain=value('Alan_Adı'),
+        )
+        
+    @classmethod
+    def coerce(cls, item):
+        """Kayıt veya eski biçim sözlüğü BusinessRecord'a çevirir"""
+        return item if isinstance(item, cls) else cls.from_dict(item)
+        
+    def format_field(self, field):
+        """
+        Alanı dışa aktarımdaki metin karşılığına çevirir
+        
+        Args:
+            field: Alan adı (ör. 'emails')
+            
+        Returns:
+            Dışa aktarılacak değer
+        """
+        value = getattr(self, field)
+        if field == 'emails':
+            if self.email_error:
+                return EMAIL_ERROR_TEXT
+            return EMAIL_SEPARATOR.join(value) if value else MISSING_TEXT
+        if field == 'timestamp':
+            return time.strftime(TIMESTAMP_FORMAT, time.localtime(value))
+        if value is None:
+            if field == 'name':
+                return UNNAMED_TEXT
+            if field == 'detail_url':
+                return UNAVAILABLE_TEXT
+            if field in ('latitude', 'longitude', 'place_id', 'domain'):
+                return None
+            return MISSING_TEXT
+        return value
+        
+    def to_row(self):
+        """
+        Kaydı dışa aktarma satırına çevirir
+        
+        Returns:
+            dict: Yerelleştirilmiş başlık -> metin değeri
+        """
+        return {header: self.format_field(field) for header, field in EXPORT_COLUMNS}
+        
+    def __repr__(self):
+        return f"BusinessRecord(name={self.name!r}, place_id={self.place_id!r})"
\ No newline at end of file
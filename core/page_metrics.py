@@ -0,0 +1,182 @@
+"""
+Sayfa ağırlığı ve tarayıcı performans ölçümleri (DevTools Performance.getMetrics ve Navigation Timing)
+"""
+import threading
+from collections import defaultdict
+
+from .config import PAGE_METRICS_CONFIG
+from utils.domain_index import get_domain_index
+
+# Navigation/Resource Timing değerlerini tek komutta okuyan betik. Kaynak zamanlama
+# arabelleği varsayılan olarak 250 girişle sınırlıdır; çok ağır sayfalarda istek sayısı
+# bu sınırda kalır. Başka kaynaklı dosyaların transferSize değeri Timing-Allow-Origin
+# başlığı yoksa 0 okunur, yani aktarılan bayt alt sınırdır.
+TIMING_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0] || {};
+var resources = performance.getEntriesByType('resource');
+var bytes = nav.transferSize || 0;
+for (var i = 0; i < resources.length; i++) { bytes += resources[i].transferSize || 0; }
+return {
+    ttfb: nav.responseStart || 0,
+    dcl: nav.domContentLoadedEventEnd || 0,
+    load: nav.loadEventEnd || 0,
+    bytes: bytes,
+    requests: resources.length + 1
+};
+"""
+
+# Performance.getMetrics çıktısından alınan değerler: ad -> (anahtar, çarpan)
+CDP_METRICS = {
+    "JSHeapUsedSize": ("js_heap_mb", 1 / (1024 * 1024)),
+    "Nodes": ("nodes", 1),
+    "ScriptDuration": ("script_ms", 1000),
+    "LayoutDuration": ("layout_ms", 1000),
+    "TaskDuration": ("task_ms", 1000),
+}
+
+def _cdp_error_text(error):
+    """CDP hatasını tek satırlık kısa açıklamaya çevirir"""
+    message = str(error).strip().splitlines()[0] if str(error).strip() else ""
+    return f"{type(error).__name__}: {message[:120]}" if message else type(error).__name__
+
+def enable_performance_domain(driver):
+    """
+    DevTools Performance alanını açar (getMetrics için oturum başına bir kez)
+    
+    Returns:
+        str: CDP kullanılamıyorsa nedeni, alan açıldıysa None
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return f"{type(driver).__name__} sürücüsü CDP komutlarını desteklemiyor"
+    try:
+        driver.execute_cdp_cmd("Performance.enable", {})
+        return None
+    except Exception as e:
+        return _cdp_error_text(e)
+
+def collect_page_metrics(driver, kind, use_cdp=True):
+    """
+    Aktif sayfanın yükleme süreleri, aktarılan bayt, istek sayısı ve JS bellek değerlerini okur
+    
+    Maps detay sayfaları tıklamayla (tek sayfa uygulaması içinde) açıldığında
+    gezinme süreleri ilk yüklemeye aittir; bayt ve istek sayıları sayfa
+    açıldığından beri birikmiş değerlerdir.
+    
+    Args:
+        driver: WebDriver nesnesi
+        kind: Sayfa türü (ör. "maps_detail", "website", "contact")
+        use_cdp: Performance.getMetrics de okunsun mu
+        
+    Returns:
+        dict: Ölçümler (okunamayan değerler eksik; getMetrics başarısızsa nedeni cdp_error'da)
+    """
+    url = driver.current_url
+    metrics = {"kind": kind, "url": url, "domain": get_domain_index().registrable_domain(url)}
+    
+    timing = driver.execute_script(TIMING_SCRIPT) or {}
+    metrics.update({
+        "ttfb_ms": round(timing.get("ttfb", 0), 1),
+        "dom_content_loaded_ms": round(timing.get("dcl", 0), 1),
+        "load_ms": round(timing.get("load", 0), 1),
+        "transfer_kb": round(timing.get("bytes", 0) / 1024, 1),
+        "requests": int(timing.get("requests", 0)),
+    })
+    
+    if use_cdp:
+        try:
+            result = driver.execute_cdp_cmd("Performance.getMetrics", {})
+            for metric in result.get("metrics", []):
+                mapped = CDP_METRICS.get(metric.get("name"))
+                if mapped:
+                    metrics[mapped[0]] = round(metric.get("value", 0) * mapped[1], 1)
+        except Exception as e:
+            metrics["cdp_error"] = _cdp_error_text(e)
+    return metrics
+
+class PageMetricsStats:
+    """
+    Sayfa ölçümlerini alan adı bazında toplayan sınıf
+    
+    Ağır websitelerinin (yüksek bayt/istek, uzun yükleme) mi yoksa kendi
+    işlemlerimizin mi yavaş olduğunu ayırmak ve kaynak engelleme / zaman
+    aşımı ayarlarına veri sağlamak için kullanılır.
+    """
+    SUMMED = ("load_ms", "transfer_kb", "requests", "js_heap_mb", "script_ms")
+    
+    def __init__(self, enabled=False):
+        """
+        Args:
+            enabled: Ölçüm alınsın mı (BrowserManager.collect_page_metrics buna bakar)
+        """
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.reset()
+        
+    def reset(self, enabled=None):
+        """Toplanan ölçümleri siler (enabled verilirse açık/kapalı durumunu da değiştirir)"""
+        if enabled is not None:
+            self.enabled = enabled
+        with self.lock:
+            self.domains = defaultdict(lambda: {"pages": 0, **{key: 0.0 for key in self.SUMMED},
+                                                "max_load_ms": 0.0, "kinds": set()})
+            self.cdp_error = None
+            
+    def note_cdp_error(self, reason):
+        """
+        DevTools ölçümlerinin alınamama nedenini kaydeder
+        
+        Returns:
+            bool: Bu ilk kayıtsa True (neden yalnızca bir kez loglanır)
+        """
+        with self.lock:
+            if not reason or self.cdp_error:
+                return False
+            self.cdp_error = reason
+            return True
+            
+    def record(self, metrics):
+        """Tek bir sayfanın ölçümlerini ekler"""
+        domain = metrics.get("domain") or "?"
+        with self.lock:
+            entry = self.domains[domain]
+            entry["pages"] += 1
+            for key in self.SUMMED:
+                entry[key] += metrics.get(key, 0) or 0
+            entry["max_load_ms"] = max(entry["max_load_ms"], metrics.get("load_ms", 0) or 0)
+            entry["kinds"].add(metrics.get("kind"))
+            
+    def rows(self):
+        """
+        Returns:
+            list: (alan adı, sayfa, ort. yükleme ms, en uzun ms, ort. KB, ort. istek, ort. JS heap MB, türler)
+                  toplam yükleme süresine göre azalan
+        """
+        with self.lock:
+            items = sorted(self.domains.items(), key=lambda item: -item[1]["load_ms"])
+            return [
+                (domain, entry["pages"], entry["load_ms"] / entry["pages"], entry["max_load_ms"],
+                 entry["transfer_kb"] / entry["pages"], entry["requests"] / entry["pages"],
+                 entry["js_heap_mb"] / entry["pages"], ",".join(sorted(filter(None, entry["kinds"]))))
+                for domain, entry in items
+            ]
+            
+    def format_report(self, limit=None):
+        """
+        Returns:
+            str: Alan adı bazında sayfa ağırlığı raporu (ölçüm yoksa boş)
+        """
+        rows = self.rows()[:limit or PAGE_METRICS_CONFIG["report_domains"]]
+        if not rows:
+            return ""
+        lines = ["Sayfa ölçümleri (alan adı bazında, toplam yükleme süresine göre):"]
+        for domain, pages, load_ms, max_load_ms, transfer_kb, requests, heap_mb, kinds in rows:
+            lines.append(
+                f"  {domain} [{kinds}]: {pages} sayfa, ort. yükleme {load_ms:.0f} ms (en uzun {max_load_ms:.0f}), "
+                f"ort. {transfer_kb:.0f} KB / {requests:.0f} istek, JS heap {heap_mb:.1f} MB"
+            )
+        if self.cdp_error:
+            lines.append(f"  JS heap ve DevTools ölçümleri alınamadı: {self.cdp_error}")
+        return "\n".join(lines)
+
+# Uygulama genelinde paylaşılan istatistikler
+page_metrics_stats = PageMetricsStats(enabled=PAGE_METRICS_CONFIG["enabled"])
\ No newline at end of file
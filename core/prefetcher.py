@@ -0,0 +1,111 @@
+"""
+Detay sayfası ön yükleme (prefetch) yönetimi
+"""
+from collections import OrderedDict
+
+from .config import MAPS_CONFIG
+
+class DetailPrefetcher:
+    """
+    Sıradaki işletmelerin detay sayfalarını arka plan sekmelerinde önceden yükleyen sınıf
+    
+    Liste kartlarından alınan yer (place) URL'leri arka planda açılır; sırası gelen
+    işletme için hazır sekme teslim edilir, böylece panel yükleme beklemesi bir önceki
+    işletmenin çıkarımıyla örtüşür.
+    """
+    def __init__(self, browser, depth=None, update_status_callback=None):
+        """
+        Args:
+            browser: BrowserManager nesnesi
+            depth: Aynı anda önceden yüklenecek maksimum sayfa sayısı (0 = kapalı)
+            update_status_callback: Durum güncellemesi yapacak callback fonksiyonu
+        """
+        self.browser = browser
+        self.depth = MAPS_CONFIG.get('prefetch_depth', 0) if depth is None else depth
+        self.update_status = update_status_callback or (lambda msg: None)
+        self.pending = OrderedDict()  # item_id -> (url, sekme tanımlayıcısı)
+        
+    def is_enabled(self):
+        """Ön yükleme açık mı kontrol et"""
+        return self.depth > 0
+        
+    def has_capacity(self):
+        """Yeni bir ön yükleme için yer var mı kontrol et"""
+        return self.is_enabled() and len(self.pending) < self.depth
+        
+    def is_pending(self, item_id):
+        """İşletme için bekleyen bir ön yükleme var mı kontrol et"""
+        return item_id in self.pending
+        
+    def schedule(self, item_id, url):
+        """
+        İşletmenin detay sayfasını arka plan sekmesinde yüklemeye başlar
+        
+        Args:
+            item_id: İşletme öğesinin benzersiz kimliği
+            url: Detay sayfası URL'si
+            
+        Returns:
+            bool: Ön yükleme başlatıldıysa True
+        """
+        if not url or item_id in self.pending or not self.has_capacity():
+            return False
+            
+        handle = self.browser.open_background_tab(url)
+        if not handle:
+            return False
+            
+        self.pending[item_id] = (url, handle)
+        return True
+        
+    def take(self, item_id):
+        """
+        Sırası gelen işletmenin önceden yüklenmiş sekmesini teslim eder
+        
+        Args:
+            item_id: İşletme öğesinin benzersiz kimliği
+            
+        Returns:
+            str: Sekme tanımlayıcısı veya None
+        """
+        entry = self.pending.pop(item_id, None)
+        if not entry:
+            return None
+        return entry[1]
+        
+    def cancel(self, item_id):
+        """
+        Artık gerekmeyen ön yüklemeyi iptal eder ve sekmesini kapatır
+        
+        Args:
+            item_id: İşletme öğesinin benzersiz kimliği
+        """
+        entry = self.pending.pop(item_id, None)
+        if entry:
+            self.browser.close_tab(entry[1])
+            
+    def retain(self, item_ids):
+        """
+        Listede olmayan bekleyen ön yüklemeleri hemen iptal eder
+        
+        Atlanan (mükerrer, filtrelenen veya hedef dışında kalan) işletmelerin
+        sekmeleri tur sonuna kadar açık kalmasın diye her planlamada çağrılır.
+        
+        Args:
+            item_ids: Ön yüklemesi tutulacak işletme kimlikleri
+        """
+        for item_id in [item_id for item_id in self.pending if item_id not in item_ids]:
+            self.cancel(item_id)
+            
+    def cancel_all(self, close_tabs=True):
+        """
+        Bekleyen tüm ön yüklemeleri iptal et
+        
+        Args:
+            close_tabs: Sekmeler kapatılsın mı (tarayıcı zaten kapatılacaksa False)
+        """
+        if not close_tabs:
+            self.pending.clear()
+            return
+        for item_id in list(self.pending.keys()):
+            self.cancel(item_id)
\ No newline at end of file
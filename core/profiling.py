@@ -0,0 +1,255 @@
+"""
+Çalıştırma profilleme - cProfile (.pstats) ve yığın örnekleme (flamegraph için collapsed stacks)
+"""
+import os
+import io
+import re
+import sys
+import time
+import pstats
+import cProfile
+import threading
+import functools
+import contextlib
+from collections import Counter, defaultdict
+
+from .config import PROFILE_CONFIG
+
+# Profil modları
+CPROFILE = "cprofile"   # Deterministik profil, taramayı yürüten iş parçacığında
+SAMPLE = "sample"       # Tüm iş parçacıklarında düşük maliyetli yığın örnekleme
+BOTH = "both"
+MODES = (CPROFILE, SAMPLE, BOTH)
+
+_NULL_CONTEXT = contextlib.nullcontext()
+_active_run = None
+
+def _safe_name(name):
+    """Dosya adında kullanılabilecek biçim"""
+    return re.sub(r'[^\w.-]+', '_', name).strip('_') or "thread"
+
+class StackSampler:
+    """
+    sys._current_frames ile belirli aralıklarla tüm iş parçacıklarının yığınını örnekler
+    
+    Örnekler iş parçacığı adına göre ayrı tutulur (ör. arayüz "MainThread",
+    tarama iş parçacığı); her biri flamegraph.pl / speedscope ile açılabilen
+    ayrı bir collapsed stacks dosyasına yazılır. Örnekleme duvar saati
+    zamanını ölçer: bekleyen (sleep, HTTP yanıtı) iş parçacıkları da görünür.
+    """
+    def __init__(self, interval=None, max_depth=None):
+        """
+        Args:
+            interval: Örnekleme aralığı (saniye, None = PROFILE_CONFIG)
+            max_depth: Örneklenecek en fazla çerçeve derinliği
+        """
+        self.interval = interval or PROFILE_CONFIG["sample_interval_ms"] / 1000
+        self.max_depth = max_depth or PROFILE_CONFIG["max_depth"]
+        self.samples = defaultdict(Counter)  # iş parçacığı adı -> collapsed stack -> adet
+        self.sample_count = 0
+        self.labels = {}                     # code nesnesi -> "dosya:fonksiyon"
+        self.stop_event = threading.Event()
+        self.thread = None
+        
+    def start(self):
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self.thread.start()
+        
+    def stop(self):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+            
+    def _label(self, code):
+        label = self.labels.get(code)
+        if label is None:
+            label = self.labels[code] = f"{os.path.basename(code.co_filename)}:{code.co_name}"
+        return label
+        
+    def _run(self):
+        own_id = threading.get_ident()
+        names = {}
+        while not self.stop_event.wait(self.interval):
+            frames = sys._current_frames()
+            if any(thread_id not in names for thread_id in frames):
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                
+            for thread_id, frame in frames.items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None and len(stack) < self.max_depth:
+                    stack.append(self._label(frame.f_code))
+                    frame = frame.f_back
+                stack.reverse()
+                self.samples[names.get(thread_id, str(thread_id))][";".join(stack)] += 1
+            self.sample_count += 1
+            
+    def write(self, prefix):
+        """
+        İş parçacığı başına collapsed stacks dosyalarını yazar
+        
+        Args:
+            prefix: Dosya yolu öneki
+            
+        Returns:
+            list: Yazılan dosya yolları
+        """
+        paths = []
+        for thread_name, stacks in self.samples.items():
+            path = f"{prefix}_{_safe_name(thread_name)}.collapsed"
+            with open(path, 'w', encoding='utf-8') as f:
+                for stack, count in stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            paths.append(path)
+        return paths
+
+class ProfileRun:
+    """
+    Bir tarama çalıştırmasını profilleyen oturum
+    
+    cProfile yalnızca start() çağıran iş parçacığını ölçer (tarama iş parçacığı).
+    stages verilirse tüm çalıştırma yerine yalnızca stage() ile işaretlenen
+    aşamalar ayrı .pstats dosyalarına profillenir. Örnekleyici tüm iş
+    parçacıklarını kapsar.
+    """
+    def __init__(self, mode=BOTH, stages=None, output_dir=None):
+        """
+        Args:
+            mode: "cprofile", "sample" veya "both"
+            stages: Yalnızca profillenecek aşama adları (None = PROFILE_CONFIG, boş = tüm çalıştırma)
+            output_dir: Çıktı klasörü (None = PROFILE_CONFIG)
+        """
+        if mode not in MODES:
+            raise ValueError(f"Geçersiz profil modu: {mode}")
+        self.mode = mode
+        self.stages = set(PROFILE_CONFIG["stages"] if stages is None else stages)
+        self.output_dir = output_dir or PROFILE_CONFIG["output_dir"]
+        self.profile = None
+        self.stage_profiles = {}
+        self.stage_lock = threading.Lock()
+        self.stage_local = threading.local()
+        self.sampler = None
+        self.started = 0.0
+        self.files = []
+        
+    @property
+    def uses_cprofile(self):
+        return self.mode in (CPROFILE, BOTH)
+        
+    def start(self):
+        """Profillemeyi başlatır ve oturumu etkin oturum yapar"""
+        global _active_run
+        self.started = time.perf_counter()
+        if self.mode in (SAMPLE, BOTH):
+            self.sampler = StackSampler()
+            self.sampler.start()
+        if self.uses_cprofile and not self.stages:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        _active_run = self
+        return self
+        
+    def stop(self):
+        """
+        Profillemeyi durdurur ve dosyaları yazar
+        
+        Returns:
+            list: Yazılan dosya yolları
+        """
+        global _active_run
+        if _active_run is self:
+            _active_run = None
+        if self.profile:
+            self.profile.disable()
+        if self.sampler:
+            self.sampler.stop()
+            
+        os.makedirs(self.output_dir, exist_ok=True)
+        prefix = os.path.join(self.output_dir, f"profile_{time.strftime('%Y%m%d_%H%M%S')}")
+        if self.profile:
+            self.profile.dump_stats(f"{prefix}.pstats")
+            self.files.append(f"{prefix}.pstats")
+        for name, profile in self.stage_profiles.items():
+            path = f"{prefix}_{_safe_name(name)}.pstats"
+            profile.dump_stats(path)
+            self.files.append(path)
+        if self.sampler:
+            self.files.extend(self.sampler.write(prefix))
+        return self.files
+        
+    def __enter__(self):
+        return self.start()
+        
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+        
+    @contextlib.contextmanager
+    def _stage(self, name):
+        """Aşamayı kendi cProfile nesnesinde ölçer (aynı iş parçacığında iç içe aşamalar dıştakine sayılır)"""
+        if getattr(self.stage_local, 'active', False):
+            yield
+            return
+        with self.stage_lock:
+            profile = self.stage_profiles.get(name)
+            if profile is None:
+                profile = self.stage_profiles[name] = cProfile.Profile()
+        self.stage_local.active = True
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self.stage_local.active = False
+            
+    def top_functions(self, limit=15, sort="cumulative"):
+        """
+        Returns:
+            str: Tüm çalıştırma profilinin en maliyetli fonksiyonları (cProfile yoksa boş)
+        """
+        if not self.profile:
+            return ""
+        stream = io.StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+        
+    def summary(self):
+        """Çalıştırma sonunda gösterilecek kısa özet"""
+        lines = [f"Profil ({self.mode}, {time.perf_counter() - self.started:.1f} sn) yazıldı:"]
+        lines.extend(f"  {path}" for path in self.files)
+        if self.sampler:
+            lines.append(f"  {self.sampler.sample_count} örnek, "
+                         f"{len(self.sampler.samples)} iş parçacığı")
+        return "\n".join(lines)
+
+def stage(name):
+    """
+    Aşama işaretleyici: etkin profil oturumu bu aşamayı seçtiyse cProfile ile ölçer
+    
+    Oturum yoksa veya aşama seçilmediyse paylaşılan boş bağlam döner.
+    
+    Args:
+        name: Aşama adı (ör. "postprocess", "dedup", "export", "email.scan_page")
+    """
+    run = _active_run
+    if run is None or name not in run.stages or not run.uses_cprofile:
+        return _NULL_CONTEXT
+    return run._stage(name)
+
+def profiled(name):
+    """
+    Fonksiyonu stage(name) içinde çalıştıran dekoratör
+    
+    Args:
+        name: Aşama adı
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
\ No newline at end of file
@@ -0,0 +1,211 @@
+"""
+Yeniden deneme ve geri çekilme (backoff) politikaları
+"""
+import time
+import random
+import threading
+
+from selenium.common.exceptions import (
+    StaleElementReferenceException, TimeoutException, NoSuchElementException,
+    ElementClickInterceptedException, ElementNotInteractableException,
+    InvalidSessionIdException, NoSuchWindowException, WebDriverException
+)
+
+from .config import RETRY_CONFIG
+
+# Oturumun kaybolduğunu gösteren WebDriver hata mesajları
+SESSION_LOST_MARKERS = (
+    'invalid session id', 'session deleted', 'disconnected', 'chrome not reachable',
+    'no such window', 'target window already closed', 'session not created'
+)
+
+def classify_exception(exc):
+    """
+    Hatayı yeniden deneme kararı için sınıflandırır
+    
+    Args:
+        exc: Yakalanan hata
+        
+    Returns:
+        str: stale_element, timeout, no_such_element, not_interactable,
+             session_lost, webdriver veya unknown
+    """
+    if isinstance(exc, StaleElementReferenceException):
+        return "stale_element"
+    if isinstance(exc, TimeoutException):
+        return "timeout"
+    if isinstance(exc, NoSuchElementException):
+        return "no_such_element"
+    if isinstance(exc, (ElementClickInterceptedException, ElementNotInteractableException)):
+        return "not_interactable"
+    if isinstance(exc, (InvalidSessionIdException, NoSuchWindowException)):
+        return "session_lost"
+    if isinstance(exc, WebDriverException):
+        message = (exc.msg or str(exc)).lower()
+        if any(marker in message for marker in SESSION_LOST_MARKERS):
+            return "session_lost"
+        return "webdriver"
+    return "unknown"
+
+class RetryPolicy:
+    """
+    Üstel geri çekilme, rastgele sapma (jitter) ve süre bütçesi içeren yeniden deneme politikası
+    """
+    def __init__(self, max_attempts=3, base_delay=0.5, max_delay=8.0, jitter=0.3,
+                 budget_seconds=None, retry_on=None):
+        """
+        Args:
+            max_attempts: İlk deneme dahil toplam deneme sayısı
+            base_delay: İlk yeniden deneme öncesi bekleme (saniye)
+            max_delay: Tek bir bekleme için üst sınır (saniye)
+            jitter: Beklemeye uygulanacak oransal rastgele sapma (0.3 = ±%30)
+            budget_seconds: İşlem için toplam süre bütçesi (None = sınırsız)
+            retry_on: Yeniden denenecek hata türleri
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.budget_seconds = budget_seconds
+        self.retry_on = set(retry_on or RETRY_CONFIG["default"]["retry_on"])
+        
+    def should_retry(self, kind):
+        """Hata türü yeniden denenebilir mi kontrol et (oturum kaybı hiçbir zaman denenmez)"""
+        return kind != "session_lost" and kind in self.retry_on
+        
+    def get_delay(self, attempt):
+        """
+        Yeniden deneme öncesi beklenecek süreyi hesaplar
+        
+        Args:
+            attempt: Başarısız olan denemenin sırası (0'dan başlar)
+            
+        Returns:
+            float: Bekleme süresi (saniye)
+        """
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+        
+    def with_attempts(self, max_attempts):
+        """Aynı politikanın farklı deneme sayılı bir kopyasını döndürür"""
+        return RetryPolicy(
+            max_attempts=max_attempts, base_delay=self.base_delay, max_delay=self.max_delay,
+            jitter=self.jitter, budget_seconds=self.budget_seconds, retry_on=self.retry_on
+        )
+
+def get_policy(name):
+    """
+    Yapılandırmadaki isimli politikayı döndürür
+    
+    Args:
+        name: RETRY_CONFIG anahtarı
+        
+    Returns:
+        RetryPolicy: Politika nesnesi (bulunamazsa varsayılan)
+    """
+    settings = dict(RETRY_CONFIG["default"])
+    settings.update(RETRY_CONFIG.get(name, {}))
+    return RetryPolicy(**settings)
+
+class RetryStats:
+    """
+    Çağrı noktası bazında deneme, yeniden deneme ve hata sayılarını tutan sınıf
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sites = {}  # çağrı noktası -> sayaç sözlüğü
+        
+    def _entry(self, site):
+        return self.sites.setdefault(site, {"calls": 0, "retries": 0, "failures": 0, "errors": {}})
+        
+    def record_call(self, site):
+        """Çağrı noktasına yapılan bir çağrıyı kaydet"""
+        with self.lock:
+            self._entry(site)["calls"] += 1
+            
+    def record_error(self, site, kind, retried):
+        """Bir hatayı ve yeniden denenip denenmediğini kaydet"""
+        with self.lock:
+            entry = self._entry(site)
+            entry["errors"][kind] = entry["errors"].get(kind, 0) + 1
+            if retried:
+                entry["retries"] += 1
+            else:
+                entry["failures"] += 1
+                
+    def snapshot(self):
+        """İstatistiklerin bir kopyasını döndür"""
+        with self.lock:
+            return {site: {"calls": e["calls"], "retries": e["retries"], "failures": e["failures"],
+                           "errors": dict(e["errors"])}
+                    for site, e in self.sites.items()}
+                    
+    def summary(self):
+        """
+        En çok yeniden deneme yapan çağrı noktalarının okunabilir özeti
+        
+        Returns:
+            str: Özet metni (hiç yeniden deneme yoksa boş)
+        """
+        rows = [(site, e) for site, e in self.snapshot().items() if e["retries"] or e["failures"]]
+        rows.sort(key=lambda row: -(row[1]["retries"] + row[1]["failures"]))
+        return "; ".join(
+            f"{site}: {e['calls']} çağrı, {e['retries']} yeniden deneme, {e['failures']} hata"
+            for site, e in rows
+        )
+        
+    def reset(self):
+        """Tüm istatistikleri sıfırla"""
+        with self.lock:
+            self.sites = {}
+
+# Uygulama genelinde paylaşılan istatistikler
+retry_stats = RetryStats()
+
+def call_with_retry(site, func, *args, policy=None, sleep=None, on_retry=None, **kwargs):
+    """
+    Fonksiyonu politikaya göre yeniden deneyerek çağırır
+    
+    Geçici hatalar (ör. bayat element, zaman aşımı) üstel geri çekilmeyle yeniden denenir;
+    kalıcı hatalar ve oturum kaybı hemen yukarı iletilir.
+    
+    Args:
+        site: İstatistikler için çağrı noktası adı (ör. "scraper.find_list")
+        func: Çağrılacak fonksiyon
+        policy: RetryPolicy nesnesi veya RETRY_CONFIG anahtarı (None = varsayılan)
+        sleep: Bekleme fonksiyonu (varsayılan time.sleep)
+        on_retry: Her yeniden deneme öncesi çağrılır: on_retry(exc, kind, attempt)
+        
+    Returns:
+        Fonksiyonun dönüş değeri
+        
+    Raises:
+        Exception: Yeniden denenemeyen veya denemeleri tükenen son hata
+    """
+    if policy is None or isinstance(policy, str):
+        policy = get_policy(policy or "default")
+    sleep = sleep or time.sleep
+    
+    retry_stats.record_call(site)
+    started = time.monotonic()
+    
+    for attempt in range(policy.max_attempts):
+        try:
+            return func(*args, **kwargs)
+        except Exception as exc:
+            kind = classify_exception(exc)
+            delay = policy.get_delay(attempt)
+            
+            can_retry = (
+                attempt < policy.max_attempts - 1
+                and policy.should_retry(kind)
+                and (policy.budget_seconds is None
+                     or time.monotonic() - started + delay <= policy.budget_seconds)
+            )
+            retry_stats.record_error(site, kind, can_retry)
+            if not can_retry:
+                raise
+                
+            if on_retry:
+                on_retry(exc, kind, attempt + 1)
+            sleep(delay)
\ No newline at end of file
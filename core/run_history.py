@@ -0,0 +1,294 @@
+"""
+Çalıştırma geçmişi - her taramanın performans özeti, gerileme raporu ve süre tahmini
+"""
+import os
+import json
+import time
+import sqlite3
+import threading
+from statistics import median
+
+from .config import HISTORY_CONFIG
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL,
+    search_term TEXT,
+    city TEXT,
+    max_items INTEGER,
+    collect_email INTEGER,
+    data_options TEXT,
+    businesses INTEGER,
+    wall_seconds REAL,
+    businesses_per_minute REAL,
+    name_rate REAL,
+    address_rate REAL,
+    phone_rate REAL,
+    website_rate REAL,
+    email_rate REAL,
+    commands INTEGER,
+    commands_per_business REAL,
+    sleep_seconds REAL,
+    sleep_share REAL,
+    errors INTEGER,
+    retries INTEGER,
+    browser_restarts INTEGER,
+    cancelled INTEGER DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_runs_collect_email ON runs(collect_email, id);
+"""
+
+COLUMNS = ['started_at', 'search_term', 'city', 'max_items', 'collect_email', 'data_options', 'businesses',
+           'wall_seconds', 'businesses_per_minute', 'name_rate', 'address_rate', 'phone_rate', 'website_rate',
+           'email_rate', 'commands', 'commands_per_business', 'sleep_seconds', 'sleep_share', 'errors',
+           'retries', 'browser_restarts', 'cancelled']
+
+# Gerileme kontrolü yapılan ölçümler: (sütun, başlık, yüksek değer iyi mi)
+COMPARED_METRICS = [
+    ('businesses_per_minute', "İşletme/dk", True),
+    ('name_rate', "İsim oranı", True),
+    ('address_rate', "Adres oranı", True),
+    ('phone_rate', "Telefon oranı", True),
+    ('website_rate', "Website oranı", True),
+    ('email_rate', "E-posta oranı", True),
+    ('commands_per_business', "Komut/işletme", False),
+    ('error_rate', "Hata/işletme", False),
+]
+
+def field_hit_rates(records):
+    """
+    Alanların dolu olma oranları
+    
+    E-posta oranı yalnızca websitesi olan kayıtlar üzerinden hesaplanır.
+    
+    Args:
+        records: BusinessRecord listesi
+        
+    Returns:
+        dict: name_rate, address_rate, phone_rate, website_rate, email_rate (kayıt yoksa None)
+    """
+    total = len(records)
+    if not total:
+        return {f"{field}_rate": None for field in ('name', 'address', 'phone', 'website', 'email')}
+    with_website = [record for record in records if record.website]
+    return {
+        "name_rate": sum(1 for record in records if record.name) / total,
+        "address_rate": sum(1 for record in records if record.address) / total,
+        "phone_rate": sum(1 for record in records if record.phone) / total,
+        "website_rate": len(with_website) / total,
+        "email_rate": (sum(1 for record in with_website if record.emails) / len(with_website)
+                       if with_website else None),
+    }
+
+class RunHistory:
+    """
+    Çalıştırma özetlerini SQLite veritabanında tutan geçmiş
+    
+    Her tarama sonunda tek satır yazılır. Son çalıştırmalar, öncesindeki
+    çalıştırmaların medyanından oluşan taban çizgisiyle karşılaştırılır;
+    e-posta toplama süreyi ve oranları çok değiştirdiğinden yalnızca aynı
+    e-posta ayarıyla yapılan çalıştırmalar karşılaştırılır.
+    """
+    def __init__(self, path=None):
+        """
+        Args:
+            path: Veritabanı dosyası (None = HISTORY_CONFIG)
+        """
+        self.path = path or HISTORY_CONFIG["path"]
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+        
+    def record(self, summary):
+        """
+        Çalıştırma özetini yazar
+        
+        Args:
+            summary: COLUMNS alanlarını içeren sözlük (eksikler NULL olur)
+            
+        Returns:
+            int: Satır kimliği
+        """
+        values = dict(summary)
+        if isinstance(values.get('data_options'), dict):
+            values['data_options'] = json.dumps(values['data_options'], sort_keys=True)
+        row = [values.get(column) for column in COLUMNS]
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                f"INSERT INTO runs ({', '.join(COLUMNS)}) VALUES ({', '.join('?' for _ in COLUMNS)})", row
+            )
+            return cursor.lastrowid
+            
+    def recent(self, limit=20, collect_email=None, include_cancelled=False):
+        """
+        Son çalıştırmalar (yeniden eskiye)
+        
+        Args:
+            limit: En fazla satır
+            collect_email: Yalnızca bu e-posta ayarıyla yapılanlar (None = hepsi)
+            include_cancelled: İptal edilen çalıştırmalar dahil mi
+            
+        Returns:
+            list: Satır sözlükleri (error_rate hesaplanmış olarak)
+        """
+        conditions = ["businesses > 0"]
+        arguments = []
+        if collect_email is not None:
+            conditions.append("collect_email = ?")
+            arguments.append(int(collect_email))
+        if not include_cancelled:
+            conditions.append("cancelled = 0")
+        sql = f"SELECT * FROM runs WHERE {' AND '.join(conditions)} ORDER BY id DESC LIMIT ?"
+        with self.lock:
+            rows = self.connection.execute(sql, arguments + [limit]).fetchall()
+        runs = []
+        for row in rows:
+            run = dict(row)
+            run['error_rate'] = (run['errors'] or 0) / run['businesses']
+            runs.append(run)
+        return runs
+        
+    def compare(self, latest=None, baseline=None, threshold=None, collect_email=None):
+        """
+        Son çalıştırmaları taban çizgisiyle karşılaştırır
+        
+        Args:
+            latest: Karşılaştırılan son çalıştırma sayısı (None = HISTORY_CONFIG)
+            baseline: Taban çizgisini oluşturan önceki çalıştırma sayısı (None = HISTORY_CONFIG)
+            threshold: Gerileme sayılan göreli kötüleşme (ör. 0.2 = %20, None = HISTORY_CONFIG)
+            collect_email: E-posta ayarı (None = en son çalıştırmanınki)
+            
+        Returns:
+            dict: latest_runs, baseline_runs ve rows [(başlık, son medyan, taban medyan, değişim, gerileme mi)]
+        """
+        latest = latest or HISTORY_CONFIG["compare_latest"]
+        baseline = baseline or HISTORY_CONFIG["baseline_runs"]
+        threshold = HISTORY_CONFIG["regression_threshold"] if threshold is None else threshold
+        if collect_email is None:
+            newest = self.recent(limit=1)
+            if not newest:
+                return {"latest_runs": 0, "baseline_runs": 0, "rows": []}
+            collect_email = bool(newest[0]['collect_email'])
+            
+        runs = self.recent(limit=latest + baseline, collect_email=collect_email)
+        latest_runs, baseline_runs = runs[:latest], runs[latest:]
+        rows = []
+        for column, title, higher_is_better in COMPARED_METRICS:
+            current = [run[column] for run in latest_runs if run[column] is not None]
+            previous = [run[column] for run in baseline_runs if run[column] is not None]
+            if not current or not previous:
+                continue
+            current_value, baseline_value = median(current), median(previous)
+            if baseline_value:
+                change = (current_value - baseline_value) / abs(baseline_value)
+            else:
+                change = 0.0 if current_value == baseline_value else (1.0 if current_value > 0 else -1.0)
+            worse = -change if higher_is_better else change
+            rows.append((title, current_value, baseline_value, change, worse > threshold))
+        return {"latest_runs": len(latest_runs), "baseline_runs": len(baseline_runs),
+                "collect_email": collect_email, "rows": rows}
+        
+    def format_report(self, **kwargs):
+        """
+        Returns:
+            str: Son çalıştırmalar ve gerileme tablosu
+        """
+        runs = self.recent(limit=HISTORY_CONFIG["report_runs"], include_cancelled=True)
+        if not runs:
+            return "Çalıştırma geçmişi boş."
+        lines = ["Son çalıştırmalar:",
+                 f"{'Tarih':<16}  {'Arama':<24}  {'İşletme':>7}  {'Süre':>7}  {'İşl/dk':>6}  "
+                 f"{'Komut/işl':>9}  {'Bekleme':>7}  {'Hata':>4}"]
+        for run in runs:
+            stamp = time.strftime('%Y-%m-%d %H:%M', time.localtime(run['started_at']))
+            query = f"{run['search_term']} / {run['city']}"[:24]
+            commands = f"{run['commands_per_business']:.0f}" if run['commands_per_business'] else "-"
+            sleep_share = f"%{run['sleep_share'] * 100:.0f}" if run['sleep_share'] is not None else "-"
+            mark = " (iptal)" if run['cancelled'] else ""
+            lines.append(f"{stamp:<16}  {query:<24}  {run['businesses']:>7}  {run['wall_seconds']:>6.0f}s  "
+                         f"{run['businesses_per_minute']:>6.1f}  {commands:>9}  {sleep_share:>7}  "
+                         f"{run['errors']:>4}{mark}")
+            
+        comparison = self.compare(**kwargs)
+        if not comparison["rows"]:
+            lines.append("Karşılaştırma için yeterli geçmiş yok.")
+            return "\n".join(lines)
+        email_note = "e-posta dahil" if comparison["collect_email"] else "e-postasız"
+        lines.append(f"\nSon {comparison['latest_runs']} çalıştırma, önceki {comparison['baseline_runs']} "
+                     f"çalıştırmaya göre ({email_note}, medyan):")
+        regressions = 0
+        for title, current, baseline, change, regressed in comparison["rows"]:
+            flag = "  <-- GERİLEME" if regressed else ""
+            regressions += regressed
+            lines.append(f"  {title:<14} {current:>9.2f}  (taban {baseline:.2f}, {change * 100:+.0f}%){flag}")
+        if regressions:
+            lines.append(f"{regressions} ölçümde gerileme var; Google Maps işaretlemesi değişmiş olabilir "
+                         "(seçiciler ve alan oranlarını kontrol edin).")
+        return "\n".join(lines)
+        
+    def estimate(self, max_items, collect_email=True):
+        """
+        Yeni bir işin süresini geçmiş çalıştırmalardan tahmin eder
+        
+        Süre, benzer çalıştırmalarda işletme başına sürenin medyanı ve sabit
+        başlangıç maliyeti (tarayıcı açma, arama sayfası) ile hesaplanır.
+        
+        Args:
+            max_items: İstenen işletme sayısı
+            collect_email: E-posta toplanacak mı
+            
+        Returns:
+            tuple: (tahmini saniye, dayanılan çalıştırma sayısı) veya yeterli geçmiş yoksa None
+        """
+        runs = self.recent(limit=HISTORY_CONFIG["baseline_runs"], collect_email=collect_email)
+        if len(runs) < HISTORY_CONFIG["min_runs_for_estimate"]:
+            return None
+        per_business = median(run['wall_seconds'] / run['businesses'] for run in runs)
+        overhead = HISTORY_CONFIG["startup_seconds"]
+        if len(runs) >= 3 and len({run['businesses'] for run in runs}) >= 2:
+            # İşletme sayıları farklıysa süre = sabit + eğim * adet doğrusuna en küçük kareler
+            counts = [run['businesses'] for run in runs]
+            walls = [run['wall_seconds'] for run in runs]
+            mean_count, mean_wall = sum(counts) / len(counts), sum(walls) / len(walls)
+            slope = (sum((c - mean_count) * (w - mean_wall) for c, w in zip(counts, walls)) /
+                     sum((c - mean_count) ** 2 for c in counts))
+            if slope > 0:
+                per_business = slope
+                overhead = max(0.0, mean_wall - slope * mean_count)
+        return overhead + per_business * max_items, len(runs)
+        
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+def format_estimate(max_items, collect_email=True, path=None):
+    """
+    Süre tahmini mesajı (geçmiş yoksa veya okunamazsa None)
+    
+    Geçmiş kaydı kapalıyken de önceden kaydedilmiş çalıştırmalar kullanılır;
+    veritabanı dosyası yoksa oluşturulmaz.
+    
+    Args:
+        max_items: İstenen işletme sayısı
+        collect_email: E-posta toplanacak mı
+        path: Veritabanı dosyası (None = HISTORY_CONFIG)
+    """
+    path = path or HISTORY_CONFIG["path"]
+    if not os.path.exists(path):
+        return None
+    try:
+        history = RunHistory(path)
+        try:
+            result = history.estimate(max_items, collect_email)
+        finally:
+            history.close()
+    except sqlite3.Error:
+        return None
+    if result is None:
+        return None
+    seconds, runs = result
+    minutes, rest = divmod(int(seconds), 60)
+    return f"Tahmini süre: {minutes} dk {rest} sn ({runs} benzer çalıştırmaya göre)"
\ No newline at end of file
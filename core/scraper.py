@@ -4,60 +4,97 @@ Google Maps Scraper ana sınıfı - Veri toplama seçenekleri eklendi
 import re
 import time
 import random
+import sqlite3
 from urllib.parse import urlparse
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import TimeoutException
 
 from .browser import BrowserManager
-from .config import MAPS_CONFIG, CSS_SELECTORS
+from .config import MAPS_CONFIG, CSS_SELECTORS, DOMAIN_CONFIG, HISTORY_CONFIG
+from .prefetcher import DetailPrefetcher
+from .cancellation import CancellationToken, OperationCancelled
+from .tracing import tracer
+from .command_tracer import command_tracer
+from .memory_monitor import memory_monitor
+from .page_metrics import page_metrics_stats
+from .snapshots import snapshot_recorder
+from .metrics import QUEUE_DEPTH
+from .run_history import RunHistory, field_hit_rates
+from .events import (
+    EventBus, DEBUG, WARNING, STATUS, PROGRESS, PAGE_LOADED, BUSINESS_STARTED,
+    BUSINESS_FINISHED, RETRY, ERROR_EVENT
+)
+from .retry import call_with_retry, classify_exception, get_policy, retry_stats
 from .extractors.business_extractor import BusinessInfoExtractor
 from .extractors.email_extractor import EmailExtractor
 from utils.email_finder import EmailFinder
+from utils.domain_index import configure_domain_index
 
 class MapsScraper:
     """
     Google Maps scraping işlemlerini yöneten sınıf
     """
-    def __init__(self, queue_handler=None):
+    def __init__(self, queue_handler=None, event_bus=None):
         """
         Args:
-            queue_handler: İleti kuyruğu
+            queue_handler: İleti kuyruğu (eski biçim ("status", mesaj) demetleri alır)
+            event_bus: Olayların yayınlanacağı olay yolu (None = yeni yol)
         """
         self.queue_handler = queue_handler
+        self.events = event_bus or EventBus()
+        if queue_handler:
+            self.events.subscribe(self._forward_to_queue)
+        self.progress_value = 0
+        self.progress_total = 0
+        self.cancel_token = CancellationToken()
+        self.record_history = HISTORY_CONFIG["enabled"]
         self.maps_browser = None
         self.email_finder = None
         self.processed_ids = set()  # İşlenmiş işletme kimliklerini takip etmek için set
         self.business_extractor = None
+        self.prefetcher = None
         self.data_options = {
             'collect_address': True,
             'collect_phone': True,
             'collect_website': True,
             'collect_email': True
         }
+        
+        # Website/e-posta filtrelerinin kullandığı alan adı kurallarını yükle
+        configure_domain_index(DOMAIN_CONFIG["rules_file"])
     
     def update_status(self, message):
-        """İleti kuyruğuna durum mesajı ekle"""
-        if self.queue_handler:
-            self.queue_handler.put(("status", message))
+        """Durum mesajı yayınla"""
+        self.events.status(message)
     
     def update_progress(self, value):
-        """İleti kuyruğuna ilerleme durumu ekle"""
-        if self.queue_handler:
-            self.queue_handler.put(("progress", value))
+        """İlerleme durumu yayınla"""
+        self.progress_value = value
+        self.events.emit(PROGRESS, "İlerleme: {value}/{total}", value=value, total=self.progress_total)
             
     def set_max_progress(self, value):
-        """İleti kuyruğuna maksimum ilerleme değeri ekle"""
-        if self.queue_handler:
-            self.queue_handler.put(("max_progress", value))
+        """Maksimum ilerleme değerini yayınla"""
+        self.progress_total = value
+        self.update_progress(self.progress_value)
+        
+    def _forward_to_queue(self, event):
+        """Olayları eski biçim ileti kuyruğuna aktarır"""
+        if event.kind == PROGRESS:
+            self.queue_handler.put(("max_progress", event.payload["total"]))
+            self.queue_handler.put(("progress", event.payload["value"]))
+        elif event.kind == BUSINESS_FINISHED:
+            self.queue_handler.put(("result", event.payload["record"]))
+        else:
+            self.queue_handler.put(("status", event.message))
     
     def initialize_browsers(self):
         """Tarayıcıları başlat"""
         # Ana tarayıcı (Maps için)
-        self.maps_browser = BrowserManager(self.update_status)
+        self.maps_browser = BrowserManager(self.update_status, cancel_token=self.cancel_token)
         self.maps_browser.initialize()
         
         # E-posta bulucu
@@ -68,17 +105,32 @@ class MapsScraper:
         
         # İşletme bilgisi çıkarıcı
         self.business_extractor = BusinessInfoExtractor(
+            browser=self.maps_browser,
+            update_status_callback=self.update_status,
+            event_bus=self.events
+        )
+        
+        # Detay sayfası ön yükleyici
+        self.prefetcher = DetailPrefetcher(
             browser=self.maps_browser,
             update_status_callback=self.update_status
         )
+        QUEUE_DEPTH.labels("prefetch").set_function(lambda: len(self.prefetcher.pending) if self.prefetcher else 0)
     
     def close_browsers(self):
         """Tarayıcıları kapat"""
+        if self.prefetcher:
+            # Yarım bırakılan yükleme sürerken sekme komutları beklerdi; sekmeler tarayıcıyla kapanır
+            navigating = self.maps_browser is not None and self.maps_browser.is_navigating()
+            self.prefetcher.cancel_all(close_tabs=not navigating)
+            self.prefetcher = None
+            
         if self.maps_browser:
             self.maps_browser.close()
             self.maps_browser = None
     
-    def scrape(self, search_term, city, max_items=20, is_running_check=None, data_options=None):
+    def scrape(self, search_term, city, max_items=20, is_running_check=None, data_options=None,
+               result_callback=None, cancel_token=None, record_history=None):
         """
         Google Maps'te arama yap ve işletme bilgilerini topla
         
@@ -86,15 +138,30 @@ class MapsScraper:
             search_term: Aranacak terim
             city: Şehir
             max_items: Maksimum işletme sayısı
-            is_running_check: Çalışma durumunu kontrol eden fonksiyon
+            is_running_check: Çalışma durumunu kontrol eden fonksiyon (yalnızca döngü aralarında bakılır)
             data_options: Hangi verilerin toplanacağını belirten seçenekler
+            result_callback: Her işletme toplandığında BusinessRecord ile çağrılacak fonksiyon
+            cancel_token: İptal belirteci; iptal edilince beklemeler ve sayfa yüklemeleri
+                hemen kesilir, o ana kadar toplanan kayıtlar döndürülür
+            record_history: Çalıştırma özeti geçmiş veritabanına yazılsın mı (None = HISTORY_CONFIG)
             
         Returns:
-            list: İşletme bilgilerini içeren liste
+            list: BusinessRecord listesi (iptalde kısmi liste)
         """
+        self.cancel_token = cancel_token or CancellationToken()
+        self.record_history = HISTORY_CONFIG["enabled"] if record_history is None else record_history
         results = []
         processed = 0
+        self.progress_value = 0
         self.processed_ids = set()  # İşlenmiş işletme kimliklerini takip etme
+        run_started = time.time()
+        wall_started = time.perf_counter()
+        counts_before = (self.events.counts[ERROR_EVENT], self.events.counts[RETRY])
+        retry_stats.reset()
+        tracer.reset()
+        command_tracer.reset()
+        page_metrics_stats.reset()
+        snapshot_recorder.reset()
         
         # Veri toplama seçeneklerini ayarla
         if data_options:
@@ -107,7 +174,7 @@ class MapsScraper:
             self.initialize_browsers()
             
             # Durum kontrolü
-            if is_running_check and not is_running_check():
+            if self._should_stop(is_running_check):
                 self.update_status("İşlem iptal edildi.")
                 return results
             
@@ -117,10 +184,19 @@ class MapsScraper:
             self.update_status(f"Google Maps'e gidiliyor: {url}")
             
             try:
-                self.maps_browser.driver.get(url)
+                load_started = time.perf_counter()
+                with tracer.span("scraper.open_search"):
+                    call_with_retry(
+                        "scraper.open_search", self.maps_browser.get, url,
+                        policy="page_load", sleep=self.maps_browser.sleep, on_retry=self._report_retry
+                    )
+                self.events.emit(PAGE_LOADED, "Arama sayfası yüklendi ({seconds:.1f} sn)",
+                                 url=url, seconds=time.perf_counter() - load_started)
+                memory_monitor.checkpoint("arama_yüklendi")
                 self.maps_browser.random_sleep()
             except Exception as e:
-                self.update_status(f"Google Maps yükleme hatası: {str(e)}")
+                self.events.error("Google Maps yükleme hatası: {error}", error=str(e),
+                                  error_kind=classify_exception(e))
                 raise Exception("Google Maps yüklenemedi.")
             
             # İlerleme durumunu ayarla
@@ -141,7 +217,7 @@ class MapsScraper:
             
             while processed < max_items and scroll_count < max_scroll_attempts:
                 # Durum kontrolü
-                if is_running_check and not is_running_check():
+                if self._should_stop(is_running_check):
                     self.update_status("İşlem iptal edildi.")
                     break
                 
@@ -150,44 +226,85 @@ class MapsScraper:
                 if not items:
                     self.update_status("Hiç işletme bulunamadı, sayfayı yeniliyorum...")
                     try:
-                        self.maps_browser.driver.refresh()
+                        self.maps_browser.refresh()
                         self.maps_browser.random_sleep()
                         business_list = self._find_business_list()
                         if not business_list:
                             break
                         continue
-                    except:
+                    except Exception:
                         break
                 
                 # İşletmeleri işle
-                for item in items:
+                browser_recycled = False
+                for index, item in enumerate(items):
                     # Maksimum sayıya ulaşıldı mı kontrol et
                     if processed >= max_items:
                         break
                         
                     # Durdurma kontrolü
-                    if is_running_check and not is_running_check():
+                    if self._should_stop(is_running_check):
                         self.update_status("İşlem iptal edildi.")
                         break
                     
                     # İşletmenin benzersiz kimliğini al
                     item_id = self._get_item_unique_id(item)
                     
-                    # Önceden işlenmiş işletmeyi atla
+                    # Önceden işlenmiş işletmeyi atla (mükerrer öğenin ön yüklemesi varsa sekmesini kapat)
                     if item_id in self.processed_ids:
+                        self.prefetcher.cancel(item_id)
                         continue
                     
                     # İşletme kimliğini işlenmiş olarak işaretle
                     self.processed_ids.add(item_id)
                     
+                    # Önceden yüklenmiş sekme varsa al, sıradakileri arka planda yüklemeye başlat
+                    prefetched_handle = self.prefetcher.take(item_id)
+                    self._schedule_prefetch(items[index + 1:], max_items - processed - 1)
+                    
                     # İşletmeyi işle
-                    business_info = self._process_business_item(item, processed, max_items)
+                    item_started = time.perf_counter()
+                    command_tracer.begin_business(item_id)
+                    memory_monitor.begin_business(item_id)
+                    try:
+                        with tracer.span("business", index=processed + 1) as business_span:
+                            business_info = self._process_business_item(
+                                item, processed, max_items, prefetched_handle=prefetched_handle
+                            )
+                            business_span.set(name=business_info.name if business_info else None,
+                                              prefetched=bool(prefetched_handle))
+                    finally:
+                        # İptal veya hata durumunda da işletme sayaçları kapanmalı (sonrakine taşmasın)
+                        command_tracer.end_business()
+                        memory_monitor.end_business()
                     
-                    if business_info and 'İsim' in business_info and business_info['İsim']:
+                    if business_info:
                         # İşlenen işletmeyi kaydet
                         results.append(business_info)
+                        if result_callback:
+                            result_callback(business_info)
+                        self.events.emit(BUSINESS_FINISHED, "İşletme tamamlandı: {name} ({seconds:.1f} sn)",
+                                         name=business_info.name, record=business_info,
+                                         seconds=time.perf_counter() - item_started)
                         processed += 1
                         self.update_progress(processed)
+                    
+                    # Tarayıcı belleğini kontrol et, sınır aşıldıysa yeniden başlatılacak
+                    if self.maps_browser.check_memory():
+                        browser_recycled = True
+                        break
+                
+                # Bu turda kullanılmayan ön yüklemeler bayatladı, sekmelerini kapat
+                self.prefetcher.cancel_all()
+                
+                # Bellek sınırı aşıldıysa tarayıcıyı yeniden başlat ve listeye geri dön
+                if browser_recycled:
+                    business_list = self._recycle_browser(url)
+                    if not business_list:
+                        break
+                    last_height = 0
+                    consecutive_no_change = 0
+                    continue
                 
                 # Daha fazla sonuç için aşağı kaydır
                 try:
@@ -205,19 +322,20 @@ class MapsScraper:
                             self.update_status("Daha fazla sonuç yüklemek için güçlü kaydırma yapılıyor...")
                             
                             # Güçlü kaydırma: Birkaç hızlı kaydırma yaparak tarayıcıyı tetikle
-                            for _ in range(3):
-                                self.maps_browser.driver.execute_script(
-                                    "arguments[0].scrollTop += 500;", business_list
-                                )
-                                time.sleep(0.2)
-                            
-                            # Ardından daha uzun bekleme
-                            self.maps_browser.random_sleep(1.5, 3)
+                            with tracer.span("scraper.scroll", strong=True):
+                                for _ in range(3):
+                                    self.maps_browser.driver.execute_script(
+                                        "arguments[0].scrollTop += 500;", business_list
+                                    )
+                                    self.maps_browser.sleep(0.2)
+                                
+                                # Ardından daha uzun bekleme
+                                self.maps_browser.random_sleep(1.5, 3)
                             
                             # Sayfayı yenile ve sıfırla (son çare olarak)
                             if consecutive_no_change >= 5:
                                 self.update_status("Yeni sonuçlar yüklenemedi, sayfa yenileniyor...")
-                                self.maps_browser.driver.refresh()
+                                self.maps_browser.refresh()
                                 self.maps_browser.random_sleep()
                                 business_list = self._find_business_list()
                                 consecutive_no_change = 0
@@ -228,13 +346,12 @@ class MapsScraper:
                         # Yükseklik değişti, sayacı sıfırla
                         consecutive_no_change = 0
                     
-                    # Kaydırma işlemi
-                    self.maps_browser.driver.execute_script(
-                        "arguments[0].scrollTop += 300;", business_list
-                    )
-                    
-                    # Yükleme için bekle (1-2 saniye)
-                    self.maps_browser.random_sleep(1, 2)
+                    # Kaydırma işlemi ve yükleme için bekleme (1-2 saniye)
+                    with tracer.span("scraper.scroll"):
+                        self.maps_browser.driver.execute_script(
+                            "arguments[0].scrollTop += 300;", business_list
+                        )
+                        self.maps_browser.random_sleep(1, 2)
                     
                     # Son yüksekliği güncelle
                     last_height = current_height
@@ -243,34 +360,157 @@ class MapsScraper:
                     scroll_count += 1
                     
                 except Exception as scroll_err:
-                    self.update_status(f"Kaydırma hatası: {str(scroll_err)}")
+                    error_kind = classify_exception(scroll_err)
+                    self.events.emit(ERROR_EVENT, "Kaydırma hatası: {error}", WARNING,
+                                     error=str(scroll_err), error_kind=error_kind)
+                    
+                    # Oturum kaybı kurtarılamaz, yenilemek yerine hatayı ilet
+                    if error_kind == "session_lost":
+                        raise
+                    
+                    # Liste elementi bayatladıysa sayfayı yenilemeden yeniden bul
+                    if error_kind == "stale_element":
+                        business_list = self._find_business_list()
+                        if not business_list:
+                            break
+                        continue
+                    
                     # Hata durumunda kısa bekleme
-                    time.sleep(1)
+                    self.maps_browser.sleep(1)
                     
                     # Kritik hata durumunda sayfa yenile
                     try:
-                        self.maps_browser.driver.refresh()
+                        self.maps_browser.refresh()
                         self.maps_browser.random_sleep()
                         business_list = self._find_business_list()
                         if not business_list:
                             break
-                    except:
+                    except Exception:
                         break
             
+            # Kalan ön yüklemeleri iptal et
+            self.prefetcher.cancel_all()
+            memory_monitor.checkpoint("tarama_bitti")
+            
             # Bilgilendirme mesajı
             if processed >= max_items:
                 self.update_status(f"Toplam {processed} işletme toplandı, hedef sayıya ulaşıldı.")
             else:
                 self.update_status(f"Toplam {processed} işletme toplandı, hedef: {max_items}.")
+            
+            retry_summary = retry_stats.summary()
+            if retry_summary:
+                self.update_status(f"Yeniden deneme özeti: {retry_summary}")
                 
             return results
             
+        except OperationCancelled:
+            # Toplanan kayıtlar result_callback ile zaten iletildi; kısmi listeyi döndür
+            self.update_status(f"İşlem iptal edildi, {processed} işletme toplandı.")
+            return results
         except Exception as e:
-            self.update_status(f"Genel hata: {str(e)}")
+            self.events.error("Genel hata: {error}", error=str(e), error_kind=classify_exception(e))
             raise
         finally:
             # Tarayıcıları kapat
+            browser = self.maps_browser
+            sleep_seconds = browser.sleep_seconds if browser else 0.0
+            restarts = browser.recycle_count if browser else 0
             self.close_browsers()
+            self._finish_trace()
+            self._report_commands()
+            self._close_snapshots()
+            self._record_history(
+                search_term, city, max_items, results, run_started, time.perf_counter() - wall_started,
+                sleep_seconds, restarts, counts_before, self._should_stop(is_running_check)
+            )
+    
+    def _record_history(self, search_term, city, max_items, results, run_started, wall_seconds,
+                        sleep_seconds, restarts, counts_before, cancelled):
+        """Çalıştırmanın performans özetini geçmiş veritabanına yaz (açıksa)"""
+        if not self.record_history:
+            return
+        businesses = len(results)
+        summary = {
+            "started_at": run_started,
+            "search_term": search_term,
+            "city": city,
+            "max_items": max_items,
+            "collect_email": int(bool(self.data_options.get('collect_email', True))),
+            "data_options": self.data_options,
+            "businesses": businesses,
+            "wall_seconds": wall_seconds,
+            "businesses_per_minute": businesses / (wall_seconds / 60) if wall_seconds > 0 else 0.0,
+            "commands": command_tracer.total_calls,
+            "commands_per_business": command_tracer.total_calls / businesses if businesses else None,
+            "sleep_seconds": sleep_seconds,
+            "sleep_share": sleep_seconds / wall_seconds if wall_seconds > 0 else None,
+            "errors": self.events.counts[ERROR_EVENT] - counts_before[0],
+            "retries": self.events.counts[RETRY] - counts_before[1],
+            "browser_restarts": restarts,
+            "cancelled": int(cancelled),
+        }
+        summary.update(field_hit_rates(results))
+        try:
+            history = RunHistory()
+            try:
+                history.record(summary)
+            finally:
+                history.close()
+        except sqlite3.Error as e:
+            self.events.error("Çalıştırma geçmişi yazılamadı: {error}", error=str(e))
+    
+    def _report_commands(self):
+        """Komut izleme ve sayfa ölçümleri açıksa raporlarını yayınla"""
+        report = command_tracer.format_report() if command_tracer.enabled else ""
+        if report:
+            self.update_status(report)
+        report = page_metrics_stats.format_report() if page_metrics_stats.enabled else ""
+        if report:
+            self.update_status(report)
+    
+    def _close_snapshots(self):
+        """Snapshot kaydı açıksa özetini yayınla ve veritabanını kapat"""
+        if not snapshot_recorder.enabled:
+            return
+        summary = snapshot_recorder.summary()
+        if summary:
+            self.update_status(summary)
+        snapshot_recorder.close()
+    
+    def _finish_trace(self):
+        """İzleme açıksa aşama süresi özetini yayınla ve Chrome trace dosyasını yaz"""
+        if not tracer.enabled or not tracer.spans:
+            return
+        self.update_status("Aşama süreleri:\n" + tracer.format_summary())
+        try:
+            path = tracer.export_chrome_trace()
+            self.update_status(f"Trace dosyası yazıldı: {path} (chrome://tracing veya ui.perfetto.dev ile açın)")
+        except OSError as e:
+            self.events.error("Trace dosyası yazılamadı: {error}", error=str(e))
+    
+    def _should_stop(self, is_running_check):
+        """İptal istendi mi (belirteç veya eski is_running_check fonksiyonu)"""
+        return self.cancel_token.is_cancelled or (is_running_check is not None and not is_running_check())
+    
+    def _recycle_browser(self, url):
+        """
+        Tarayıcıyı yeniden başlatır ve arama sonuçlarına geri döner
+        
+        Args:
+            url: Arama sonuçları URL'si
+            
+        Returns:
+            WebElement: Yeniden bulunan işletme listesi veya None
+        """
+        try:
+            self.maps_browser.recycle()
+            self.maps_browser.get(url)
+            self.maps_browser.random_sleep()
+            return self._find_business_list()
+        except Exception as e:
+            self.events.error("Tarayıcı yeniden başlatma hatası: {error}", error=str(e))
+            return None
     
     def _get_item_unique_id(self, item):
         """
@@ -318,30 +558,121 @@ class MapsScraper:
             rand_id = random.randint(1000, 9999)
             return f"err_{rand_id}"
     
+    def _get_item_place_url(self, item):
+        """
+        Liste kartından işletmenin detay (place) URL'sini çıkarır
+        
+        Returns:
+            str: Detay sayfası URL'si veya None
+        """
+        try:
+            href = self.maps_browser.driver.execute_script(
+                "var el = arguments[0];"
+                "var link = (el.tagName === 'A') ? el : el.querySelector('a.hfpxzc, a[href*=\"/maps/place/\"]');"
+                "return link ? link.href : null;",
+                item
+            )
+            if href and '/maps/place/' in href:
+                return href
+        except Exception:
+            pass
+        return None
+    
+    def _schedule_prefetch(self, upcoming_items, remaining):
+        """
+        Sıradaki işletmelerin detay sayfalarını arka planda yüklemeye başlar
+        
+        Args:
+            upcoming_items: Mevcut öğeden sonra gelen liste öğeleri
+            remaining: Hedefe ulaşmak için işlenecek kalan işletme sayısı
+        """
+        if not self.prefetcher or not self.prefetcher.is_enabled():
+            return
+            
+        # Sıradaki işlenecek işletmeler; bunların dışında kalan ön yüklemeler atlanmış demektir
+        upcoming = {}
+        for item in upcoming_items:
+            if len(upcoming) >= min(self.prefetcher.depth, remaining):
+                break
+            item_id = self._get_item_unique_id(item)
+            if item_id not in self.processed_ids:
+                upcoming.setdefault(item_id, item)
+        self.prefetcher.retain(upcoming)
+        
+        for item_id, item in upcoming.items():
+            if self.prefetcher.is_pending(item_id):
+                continue
+            if not self.prefetcher.has_capacity():
+                break
+                
+            url = self._get_item_place_url(item)
+            if url and self.prefetcher.schedule(item_id, url):
+                self.events.emit(STATUS, "Detay sayfası arka planda yükleniyor: {url}", DEBUG, url=url[:80])
+    
+    def _is_detail_page_open(self, driver):
+        """Detay sayfasının açıldığını doğrular (tıklama sonrası koşul)"""
+        if '/maps/place/' not in driver.current_url:
+            return False
+        return bool(driver.find_elements(By.CSS_SELECTOR, ", ".join(CSS_SELECTORS["business_name"])))
+    
+    @tracer.traced("scraper.panel_wait")
+    def _wait_for_info_panel(self):
+        """
+        Detay panelinin yüklenmesini bekler
+        
+        Returns:
+            bool: Panel yüklendiyse True
+        """
+        for selector in CSS_SELECTORS["info_panel"]:
+            try:
+                self.maps_browser.wait_until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)), 5)
+                return True
+            except Exception:
+                continue
+        return False
+    
+    def _report_retry(self, exc, kind, attempt):
+        """Yeniden deneme öncesi durum mesajı ver"""
+        self.events.emit(RETRY, "Geçici hata ({error_kind}), yeniden deneniyor ({attempt}. tekrar): {error}",
+                         WARNING, error_kind=kind, attempt=attempt, error=str(exc)[:100])
+    
+    @tracer.traced("scraper.find_list")
     def _find_business_list(self):
         """İşletme listesini bul"""
-        list_found = False
-        attempts = 0
-        max_attempts = MAPS_CONFIG['max_retry']
+        policy = get_policy("find_list")
         
-        while not list_found and attempts < max_attempts:
-            for selector in CSS_SELECTORS["business_list"]:
-                try:
-                    business_list = WebDriverWait(self.maps_browser.driver, 5).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    if business_list:
-                        self.update_status(f"İşletme listesi bulundu: {selector}")
-                        return business_list
-                except:
-                    continue
-            
-            self.update_status(f"İşletme listesi bulunamadı, yeniden deneniyor... ({attempts+1}/{max_attempts})")
-            self.maps_browser.driver.refresh()
-            self.maps_browser.random_sleep()
-            attempts += 1
+        def refresh_before_retry(exc, kind, attempt):
+            self.update_status(f"İşletme listesi bulunamadı, yeniden deneniyor... ({attempt}/{policy.max_attempts - 1})")
+            self.maps_browser.refresh()
         
-        return None
+        try:
+            return call_with_retry(
+                "scraper.find_list", self._locate_business_list,
+                policy=policy, sleep=self.maps_browser.sleep, on_retry=refresh_before_retry
+            )
+        except Exception as e:
+            self.update_status(f"İşletme listesi bulunamadı: {str(e)[:100]}")
+            return None
+    
+    def _locate_business_list(self):
+        """
+        İşletme listesini seçicilerle bir kez arar
+        
+        Raises:
+            TimeoutException: Hiçbir seçiciyle liste bulunamazsa
+        """
+        for selector in CSS_SELECTORS["business_list"]:
+            try:
+                business_list = self.maps_browser.wait_until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, selector)), 5
+                )
+                if business_list:
+                    self.events.emit(STATUS, "İşletme listesi bulundu: {selector}", DEBUG, selector=selector)
+                    return business_list
+            except TimeoutException:
+                continue
+        
+        raise TimeoutException("İşletme listesi seçicilerle bulunamadı")
     
     def _find_business_items(self, business_list):
         """İşletme öğelerini bul"""
@@ -353,14 +684,14 @@ class MapsScraper:
             try:
                 items = business_list.find_elements(By.CSS_SELECTOR, selector)
                 if items:
-                    self.update_status(f"{len(items)} işletme öğesi bulundu")
+                    self.events.emit(STATUS, "{count} işletme öğesi bulundu", DEBUG, count=len(items))
                     break
-            except:
+            except Exception:
                 continue
         
         return items
     
-    def _process_business_item(self, item, processed, max_items):
+    def _process_business_item(self, item, processed, max_items, prefetched_handle=None):
         """
         İşletme öğesini işle - Geri gitmeyi engelleyen yeni yöntem
         Kullanıcının seçtiği veri toplama seçeneklerine göre işlem yapar
@@ -369,9 +700,10 @@ class MapsScraper:
             item: İşletme öğesi (WebElement)
             processed: İşlenen öğe sayısı
             max_items: Maksimum öğe sayısı
+            prefetched_handle: Detay sayfasının önceden yüklendiği sekme (varsa)
             
         Returns:
-            dict: İşletme bilgileri
+            BusinessRecord: İşletme bilgileri
         """
         # İşletme adını al
         business_name = self.maps_browser.get_safe_text(item, "İsimsiz İşletme")
@@ -379,10 +711,15 @@ class MapsScraper:
             # Alternatif yöntem
             try:
                 business_name = item.get_attribute("aria-label") or "İsimsiz İşletme"
-            except:
+            except Exception:
                 pass
         
-        self.update_status(f"İşletme seçiliyor: {business_name} (#{processed+1}/{max_items})")
+        self.events.emit(BUSINESS_STARTED, "İşletme seçiliyor: {name} (#{index}/{total})",
+                         name=business_name, index=processed + 1, total=max_items)
+        
+        # Önceden yüklenmiş sekme varsa tıklamadan orada çıkarım yap
+        if prefetched_handle:
+            return self._process_prefetched_item(prefetched_handle)
         
         # Ana sekmenin durumunu kaydet
         try:
@@ -392,32 +729,23 @@ class MapsScraper:
                 item_location = self.maps_browser.driver.execute_script(
                     "return arguments[0].getBoundingClientRect()", item
                 )
-            except:
+            except Exception:
                 pass
                 
-            # Öğeye tıkla
-            click_success = self.maps_browser.safe_click(item)
+            # Öğeye tıkla - başarı, detay sayfasının açılıp işletme başlığının görünmesiyle doğrulanır
+            click_success = self.maps_browser.safe_click(
+                item, page_type="list_card", verify=self._is_detail_page_open
+            )
             if not click_success:
-                self.update_status(f"Bu işletmeye tıklanamadı, atlıyorum.")
+                self.events.status("Bu işletmeye tıklanamadı, atlıyorum.")
                 return None
             
-            self.maps_browser.random_sleep()  # Detay panelinin yüklenmesi için bekle
-            
             # Panel yüklendiğini kontrol et
-            panel_loaded = False
-            for selector in CSS_SELECTORS["info_panel"]:
-                try:
-                    info_panel = WebDriverWait(self.maps_browser.driver, 5).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    panel_loaded = True
-                    break
-                except:
-                    continue
-            
-            if not panel_loaded:
+            if not self._wait_for_info_panel():
                 self.update_status("Panel yüklenemedi, bir sonraki işletmeye geçiliyor...")
                 return None
+            self.maps_browser.collect_page_metrics("maps_detail")
+            self.maps_browser.snapshot_page("maps_detail")
             
             # Veri seçeneklerini business_extractor'a ilet
             self.business_extractor.set_data_options(self.data_options)
@@ -432,12 +760,13 @@ class MapsScraper:
                 actions.perform()
                 self.maps_browser.random_sleep(0.5, 1.5)
             except Exception as e:
-                self.update_status(f"Panel kapatma hatası: {str(e)}")
+                self.events.warning("Panel kapatma hatası: {error}", error=e)
             
             return business_info
             
         except Exception as e:
-            self.update_status(f"İşletme işleme hatası: {str(e)}")
+            self.events.emit(ERROR_EVENT, "İşletme işleme hatası: {error}", WARNING, error=str(e),
+                             error_kind=classify_exception(e))
             
             # Kritik hata durumunda ESC tuşuna basarak diyalogları kapatmayı dene
             try:
@@ -445,7 +774,49 @@ class MapsScraper:
                 actions.send_keys(Keys.ESCAPE)
                 actions.perform()
                 self.maps_browser.random_sleep(0.5, 1)
-            except:
+            except Exception:
                 pass
                 
-            return None
\ No newline at end of file
+            return None
+    
+    def _process_prefetched_item(self, handle):
+        """
+        Arka planda önceden yüklenmiş detay sayfasından işletme bilgilerini çıkarır
+        
+        Args:
+            handle: Detay sayfasının yüklendiği sekme tanımlayıcısı
+            
+        Returns:
+            BusinessRecord: İşletme bilgileri
+        """
+        driver = self.maps_browser.driver
+        main_window = driver.current_window_handle
+        
+        try:
+            driver.switch_to.window(handle)
+            
+            # Sayfa arka planda yüklenirken beklenen süre burada büyük ölçüde geçmiş olur
+            if not self._wait_for_info_panel():
+                self.update_status("Önceden yüklenen panel hazır değil, bir sonraki işletmeye geçiliyor...")
+                return None
+            self.maps_browser.collect_page_metrics("maps_detail")
+            self.maps_browser.snapshot_page("maps_detail")
+            
+            self.business_extractor.set_data_options(self.data_options)
+            return self.business_extractor.extract_business_info()
+            
+        except Exception as e:
+            self.events.warning("Önceden yüklenen işletme işleme hatası: {error}", error=e)
+            return None
+        finally:
+            # Ön yükleme sekmesini kapat ve liste sekmesine dön
+            try:
+                if handle in driver.window_handles:
+                    driver.switch_to.window(handle)
+                    driver.close()
+                driver.switch_to.window(main_window)
+            except Exception:
+                try:
+                    driver.switch_to.window(main_window)
+                except Exception:
+                    pass
\ No newline at end of file
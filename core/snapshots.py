@@ -0,0 +1,286 @@
+"""
+Sayfa anlık görüntüleri (snapshot) - detay paneli ve website HTML'lerini kaydetme ve tarayıcısız yeniden çıkarım
+
+Kayıt açıkken her detay panelinin ve taranan her website sayfasının HTML'i
+sıkıştırılarak SQLite dosyasına yazılır (işletme kimliği ve URL anahtarıyla).
+Çıkarım kuralları veya seçiciler değiştiğinde reextract_snapshots() aynı
+çıkarıcıları utils.html_driver üzerinden, ayrı işlemlerde paralel çalıştırarak
+kayıtları canlı tarama yapmadan yeniden üretir. Kaydedilen sayfalar
+benchmarks/bench_extractors.py için fikstür olarak da kullanılabilir.
+"""
+import os
+import time
+import zlib
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from .config import SNAPSHOT_CONFIG
+from utils.normalizers import extract_place_id
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    place_id TEXT NOT NULL,
+    url TEXT NOT NULL,
+    kind TEXT,
+    captured_at REAL,
+    size INTEGER,
+    html BLOB,
+    PRIMARY KEY (place_id, url)
+);
+CREATE INDEX IF NOT EXISTS idx_pages_captured ON pages(captured_at);
+"""
+
+DETAIL_KIND = "maps_detail"
+
+def _connect(path):
+    """Snapshot veritabanı bağlantısı (tablo yoksa oluşturulur)"""
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+class SnapshotRecorder:
+    """
+    Sayfa HTML'lerini sıkıştırıp snapshot veritabanına yazan kaydedici
+    
+    Detay paneli kaydedildiğinde işletme kimliği (yoksa detay URL'si) güncel
+    anahtar olur; ardından taranan website sayfaları bu anahtarla saklanır.
+    Aynı işletme ve URL tekrar kaydedilirse en yeni sayfa tutulur. Açık
+    değilken capture() hemen döner; veritabanı ilk kayıtta açılır.
+    """
+    def __init__(self, enabled=False, path=None, compress_level=None):
+        """
+        Args:
+            enabled: Sayfalar kaydedilsin mi (BrowserManager.snapshot_page buna bakar)
+            path: SQLite dosyası (None = SNAPSHOT_CONFIG)
+            compress_level: zlib sıkıştırma düzeyi 1-9 (None = SNAPSHOT_CONFIG)
+        """
+        self.enabled = enabled
+        self.path = path or SNAPSHOT_CONFIG["path"]
+        self.compress_level = compress_level or SNAPSHOT_CONFIG["compress_level"]
+        self.lock = threading.Lock()
+        self.connection = None
+        self.current_key = None
+        self.pages = 0
+        self.raw_bytes = 0
+        self.stored_bytes = 0
+        
+    def reset(self, enabled=None, path=None):
+        """Sayaçları sıfırlar ve açık veritabanını kapatır (enabled/path verilirse değiştirir)"""
+        self.close()
+        if enabled is not None:
+            self.enabled = enabled
+        if path is not None:
+            self.path = path
+        with self.lock:
+            self.current_key = None
+            self.pages = 0
+            self.raw_bytes = 0
+            self.stored_bytes = 0
+            
+    def capture(self, kind, url, html):
+        """
+        Sayfayı kaydeder
+        
+        Args:
+            kind: Sayfa türü ("maps_detail", "website", "contact", "other")
+            url: Sayfanın URL'si
+            html: Sayfa kaynağı
+            
+        Returns:
+            bool: Kaydedildiyse True
+        """
+        if not self.enabled or not html or not url:
+            return False
+        if kind == DETAIL_KIND:
+            key = extract_place_id(url) or url
+        else:
+            key = self.current_key
+            if key is None:
+                return False
+                
+        raw = html.encode('utf-8')
+        compressed = zlib.compress(raw, self.compress_level)
+        with self.lock:
+            if kind == DETAIL_KIND:
+                self.current_key = key
+            if self.connection is None:
+                self.connection = _connect(self.path)
+            with self.connection:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO pages (place_id, url, kind, captured_at, size, html) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, url, kind, time.time(), len(raw), compressed)
+                )
+            self.pages += 1
+            self.raw_bytes += len(raw)
+            self.stored_bytes += len(compressed)
+        return True
+        
+    def summary(self):
+        """Kaydedilen sayfa sayısı ve sıkıştırma oranı (kayıt yoksa boş)"""
+        if not self.pages:
+            return ""
+        return (f"Snapshot: {self.pages} sayfa, {self.raw_bytes / 1048576:.1f} MB -> "
+                f"{self.stored_bytes / 1048576:.1f} MB ({self.path})")
+                
+    def close(self):
+        """Veritabanı bağlantısını kapatır"""
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+def iter_snapshots(path=None, kind=None, limit=None):
+    """
+    Kaydedilmiş sayfaları sırayla döndürür
+    
+    Args:
+        path: SQLite dosyası (None = SNAPSHOT_CONFIG)
+        kind: Yalnızca bu türdeki sayfalar (None = hepsi)
+        limit: En fazla sayfa sayısı
+        
+    Yields:
+        tuple: (işletme anahtarı, tür, URL, HTML)
+    """
+    connection = _connect(path or SNAPSHOT_CONFIG["path"])
+    try:
+        sql = "SELECT place_id, kind, url, html FROM pages"
+        arguments = []
+        if kind:
+            sql += " WHERE kind = ?"
+            arguments.append(kind)
+        sql += " ORDER BY captured_at"
+        if limit:
+            sql += " LIMIT ?"
+            arguments.append(limit)
+        for place_id, page_kind, url, html in connection.execute(sql, arguments):
+            yield place_id, page_kind, url, zlib.decompress(html).decode('utf-8')
+    finally:
+        connection.close()
+
+# --- Tarayıcısız yeniden çıkarım ---
+
+_worker = {}
+
+def _init_worker(path, data_options):
+    """İşçi işlem başlangıcı: veritabanı bağlantısı, sahte sürücü ve çıkarıcılar"""
+    from utils.html_driver import HtmlDriver, HtmlBrowser
+    from .extractors.business_extractor import BusinessInfoExtractor
+    
+    driver = HtmlDriver()
+    extractor = BusinessInfoExtractor(HtmlBrowser(driver))
+    # E-postalar website gezilmeden, kaydedilen sayfalardan toplanır
+    extractor.set_data_options(dict(data_options, collect_email=False))
+    _worker.update(
+        connection=_connect(path),
+        driver=driver,
+        extractor=extractor,
+        collect_email=data_options.get('collect_email', True),
+    )
+
+def _extract_place(place_id):
+    """
+    Tek işletmenin kaydedilmiş sayfalarından BusinessRecord üretir
+    
+    Returns:
+        BusinessRecord: Kayıt (detay paneli kaydı yoksa None)
+    """
+    driver = _worker["driver"]
+    extractor = _worker["extractor"]
+    rows = _worker["connection"].execute(
+        "SELECT kind, url, captured_at, html FROM pages WHERE place_id = ? ORDER BY captured_at", (place_id,)
+    ).fetchall()
+    
+    record = None
+    emails = []
+    for kind, url, captured_at, html in rows:
+        if kind != DETAIL_KIND and not _worker["collect_email"]:
+            continue
+        driver.load(zlib.decompress(html).decode('utf-8'), url)
+        if kind == DETAIL_KIND:
+            record = extractor.extract_business_info()
+            record.timestamp = captured_at
+        else:
+            emails.extend(extractor.email_extractor._find_emails_on_page())
+            
+    if record is None:
+        return None
+    if emails:
+        record.emails = extractor.email_extractor._prioritize_emails(list(set(emails)))
+    return record
+
+def _extract_chunk(place_ids):
+    """İşçi işlemde bir grup işletmeyi yeniden çıkarır"""
+    return [record for record in map(_extract_place, place_ids) if record is not None]
+
+def reextract_snapshots(path=None, workers=None, data_options=None, chunk_size=None,
+                        update_status_callback=None):
+    """
+    Kaydedilmiş sayfalardan isim, adres, telefon, website ve e-postaları tarayıcısız yeniden çıkarır
+    
+    İşletmeler gruplar halinde ayrı işlemlere dağıtılır; her işlem veritabanını
+    kendisi okur, böylece yalnızca işletme anahtarları ve sonuç kayıtları
+    işlemler arasında taşınır. Kayıtlar ilk kaydedilme sırasıyla döner.
+    
+    Args:
+        path: SQLite dosyası (None = SNAPSHOT_CONFIG)
+        workers: İşçi işlem sayısı (None = SNAPSHOT_CONFIG, 0 = işlemci sayısı, 1 = aynı işlemde)
+        data_options: Toplanacak alanlar (None = hepsi)
+        chunk_size: İşçiye bir seferde verilen işletme sayısı (None = SNAPSHOT_CONFIG)
+        update_status_callback: Durum güncellemesi yapacak callback fonksiyonu
+        
+    Returns:
+        list: BusinessRecord listesi
+    """
+    path = path or SNAPSHOT_CONFIG["path"]
+    update_status = update_status_callback or (lambda msg: None)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Snapshot dosyası bulunamadı: {path}")
+    data_options = data_options or {
+        'collect_address': True,
+        'collect_phone': True,
+        'collect_website': True,
+        'collect_email': True
+    }
+    workers = SNAPSHOT_CONFIG["workers"] if workers is None else workers
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or SNAPSHOT_CONFIG["chunk_size"]
+    
+    connection = _connect(path)
+    try:
+        place_ids = [row[0] for row in connection.execute(
+            "SELECT place_id FROM pages GROUP BY place_id ORDER BY MIN(captured_at)"
+        )]
+    finally:
+        connection.close()
+    chunks = [place_ids[i:i + chunk_size] for i in range(0, len(place_ids), chunk_size)]
+    update_status(f"{len(place_ids)} işletmenin sayfaları {min(workers, len(chunks) or 1)} işlemde yeniden işleniyor...")
+    
+    started = time.perf_counter()
+    results = []
+    done = 0
+    if workers == 1 or len(chunks) <= 1:
+        _init_worker(path, data_options)
+        try:
+            for chunk in chunks:
+                results.extend(_extract_chunk(chunk))
+                done += len(chunk)
+        finally:
+            _worker.pop("connection").close()
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=_init_worker,
+                                 initargs=(path, data_options)) as executor:
+            for chunk, records in zip(chunks, executor.map(_extract_chunk, chunks)):
+                results.extend(records)
+                done += len(chunk)
+                update_status(f"Yeniden çıkarım: {done}/{len(place_ids)} işletme")
+                
+    seconds = time.perf_counter() - started
+    rate = len(results) / (seconds / 60) if seconds > 0 else 0.0
+    update_status(f"Yeniden çıkarım tamamlandı: {len(results)} kayıt, {seconds:.1f} sn ({rate:.0f} işletme/dk)")
+    return results
+
+snapshot_recorder = SnapshotRecorder(enabled=SNAPSHOT_CONFIG["enabled"])
\ No newline at end of file
@@ -0,0 +1,291 @@
+"""
+SQLite tabanlı işletme sonuç deposu
+"""
+import json
+import time
+import sqlite3
+import threading
+
+from .config import STORAGE_CONFIG
+from .models import BusinessRecord
+from utils.normalizers import normalize_phone, registrable_domain
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS businesses (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    place_id TEXT UNIQUE,
+    run_id TEXT NOT NULL,
+    name TEXT,
+    address TEXT,
+    phone TEXT,
+    phone_norm TEXT,
+    website TEXT,
+    website_domain TEXT,
+    emails TEXT,
+    email_error INTEGER DEFAULT 0,
+    detail_url TEXT,
+    latitude REAL,
+    longitude REAL,
+    scraped_at REAL,
+    first_seen REAL,
+    last_seen REAL
+);
+CREATE INDEX IF NOT EXISTS idx_businesses_phone_norm ON businesses(phone_norm);
+CREATE INDEX IF NOT EXISTS idx_businesses_website_domain ON businesses(website_domain);
+CREATE INDEX IF NOT EXISTS idx_businesses_run_id ON businesses(run_id);
+"""
+
+DATA_COLUMNS = ['place_id', 'run_id', 'name', 'address', 'phone', 'phone_norm', 'website',
+                'website_domain', 'emails', 'email_error', 'detail_url', 'latitude', 'longitude',
+                'scraped_at', 'first_seen', 'last_seen']
+
+# Aynı place_id tekrar geldiğinde: yeni değer eksik değilse onu al, eksikse eskisini koru
+UPSERT_SQL = f"""
+INSERT INTO businesses ({', '.join(DATA_COLUMNS)})
+VALUES ({', '.join('?' for _ in DATA_COLUMNS)})
+ON CONFLICT(place_id) DO UPDATE SET
+    run_id = excluded.run_id,
+    name = COALESCE(excluded.name, businesses.name),
+    address = COALESCE(excluded.address, businesses.address),
+    phone = COALESCE(excluded.phone, businesses.phone),
+    phone_norm = COALESCE(excluded.phone_norm, businesses.phone_norm),
+    website = COALESCE(excluded.website, businesses.website),
+    website_domain = COALESCE(excluded.website_domain, businesses.website_domain),
+    emails = COALESCE(excluded.emails, businesses.emails),
+    email_error = excluded.email_error,
+    detail_url = COALESCE(excluded.detail_url, businesses.detail_url),
+    latitude = COALESCE(excluded.latitude, businesses.latitude),
+    longitude = COALESCE(excluded.longitude, businesses.longitude),
+    scraped_at = excluded.scraped_at,
+    last_seen = excluded.last_seen
+"""
+
+# Son işleme/birleştirme sonrası yerinde güncellenen sütunlar (kimlik, run_id, first_seen ve last_seen korunur)
+REWRITE_COLUMNS = [column for column in DATA_COLUMNS
+                   if column not in ('place_id', 'run_id', 'first_seen', 'last_seen')]
+REWRITE_SQL = f"""
+UPDATE businesses SET {', '.join(f'{column} = ?' for column in REWRITE_COLUMNS)}
+WHERE id = ?
+"""
+
+class SQLiteStore:
+    """
+    İşletme kayıtlarını SQLite veritabanında tutan depo
+    
+    WAL modunda çalışır, kayıtları toplu ekler ve place_id üzerinden günceller.
+    Tüm çalıştırmaların kayıtları saklanır; her çalıştırma bir run_id ile ayrılır.
+    """
+    def __init__(self, path=None, batch_size=None):
+        """
+        Args:
+            path: Veritabanı dosyası (None = STORAGE_CONFIG)
+            batch_size: Toplu ekleme boyutu (None = STORAGE_CONFIG)
+        """
+        self.path = path or STORAGE_CONFIG['sqlite_path']
+        self.batch_size = batch_size or STORAGE_CONFIG['batch_size']
+        self.lock = threading.RLock()
+        self.pending = []  # Henüz yazılmamış satırlar
+        
+        # Tarama iş parçacığı yazar, arayüz okur: bağlantı kilitle korunur
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+        
+    @staticmethod
+    def new_run_id():
+        """Yeni bir çalıştırma kimliği üretir"""
+        return time.strftime('%Y%m%d_%H%M%S') + f"_{int(time.time() * 1000) % 1000:03d}"
+        
+    def _to_row(self, record, run_id):
+        """BusinessRecord'u veritabanı satırına çevirir (eksik değerler NULL olur)"""
+        record = BusinessRecord.coerce(record)
+        now = time.time()
+        return (
+            record.place_id,
+            run_id,
+            record.name,
+            record.address,
+            record.phone,
+            normalize_phone(record.phone),
+            record.website,
+            record.domain or registrable_domain(record.website),
+            json.dumps(record.emails, ensure_ascii=False) if record.emails else None,
+            int(record.email_error),
+            record.detail_url,
+            record.latitude,
+            record.longitude,
+            record.timestamp,
+            now,
+            now,
+        )
+        
+    def _to_record(self, row):
+        """Veritabanı satırını BusinessRecord'a çevirir"""
+        return BusinessRecord(
+            name=row['name'],
+            address=row['address'],
+            phone=row['phone'],
+            website=row['website'],
+            emails=json.loads(row['emails']) if row['emails'] else None,
+            detail_url=row['detail_url'],
+            timestamp=row['scraped_at'],
+            place_id=row['place_id'],
+            latitude=row['latitude'],
+            longitude=row['longitude'],
+            email_error=bool(row['email_error']),
+            domain=row['website_domain'],
+        )
+        
+    def add(self, record, run_id):
+        """
+        Kaydı ekleme kuyruğuna alır, kuyruk dolunca toplu yazar
+        
+        Args:
+            record: BusinessRecord
+            run_id: Çalıştırma kimliği
+        """
+        with self.lock:
+            self.pending.append(self._to_row(record, run_id))
+            if len(self.pending) >= self.batch_size:
+                self.flush()
+                
+    def add_many(self, records, run_id):
+        """Birden fazla kaydı toplu olarak ekler"""
+        with self.lock:
+            for record in records:
+                self.pending.append(self._to_row(record, run_id))
+                if len(self.pending) >= self.batch_size:
+                    self.flush()
+            self.flush()
+            
+    def flush(self):
+        """Bekleyen satırları tek işlemde veritabanına yazar"""
+        with self.lock:
+            if not self.pending:
+                return
+            with self.connection:
+                self.connection.executemany(UPSERT_SQL, self.pending)
+            self.pending = []
+            
+    def replace_run(self, records, run_id):
+        """
+        Çalıştırmanın kayıtlarını yeniden yazılmış halleriyle değiştirir (son işleme, birleştirme)
+        
+        Satırlar place_id üzerinden yerinde güncellenir; önceki çalıştırmalarda da
+        görülen işletmelerin kimliği ve first_seen değeri korunur. place_id'si
+        olmayan satırlar sırayla eşlenir. Yeni listede karşılığı olmayan satırlar
+        (birleştirmede başka kayda katılanlar) silinir.
+        
+        Args:
+            records: BusinessRecord listesi
+            run_id: Çalıştırma kimliği
+        """
+        with self.lock:
+            self.flush()
+            existing = self.connection.execute(
+                "SELECT id, place_id FROM businesses WHERE run_id = ? ORDER BY id", (run_id,)
+            ).fetchall()
+            by_place = {place_id: row_id for row_id, place_id in existing if place_id is not None}
+            unkeyed = iter([row_id for row_id, place_id in existing if place_id is None])
+            
+            kept = set()
+            updates = []
+            inserts = []
+            for record in records:
+                row = self._to_row(record, run_id)
+                values = dict(zip(DATA_COLUMNS, row))
+                if values['place_id'] is not None:
+                    row_id = by_place.get(values['place_id'])
+                else:
+                    row_id = next(unkeyed, None)
+                if row_id is None:
+                    inserts.append(row)
+                else:
+                    kept.add(row_id)
+                    updates.append([values[column] for column in REWRITE_COLUMNS] + [row_id])
+            removed = [(row_id,) for row_id, _ in existing if row_id not in kept]
+            
+            with self.connection:
+                self.connection.executemany("DELETE FROM businesses WHERE id = ?", removed)
+                self.connection.executemany(REWRITE_SQL, updates)
+                self.connection.executemany(UPSERT_SQL, inserts)
+                
+    def delete_run(self, run_id):
+        """Bir çalıştırmanın kayıtlarını siler"""
+        with self.lock:
+            self.flush()
+            with self.connection:
+                self.connection.execute("DELETE FROM businesses WHERE run_id = ?", (run_id,))
+                
+    def count(self, run_id=None):
+        """
+        Kayıt sayısını döndürür
+        
+        Args:
+            run_id: Yalnızca bu çalıştırmayı say (None = tüm geçmiş)
+        """
+        with self.lock:
+            self.flush()
+            if run_id is None:
+                return self.connection.execute("SELECT COUNT(*) FROM businesses").fetchone()[0]
+            return self.connection.execute(
+                "SELECT COUNT(*) FROM businesses WHERE run_id = ?", (run_id,)
+            ).fetchone()[0]
+            
+    def iter_records(self, run_id=None, where=None, params=(), chunk_size=1000):
+        """
+        Kayıtları belleğe toplamadan parça parça okur
+        
+        Args:
+            run_id: Yalnızca bu çalıştırmanın kayıtları (None = tüm geçmiş)
+            where: Ek SQL koşulu (ör. "website_domain = ?")
+            params: Koşul parametreleri
+            chunk_size: Tek seferde okunacak satır sayısı
+            
+        Yields:
+            BusinessRecord: İşletme kaydı
+        """
+        conditions = []
+        arguments = []
+        if run_id is not None:
+            conditions.append("run_id = ?")
+            arguments.append(run_id)
+        if where:
+            conditions.append(f"({where})")
+            arguments.extend(params)
+        sql = "SELECT * FROM businesses"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY id"
+        
+        with self.lock:
+            self.flush()
+            # Okuma ayrı bağlantıdan yapılır; WAL sayesinde yazmaları engellemez
+            reader = sqlite3.connect(self.path, check_same_thread=False)
+        reader.row_factory = sqlite3.Row
+        try:
+            cursor = reader.execute(sql, arguments)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._to_record(row)
+        finally:
+            reader.close()
+            
+    def find_by_phone(self, phone):
+        """Normalleştirilmiş telefona göre kayıtları döndürür"""
+        return list(self.iter_records(where="phone_norm = ?", params=(normalize_phone(phone),)))
+        
+    def find_by_domain(self, url_or_domain):
+        """Website'nin kayıt edilebilir alan adına göre kayıtları döndürür"""
+        return list(self.iter_records(where="website_domain = ?", params=(registrable_domain(url_or_domain),)))
+        
+    def close(self):
+        """Bekleyen satırları yazar ve bağlantıyı kapatır"""
+        with self.lock:
+            self.flush()
+            self.connection.close()
\ No newline at end of file
@@ -0,0 +1,205 @@
+"""
+Akışlı (streaming) dışa aktarma yazıcıları
+"""
+import csv
+import gzip
+import json
+
+from .config import EXPORT_CONFIG
+
+class StreamWriter:
+    """
+    Kayıtları geldikçe dosyaya ekleyen, her N satırda dosya döndüren temel sınıf
+    """
+    extension = "txt"
+    
+    def __init__(self, timestamp, rotate_rows=0, filename_pattern=None):
+        """
+        Args:
+            timestamp: Dosya adlarında kullanılacak zaman damgası
+            rotate_rows: Her N satırda yeni dosyaya geç (0 = döndürme yok)
+            filename_pattern: Dosya adı kalıbı ({timestamp}, {part}, {extension})
+        """
+        self.timestamp = timestamp
+        self.rotate_rows = rotate_rows or 0
+        self.filename_pattern = filename_pattern or EXPORT_CONFIG["stream_filename_pattern"]
+        self.fieldnames = None
+        self.files = []          # Oluşturulan dosya adları
+        self.part = 0
+        self.rows_in_part = 0
+        self.total_rows = 0
+        self.is_open = False
+        self.flush_rows = True   # Her satırdan sonra diske boşalt (canlı akış için)
+        
+    def _part_limit(self):
+        """Bir parça dosyasına yazılacak en fazla satır sayısı (0 = sınırsız)"""
+        return self.rotate_rows
+        
+    def _next_filename(self):
+        self.part += 1
+        return self.filename_pattern.format(
+            timestamp=self.timestamp, part=self.part, extension=self.extension
+        )
+        
+    def _open_part(self, filename):
+        """Yeni bir parça dosyası aç (alt sınıflar uygular)"""
+        raise NotImplementedError
+        
+    def _write_row(self, record):
+        """Tek bir kaydı açık dosyaya yaz (alt sınıflar uygular)"""
+        raise NotImplementedError
+        
+    def _close_part(self):
+        """Açık parça dosyasını kapat (alt sınıflar uygular)"""
+        raise NotImplementedError
+        
+    def write(self, record):
+        """
+        Kaydı akışa ekler, gerekirse yeni dosyaya geçer
+        
+        Args:
+            record: Sütun adı -> değer sözlüğü
+        """
+        if self.fieldnames is None:
+            self.fieldnames = list(record.keys())
+            
+        part_limit = self._part_limit()
+        if self.is_open and part_limit and self.rows_in_part >= part_limit:
+            self._close_part()
+            self.is_open = False
+            
+        if not self.is_open:
+            filename = self._next_filename()
+            self._open_part(filename)
+            self.files.append(filename)
+            self.rows_in_part = 0
+            self.is_open = True
+            
+        self._write_row(record)
+        self.rows_in_part += 1
+        self.total_rows += 1
+        
+    def write_many(self, records):
+        """Bir kayıt dizisini sırayla akışa ekler"""
+        for record in records:
+            self.write(record)
+            
+    def close(self):
+        """
+        Açık dosyayı kapatır
+        
+        Returns:
+            list: Oluşturulan dosya adları
+        """
+        if self.is_open:
+            self._close_part()
+            self.is_open = False
+        return self.files
+
+class CsvStreamWriter(StreamWriter):
+    """CSV dosyasına satır satır ekleyen yazıcı"""
+    extension = "csv"
+    
+    def _open_part(self, filename):
+        self.file = open(filename, 'w', newline='', encoding='utf-8')
+        self.writer = csv.DictWriter(self.file, fieldnames=self.fieldnames, extrasaction='ignore')
+        self.writer.writeheader()
+        
+    def _write_row(self, record):
+        self.writer.writerow(record)
+        if self.flush_rows:
+            self.file.flush()  # Tarama yarıda kesilse de satır diskte olsun
+        
+    def _close_part(self):
+        self.file.close()
+
+class JsonlStreamWriter(StreamWriter):
+    """JSON Lines dosyasına (isteğe bağlı gzip) satır satır ekleyen yazıcı"""
+    extension = "jsonl"
+    
+    def __init__(self, timestamp, rotate_rows=0, filename_pattern=None, compress=False):
+        super().__init__(timestamp, rotate_rows, filename_pattern)
+        self.compress = compress
+        if compress:
+            self.extension = "jsonl.gz"
+            
+    def _open_part(self, filename):
+        if self.compress:
+            self.file = gzip.open(filename, 'wt', encoding='utf-8')
+        else:
+            self.file = open(filename, 'w', encoding='utf-8')
+            
+    def _write_row(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False, default=str))
+        self.file.write("\n")
+        if self.flush_rows and not self.compress:
+            self.file.flush()
+            
+    def _close_part(self):
+        self.file.close()
+
+class XlsxStreamWriter(StreamWriter):
+    """
+    openpyxl write-only çalışma kitabına satır ekleyen yazıcı
+    
+    write-only kitap yalnızca kaydedilirken diske yazılır. Canlı akışta
+    (flush_rows) parça her save_rows satırda kapatılıp yenisi açılır; tarama
+    yarıda kesilirse kaybolan satırlar son açık parçadakilerle (< save_rows)
+    sınırlı kalır. Her satırın hemen diske yazılması gerekiyorsa CSV veya
+    JSON Lines kullanılmalıdır.
+    """
+    extension = "xlsx"
+    
+    def __init__(self, timestamp, rotate_rows=0, filename_pattern=None, save_rows=None):
+        super().__init__(timestamp, rotate_rows, filename_pattern)
+        self.save_rows = EXPORT_CONFIG["stream_xlsx_save_rows"] if save_rows is None else save_rows
+        
+    def _part_limit(self):
+        if not self.flush_rows or not self.save_rows:
+            return self.rotate_rows
+        return min(self.rotate_rows, self.save_rows) if self.rotate_rows else self.save_rows
+        
+    def _open_part(self, filename):
+        from openpyxl import Workbook
+        
+        self.filename = filename
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet()
+        self.sheet.append(self.fieldnames)
+        
+    def _write_row(self, record):
+        self.sheet.append([record.get(field) for field in self.fieldnames])
+        
+    def _close_part(self):
+        # write-only kitap yalnızca kaydedilirken dosyaya yazılır
+        self.workbook.save(self.filename)
+        self.workbook = None
+        self.sheet = None
+
+def create_stream_writer(timestamp, stream_format=None, rotate_rows=None, compress=None):
+    """
+    Yapılandırmaya göre uygun akış yazıcısını oluşturur
+    
+    Args:
+        timestamp: Dosya adlarında kullanılacak zaman damgası
+        stream_format: csv, jsonl veya xlsx (None = EXPORT_CONFIG)
+        rotate_rows: Her N satırda dosya döndür (None = EXPORT_CONFIG)
+        compress: JSON Lines için gzip (None = EXPORT_CONFIG)
+        
+    Returns:
+        StreamWriter: Akış yazıcısı
+        
+    Raises:
+        ValueError: Bilinmeyen format
+    """
+    stream_format = stream_format or EXPORT_CONFIG["stream_format"]
+    rotate_rows = EXPORT_CONFIG["stream_rotate_rows"] if rotate_rows is None else rotate_rows
+    compress = EXPORT_CONFIG["stream_gzip"] if compress is None else compress
+    
+    if stream_format == "csv":
+        return CsvStreamWriter(timestamp, rotate_rows)
+    if stream_format == "jsonl":
+        return JsonlStreamWriter(timestamp, rotate_rows, compress=compress)
+    if stream_format == "xlsx":
+        return XlsxStreamWriter(timestamp, rotate_rows)
+    raise ValueError(f"Bilinmeyen akış formatı: {stream_format}")
\ No newline at end of file
@@ -0,0 +1,246 @@
+"""
+Aşama süresi ölçümü (span) ve Chrome trace-event JSON dışa aktarımı
+"""
+import os
+import json
+import math
+import time
+import threading
+import functools
+from collections import defaultdict
+
+from .config import TRACE_CONFIG
+
+class _NullSpan:
+    """İzleme kapalıyken dönen, hiçbir şey yapmayan paylaşılan span"""
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc, tb):
+        return False
+        
+    def set(self, **args):
+        pass
+
+NULL_SPAN = _NullSpan()
+
+class _Span:
+    """Tek bir zamanlama aralığı; çıkışta izleyiciye kaydedilir"""
+    __slots__ = ('tracer', 'name', 'args', 'start')
+    
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start = 0
+        
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+        
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer._record(self.name, self.start, end - self.start, self.args)
+        return False
+        
+    def set(self, **args):
+        """Span'e sonradan bilgi ekler (ör. işlem sırasında öğrenilen işletme adı)"""
+        self.args.update(args)
+
+def percentile(sorted_values, percent):
+    """Sıralı listede en yakın sıra (nearest-rank) yüzdeliği"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+class Tracer:
+    """
+    İç içe aşama sürelerini toplayan izleyici
+    
+    Kapalıyken span() paylaşılan boş bir nesne döndürür; maliyet tek bir
+    öznitelik kontrolüdür. Açıkken her span başlangıç/süre (ns), iş parçacığı
+    ve ek bilgileriyle listeye eklenir. Aynı iş parçacığındaki spanlar zaman
+    aralıklarıyla iç içe geçtiğinden Chrome trace görüntüleyicisi (chrome://tracing,
+    Perfetto) bunları işletme bazında iç içe gösterir.
+    """
+    def __init__(self, enabled=False, max_spans=None):
+        """
+        Args:
+            enabled: İzleme açık mı
+            max_spans: Tutulacak en fazla span (aşılırsa yenileri sayılıp atlanır)
+        """
+        self.record_spans = enabled
+        self.observers = ()      # (ad, süre sn) ile çağrılan fonksiyonlar (ör. metrik histogramı)
+        self.enabled = enabled
+        self.max_spans = max_spans or TRACE_CONFIG["max_spans"]
+        self.spans = []          # (ad, başlangıç ns, süre ns, iş parçacığı, ek bilgiler)
+        self.thread_names = {}
+        self.dropped = 0
+        self.origin_ns = time.perf_counter_ns()
+        
+    def reset(self, enabled=None):
+        """Toplanan spanları siler (enabled verilirse span kaydını açar/kapatır)"""
+        if enabled is not None:
+            self.record_spans = enabled
+        self.enabled = self.record_spans or bool(self.observers)
+        self.spans = []
+        self.thread_names = {}
+        self.dropped = 0
+        self.origin_ns = time.perf_counter_ns()
+        
+    def add_observer(self, callback):
+        """
+        Her span bitişinde çağrılacak gözlemci ekler
+        
+        Span kaydı kapalı olsa da gözlemci varken spanlar ölçülür, ancak
+        listeye eklenmez.
+        
+        Args:
+            callback: (ad, süre saniye) ile çağrılacak fonksiyon
+        """
+        if callback not in self.observers:
+            self.observers = self.observers + (callback,)
+        self.enabled = True
+        
+    def remove_observer(self, callback):
+        """Gözlemciyi kaldırır"""
+        self.observers = tuple(observer for observer in self.observers if observer is not callback)
+        self.enabled = self.record_spans or bool(self.observers)
+        
+    def span(self, name, **args):
+        """
+        Zamanlama aralığı oluşturur (with bloğu olarak kullanılır)
+        
+        Args:
+            name: Aşama adı (ör. "extract.phone")
+            **args: Trace dosyasına yazılacak ek bilgiler
+        """
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name, args)
+        
+    def traced(self, name):
+        """
+        Fonksiyonun her çağrısını span içinde çalıştıran dekoratör
+        
+        Args:
+            name: Aşama adı
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Span(self, name, {}):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+        
+    def _record(self, name, start, duration, args):
+        for observer in self.observers:
+            try:
+                observer(name, duration / 1e9)
+            except Exception:
+                pass
+        if not self.record_spans:
+            return
+        if len(self.spans) >= self.max_spans:
+            self.dropped += 1
+            return
+        thread_id = threading.get_ident()
+        if thread_id not in self.thread_names:
+            self.thread_names[thread_id] = threading.current_thread().name
+        self.spans.append((name, start, duration, thread_id, args))
+        
+    def durations(self):
+        """
+        Returns:
+            dict: Aşama adı -> süre listesi (saniye)
+        """
+        result = defaultdict(list)
+        for name, _, duration, _, _ in self.spans:
+            result[name].append(duration / 1e9)
+        return result
+        
+    def summary(self):
+        """
+        Aşama bazında süre istatistikleri
+        
+        Returns:
+            list: (ad, adet, toplam sn, p50 sn, p95 sn, en büyük sn) satırları, toplama göre azalan
+        """
+        rows = []
+        for name, values in self.durations().items():
+            values.sort()
+            rows.append((name, len(values), sum(values), percentile(values, 50),
+                         percentile(values, 95), values[-1]))
+        rows.sort(key=lambda row: -row[2])
+        return rows
+        
+    def format_summary(self):
+        """
+        Returns:
+            str: Aşama süreleri tablosu (span yoksa boş)
+        """
+        rows = self.summary()
+        if not rows:
+            return ""
+        width = max(len(row[0]) for row in rows)
+        lines = [f"{'Aşama':<{width}}  {'Adet':>6}  {'Toplam':>9}  {'p50':>8}  {'p95':>8}  {'En büyük':>8}"]
+        for name, count, total, p50, p95, largest in rows:
+            lines.append(f"{name:<{width}}  {count:>6}  {total:>8.2f}s  {p50:>7.3f}s  {p95:>7.3f}s  {largest:>7.3f}s")
+        if self.dropped:
+            lines.append(f"(span sınırı nedeniyle {self.dropped} span kaydedilmedi)")
+        return "\n".join(lines)
+        
+    def to_chrome_trace(self):
+        """
+        Spanları Chrome trace-event biçimine çevirir (tamamlanmış "X" olayları, µs)
+        
+        Returns:
+            dict: {"traceEvents": [...], "displayTimeUnit": "ms"}
+        """
+        pid = os.getpid()
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": name}}
+            for thread_id, name in self.thread_names.items()
+        ]
+        for name, start, duration, thread_id, args in self.spans:
+            event = {
+                "name": name,
+                "cat": name.split('.', 1)[0],
+                "ph": "X",
+                "ts": (start - self.origin_ns) / 1000,
+                "dur": duration / 1000,
+                "pid": pid,
+                "tid": thread_id,
+            }
+            if args:
+                event["args"] = {key: str(value) for key, value in args.items()}
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+        
+    def export_chrome_trace(self, path=None):
+        """
+        Trace dosyasını yazar
+        
+        Args:
+            path: Dosya yolu (None = TRACE_CONFIG output_dir altında zaman damgalı ad)
+            
+        Returns:
+            str: Yazılan dosyanın yolu
+        """
+        if path is None:
+            os.makedirs(TRACE_CONFIG["output_dir"], exist_ok=True)
+            path = os.path.join(TRACE_CONFIG["output_dir"], f"trace_{time.strftime('%Y%m%d_%H%M%S')}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False)
+        return path
+
+# Uygulama genelinde paylaşılan izleyici
+tracer = Tracer(enabled=TRACE_CONFIG["enabled"])
\ No newline at end of file
@@ -3,11 +3,11 @@ E-posta ve İletişim Bilgisi Toplayıcı - Ana Başlatma Dosyası
 """
 import sys
 import os
+import argparse
+import threading
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from ui.main_window import MainWindow
-
 def check_dependencies():
     """Gerekli bağımlılıkları kontrol eder ve uyarı verir"""
     missing_modules = []
@@ -30,7 +30,217 @@ def check_dependencies():
     
     return missing_modules
 
+def parse_args(argv=None):
+    """Komut satırı argümanlarını ayrıştırır"""
+    parser = argparse.ArgumentParser(description="Google Maps e-posta ve iletişim bilgisi toplayıcı")
+    parser.add_argument("--cli", action="store_true", help="Arayüz olmadan komut satırında çalıştır")
+    parser.add_argument("--search", help="Aranacak kelime (--cli ile)")
+    parser.add_argument("--city", help="Şehir (--cli ile)")
+    parser.add_argument("--max", type=int, default=20, help="Maksimum işletme sayısı")
+    parser.add_argument("--no-email", action="store_true", help="Websitelerinde e-posta arama")
+    parser.add_argument("--verbose", action="store_true", help="Ayrıntılı (DEBUG) olayları da yazdır")
+    parser.add_argument("--postprocess", action="store_true",
+                        help="Tarama sonunda telefon (E.164), e-posta ve website alanlarını normalleştir")
+    parser.add_argument("--dedup", action="store_true", help="Tarama sonunda mükerrer kayıtları birleştir")
+    parser.add_argument("--trace", action="store_true",
+                        help="Aşama sürelerini ölç, sonunda p50/p95 özeti ve Chrome trace dosyası üret")
+    parser.add_argument("--trace-commands", action="store_true",
+                        help="WebDriver komutlarını çağrı noktası ve işletme bazında say")
+    parser.add_argument("--profile", choices=["cprofile", "sample", "both"],
+                        help="Çalıştırmayı profille (.pstats ve flamegraph için .collapsed dosyaları)")
+    parser.add_argument("--memory", action="store_true",
+                        help="tracemalloc ile bellek izle; büyüyen satırları ve işletme başına tepe belleği raporla")
+    parser.add_argument("--page-metrics", action="store_true",
+                        help="Detay sayfaları ve websiteler için yükleme süresi, bayt, istek ve JS heap ölç")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                        help="Canlı metrikleri Prometheus biçiminde http://127.0.0.1:PORT/metrics adresinde sun")
+    parser.add_argument("--history", action="store_true",
+                        help="Çalıştırmanın performans özetini geçmiş veritabanına kaydet")
+    parser.add_argument("--history-report", action="store_true",
+                        help="Son çalıştırmaları listele ve taban çizgisine göre gerilemeleri göster")
+    parser.add_argument("--snapshots", action="store_true",
+                        help="Detay panelleri ve website sayfalarının HTML'ini snapshot veritabanına kaydet")
+    parser.add_argument("--reextract", nargs="?", const="", metavar="DOSYA",
+                        help="Kaydedilmiş sayfalardan tarayıcısız yeniden çıkarım yap ve sonuçları dışa aktar")
+    parser.add_argument("--workers", type=int, metavar="N",
+                        help="Yeniden çıkarımda işçi işlem sayısı (varsayılan: işlemci sayısı)")
+    args = parser.parse_args(argv)
+    if args.cli and (not args.search or not args.city):
+        parser.error("--cli için --search ve --city gerekli")
+    return args
+
+def run_cli(args):
+    """Taramayı arayüz olmadan çalıştırır; olaylar konsola yazılır"""
+    from core.config import (DEDUP_CONFIG, POSTPROCESS_CONFIG, PROFILE_CONFIG, MEMORY_CONFIG, METRICS_CONFIG,
+                             HISTORY_CONFIG)
+    from core.cancellation import CancellationToken
+    from core.data_manager import DataManager
+    from core.events import EventBus, ConsoleSubscriber, DEBUG, INFO
+    from core.scraper import MapsScraper
+    from core.tracing import tracer
+    from core.command_tracer import command_tracer
+    from core.profiling import ProfileRun
+    from core.memory_monitor import memory_monitor
+    from core.page_metrics import page_metrics_stats
+    from core.metrics import enable_metrics
+    from core.run_history import format_estimate
+    from core.snapshots import snapshot_recorder
+    
+    if args.trace:
+        tracer.reset(enabled=True)
+    if args.trace_commands:
+        command_tracer.reset(enabled=True)
+    if args.page_metrics:
+        page_metrics_stats.reset(enabled=True)
+    if args.snapshots:
+        snapshot_recorder.reset(enabled=True)
+    
+    events = EventBus()
+    events.subscribe(ConsoleSubscriber(), min_level=DEBUG if args.verbose else INFO)
+    
+    metrics_server = None
+    if args.metrics_port is not None or METRICS_CONFIG["enabled"]:
+        port = args.metrics_port if args.metrics_port is not None else METRICS_CONFIG["port"]
+        metrics_server = enable_metrics(events, port)
+        if metrics_server:
+            host, port = metrics_server.server_address[:2]
+            events.status(f"Metrikler: http://{host}:{port}/metrics")
+            
+    estimate = format_estimate(args.max, not args.no_email)
+    if estimate:
+        events.status(estimate)
+    
+    data_manager = DataManager()
+    scraper = MapsScraper(event_bus=events)
+    data_options = {
+        'collect_address': True,
+        'collect_phone': True,
+        'collect_website': True,
+        'collect_email': not args.no_email
+    }
+    
+    # Tarama ve sonrasındaki işlemler ayrı iş parçacığında çalışır; Ctrl+C ana iş parçacığında
+    # belirteci iptal eder ve toplanan kayıtlar yine işlenip kaydedilir
+    cancel_token = CancellationToken()
+    profile_mode = args.profile or PROFILE_CONFIG["mode"]
+    profile_run = ProfileRun(profile_mode) if profile_mode else None
+    outcome = {}
+    
+    def work():
+        # cProfile yalnızca başlatıldığı iş parçacığını ölçtüğünden oturum burada açılıp kapanır
+        if profile_run:
+            profile_run.start()
+        if args.memory or MEMORY_CONFIG["enabled"]:
+            memory_monitor.start(events.status)
+        try:
+            results = scraper.scrape(
+                search_term=args.search,
+                city=args.city,
+                max_items=args.max,
+                data_options=data_options,
+                result_callback=data_manager.add_record,
+                cancel_token=cancel_token,
+                record_history=args.history or HISTORY_CONFIG["enabled"]
+            )
+            if not results:
+                events.status("Hiç veri bulunamadı!")
+                outcome['code'] = 1
+                return
+                
+            if args.postprocess or POSTPROCESS_CONFIG["enabled"]:
+                data_manager.postprocess(events.status)
+            if args.dedup or DEDUP_CONFIG["enabled"]:
+                data_manager.deduplicate(events.status)
+            data_manager.flush()
+            file_path = data_manager.export_data()
+            memory_monitor.checkpoint("export")
+            events.status(f"Veriler {file_path} dosyasına kaydedildi!")
+            outcome['code'] = 130 if cancel_token.is_cancelled else 0
+        except Exception as e:
+            outcome['error'] = e
+        finally:
+            memory_monitor.stop()
+            if profile_run:
+                profile_run.stop()
+                events.status(profile_run.summary())
+                top = profile_run.top_functions()
+                if top:
+                    events.status(top)
+    
+    try:
+        worker = threading.Thread(target=work, name="scraper", daemon=True)
+        worker.start()
+        try:
+            while worker.is_alive():
+                worker.join(0.5)
+        except KeyboardInterrupt:
+            events.status("Kullanıcı tarafından durduruldu, toplanan kayıtlar kaydediliyor...")
+            cancel_token.cancel()
+            worker.join()
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome.get('code', 1)
+    except KeyboardInterrupt:
+        events.status("Kullanıcı tarafından durduruldu.")
+        return 130
+    finally:
+        data_manager.close()
+        if metrics_server:
+            metrics_server.shutdown()
+
+def run_reextract(args):
+    """Kaydedilmiş sayfalardan kayıtları yeniden üretir; son işleme ve dışa aktarma canlı taramayla aynıdır"""
+    from core.config import DEDUP_CONFIG, POSTPROCESS_CONFIG
+    from core.data_manager import DataManager
+    from core.events import EventBus, ConsoleSubscriber
+    from core.snapshots import reextract_snapshots
+    
+    events = EventBus()
+    events.subscribe(ConsoleSubscriber())
+    data_options = {
+        'collect_address': True,
+        'collect_phone': True,
+        'collect_website': True,
+        'collect_email': not args.no_email
+    }
+    
+    data_manager = DataManager()
+    try:
+        records = reextract_snapshots(args.reextract or None, workers=args.workers, data_options=data_options,
+                                      update_status_callback=events.status)
+        if not records:
+            events.status("Hiç veri bulunamadı!")
+            return 1
+        data_manager.set_data(records)
+        if args.postprocess or POSTPROCESS_CONFIG["enabled"]:
+            data_manager.postprocess(events.status)
+        if args.dedup or DEDUP_CONFIG["enabled"]:
+            data_manager.deduplicate(events.status)
+        data_manager.flush()
+        file_path = data_manager.export_data()
+        events.status(f"Veriler {file_path} dosyasına kaydedildi!")
+        return 0
+    except FileNotFoundError as e:
+        events.status(str(e))
+        return 1
+    finally:
+        data_manager.close()
+
 def main():
+    args = parse_args()
+    if args.history_report:
+        from core.run_history import RunHistory
+        history = RunHistory()
+        print(history.format_report())
+        history.close()
+        sys.exit(0)
+    if args.reextract is not None:
+        sys.exit(run_reextract(args))
+    if args.cli:
+        sys.exit(run_cli(args))
+        
+    from ui.main_window import MainWindow
+    
     missing = check_dependencies()
     
     app = MainWindow(missing_dependencies=missing)
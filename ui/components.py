@@ -1,8 +1,10 @@
 """
 Özel UI bileşenleri
 """
+import time
 import tkinter as tk
-from tkinter import ttk
+from collections import deque
+from tkinter import ttk, scrolledtext
 from .styling import COLORS, FONTS
 
 class StyledFrame(ttk.LabelFrame):
@@ -30,11 +32,18 @@ class StyledButton(tk.Button):
             **kwargs
         )
 
-class LogConsole(tk.scrolledtext.ScrolledText):
-    """Özel log konsol bileşeni"""
-    def __init__(self, parent, **kwargs):
+class LogConsole(scrolledtext.ScrolledText):
+    """
+    Özel log konsol bileşeni
+    
+    Son max_lines satırı tutan halka tampon gibi çalışır; eski satırlar
+    silinir. Mesajlar toplu eklendiğinde widget tek seferde güncellenir.
+    """
+    def __init__(self, parent, max_lines=5000, **kwargs):
         height = kwargs.pop('height', 15)
         width = kwargs.pop('width', 80)
+        self.max_lines = max_lines
+        self.line_count = 0
         super().__init__(
             parent,
             height=height,
@@ -46,14 +55,44 @@ class LogConsole(tk.scrolledtext.ScrolledText):
         
     def log(self, message):
         """Mesaj ekle"""
-        import time
+        self.log_many([message])
+        
+    def log_many(self, messages):
+        """
+        Mesajları tek ekleme işlemiyle ekler ve sınırı aşan eski satırları siler
+        
+        Args:
+            messages: Mesaj listesi (olay nesneleri kendi zamanlarıyla, metinler şimdiki zamanla yazılır)
+        """
+        if not messages:
+            return
+            
+        # Sınırdan fazla mesaj geldiyse yalnızca sonuncular eklenir
+        lines = deque(maxlen=self.max_lines)
+        now = time.time()
+        lines.extend(
+            f"{time.strftime('%H:%M:%S', time.localtime(getattr(message, 'timestamp', now)))} - {message}"
+            for message in messages
+        )
+        
+        # Kullanıcı yukarı kaydırmışsa görünüm sona atlatılmaz
+        at_bottom = self.yview()[1] >= 0.999
+        
         self.configure(state='normal')  # Düzenlemeyi aç
-        self.insert(tk.END, f"{time.strftime('%H:%M:%S')} - {message}\n")
-        self.see(tk.END)  # Sona kaydır
+        self.insert(tk.END, "\n".join(lines) + "\n")
+        self.line_count += len(lines)
+        excess = self.line_count - self.max_lines
+        if excess > 0:
+            self.delete("1.0", f"{excess + 1}.0")
+            self.line_count -= excess
         self.configure(state='disabled')  # Düzenlemeyi kapat
         
+        if at_bottom:
+            self.see(tk.END)  # Sona kaydır
+        
     def clear(self):
         """Tüm içeriği temizle"""
         self.configure(state='normal')
         self.delete(1.0, tk.END)
-        self.configure(state='disabled')
\ No newline at end of file
+        self.configure(state='disabled')
+        self.line_count = 0
\ No newline at end of file
@@ -10,15 +10,25 @@ import time
 # Dahili modülleri içe aktar
 from .styling import COLORS, FONTS, apply_styles
 from .components import StyledFrame, StyledButton, LogConsole
+from .results_table import ResultsTable
 from core.scraper import MapsScraper
+from core.cancellation import CancellationToken
+from core.profiling import ProfileRun, BOTH
+from core.memory_monitor import memory_monitor
+from core.metrics import enable_metrics, QUEUE_DEPTH
+from core.run_history import format_estimate
 from core.data_manager import DataManager
+from core.config import (EXPORT_CONFIG, DEDUP_CONFIG, POSTPROCESS_CONFIG, UI_CONFIG, PROFILE_CONFIG, MEMORY_CONFIG,
+                         HISTORY_CONFIG, METRICS_CONFIG)
+from core.events import EventBus, QueueSubscriber, DEBUG, INFO, PROGRESS, BUSINESS_FINISHED
+from utils.logger import BackgroundFileLog
 
 class MainWindow:
     def __init__(self, missing_dependencies=None):
         # Ana pencere oluştur
         self.window = tk.Tk()
         self.window.title("Detaylı E-posta ve İletişim Bilgisi Toplayıcı")
-        self.window.geometry("700x600")  # Boyutu azalttım
+        self.window.geometry("900x600")  # Sonuç tablosu için biraz genişletildi
         self.window.minsize(600, 500)    # Minimum boyutu da azalttım
         self.window.configure(bg=COLORS["background"])
         
@@ -29,11 +39,43 @@ class MainWindow:
         if missing_dependencies:
             self.show_module_warning(missing_dependencies)
             
-        # İleti kuyruğu
+        # İleti kuyruğu (arayüz kontrol iletileri)
         self.message_queue = queue.Queue()
         
+        # Olay yolu: tarama olayları sınırlı kuyrukla arayüz iş parçacığına taşınır
+        self.events = EventBus()
+        self.event_subscriber = QueueSubscriber(maxsize=UI_CONFIG["event_queue_size"])
+        self.events.subscribe(self.event_subscriber, min_level=INFO)
+        
+        # Durum etiketi ve ilerleme çubuğu en fazla status_update_ms'de bir güncellenir
+        self.pending_status = None
+        self.pending_progress = None
+        self.last_status_update = 0.0
+        
+        # Kurulum sırasındaki uyarılar arayüz oluşturulduktan sonra log konsoluna iletilir
+        self.startup_warnings = []
+        
+        # Tüm durum mesajları arka planda dosyaya yazılır
+        self.file_log = None
+        if UI_CONFIG["log_to_file"]:
+            try:
+                self.file_log = BackgroundFileLog(UI_CONFIG["log_dir"])
+                self.events.subscribe(self.file_log.write_event, min_level=DEBUG)
+            except OSError as e:
+                self.startup_warnings.append(("Günlük dosyası açılamadı: {error}", e))
+                
+        # Canlı metrikler (yapılandırmada açıksa Prometheus ucu yerel portta sunulur)
+        self.metrics_server = None
+        QUEUE_DEPTH.labels("ui_events").set_function(self.event_subscriber.queue.qsize)
+        if METRICS_CONFIG["enabled"]:
+            try:
+                self.metrics_server = enable_metrics(self.events, METRICS_CONFIG["port"])
+            except OSError as e:
+                self.startup_warnings.append(("Metrik sunucusu başlatılamadı: {error}", e))
+        
         # İşlem durumu
         self.is_running = False
+        self.cancel_token = None  # Çalışan taramanın iptal belirteci (her taramada yenisi)
         
         # Veri yöneticisi
         self.data_manager = DataManager()
@@ -43,12 +85,18 @@ class MainWindow:
         self.collect_phone_var = tk.BooleanVar(value=True)
         self.collect_website_var = tk.BooleanVar(value=True)
         self.collect_email_var = tk.BooleanVar(value=True)
+        self.profile_var = tk.BooleanVar(value=bool(PROFILE_CONFIG["mode"]))
+        self.postprocess_var = tk.BooleanVar(value=POSTPROCESS_CONFIG["enabled"])
+        self.dedup_var = tk.BooleanVar(value=DEDUP_CONFIG["enabled"])
+        self.history_var = tk.BooleanVar(value=HISTORY_CONFIG["enabled"])
         
         # UI oluştur
         self.setup_ui()
+        for template, error in self.startup_warnings:
+            self.events.warning(template, error=error)
         
         # Kuyruk işlemini başlat
-        self.window.after(100, self.process_queue)
+        self.window.after(UI_CONFIG["queue_poll_ms"], self.process_queue)
     
     def show_module_warning(self, missing_modules):
         """Eksik modül uyarısı göster"""
@@ -91,12 +139,19 @@ class MainWindow:
         self.results_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.results_tab, text="Sonuçlar ve İlerleme")
         
+        # Sekme 3: Toplanan kayıtlar
+        self.records_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.records_tab, text="Kayıtlar")
+        
         # Ayarlar sekmesini oluştur
         self.setup_settings_tab()
         
         # Sonuçlar sekmesini oluştur
         self.setup_results_tab()
         
+        # Kayıtlar sekmesini oluştur
+        self.setup_records_tab()
+        
         # Durum çubuğu
         status_bar = tk.Frame(self.window, bg=COLORS["secondary"], height=25)
         status_bar.pack(side="bottom", fill="x")
@@ -187,6 +242,30 @@ class MainWindow:
             font=FONTS["normal"], command=self._toggle_email_option)
         email_check.pack(side="left", padx=15)
         
+        profile_check = tk.Checkbutton(
+            check_frame, text="Profil çıkar", 
+            variable=self.profile_var, bg=COLORS["white"], 
+            font=FONTS["normal"])
+        profile_check.pack(side="right", padx=15)
+        
+        dedup_check = tk.Checkbutton(
+            check_frame, text="Mükerrerleri birleştir", 
+            variable=self.dedup_var, bg=COLORS["white"], 
+            font=FONTS["normal"])
+        dedup_check.pack(side="right", padx=15)
+        
+        postprocess_check = tk.Checkbutton(
+            check_frame, text="Normalleştir", 
+            variable=self.postprocess_var, bg=COLORS["white"], 
+            font=FONTS["normal"])
+        postprocess_check.pack(side="right", padx=15)
+        
+        history_check = tk.Checkbutton(
+            check_frame, text="Geçmişe kaydet", 
+            variable=self.history_var, bg=COLORS["white"], 
+            font=FONTS["normal"])
+        history_check.pack(side="right", padx=15)
+        
         # E-posta seçiliyse websitesi de seçilmeli bilgisi
         self.email_info_label = tk.Label(
             options_grid, 
@@ -271,9 +350,29 @@ class MainWindow:
         log_frame = StyledFrame(main_container, "İşlem Detayları")
         log_frame.pack(fill="both", expand=True, pady=10)
         
-        self.status_text = LogConsole(log_frame)
+        self.status_text = LogConsole(log_frame, max_lines=UI_CONFIG["log_max_lines"])
         self.status_text.pack(fill="both", expand=True, pady=10, padx=10)
     
+    def setup_records_tab(self):
+        """Canlı sonuç tablosu sekmesini oluştur"""
+        main_container = tk.Frame(self.records_tab, bg=COLORS["background"], padx=10, pady=10)
+        main_container.pack(fill="both", expand=True)
+        
+        buttons_frame = tk.Frame(main_container, bg=COLORS["background"])
+        buttons_frame.pack(fill="x", pady=(0, 10))
+        
+        # Yalnızca filtrelenmiş/sıralanmış görünümü dışa aktarır
+        self.export_view_button = StyledButton(
+            buttons_frame, "Görünümü Dışa Aktar", self.export_view, 
+            is_primary=False)
+        self.export_view_button.pack(side="right", padx=5)
+        
+        table_frame = StyledFrame(main_container, "Toplanan İşletmeler")
+        table_frame.pack(fill="both", expand=True)
+        
+        self.results_table = ResultsTable(table_frame)
+        self.results_table.pack(fill="both", expand=True, padx=5, pady=5)
+    
     def _show_settings_tab(self):
         """Ayarlar sekmesini göster"""
         self.notebook.select(0)  # İlk sekme (0) ayarlar sekmesi
@@ -293,16 +392,37 @@ class MainWindow:
             self.email_info_label.configure(fg="gray")
     
     def process_queue(self):
-        """Mesaj kuyruğundan ileti işleme"""
+        """
+        Olay ve ileti kuyruklarını işleme
+        
+        Bir turda biriken olaylar konsola tek seferde eklenir; durum etiketi ve
+        ilerleme çubuğu yalnızca son değerle ve sınırlı sıklıkta güncellenir.
+        """
+        messages = []
+        results = []
+        reload_results = False
+        
+        events, backlog = self.event_subscriber.drain(UI_CONFIG["max_messages_per_tick"])
+        for event in events:
+            if event.kind == PROGRESS:
+                self.pending_progress = event.payload["value"]
+                if event.payload["total"]:
+                    self.progress['maximum'] = event.payload["total"]
+                continue
+            if event.kind == BUSINESS_FINISHED:
+                results.append(event.payload["record"])
+            messages.append(event)
+        if messages:
+            self.pending_status = messages[-1]
+            
         try:
             while True:
                 msg_type, msg = self.message_queue.get_nowait()
-                if msg_type == "status":
-                    self.status_text.log(msg)
-                    self.status_label.config(text=msg)
-                elif msg_type == "progress":
-                    self.progress['value'] = msg
-                    self.progress_text.set(f"İşlem: {msg}/{self.progress['maximum']}")
+                if msg_type == "progress":
+                    self.pending_progress = msg
+                elif msg_type == "results_reload":
+                    # Son işleme/birleştirme sonrası tablo veri yöneticisinden yeniden yüklenir
+                    reload_results = True
                 elif msg_type == "max_progress":
                     self.progress['maximum'] = msg
                 elif msg_type == "enable_start":
@@ -317,11 +437,38 @@ class MainWindow:
                     self._show_results_tab()
         except queue.Empty:
             pass
-        self.window.after(100, self.process_queue)
+            
+        if reload_results:
+            self.results_table.set_records(self.data_manager.get_data())
+        elif results:
+            self.results_table.add_records(results)
+        if messages:
+            self.status_text.log_many(messages)
+        self._refresh_status()
+        
+        # Kuyrukta ileti kaldıysa arayüz olaylarına fırsat verip hemen devam et
+        self.window.after(1 if backlog else UI_CONFIG["queue_poll_ms"], self.process_queue)
+        
+    def _refresh_status(self):
+        """Bekleyen durum etiketi ve ilerleme değerini sıklık sınırına uyarak uygular"""
+        if self.pending_status is None and self.pending_progress is None:
+            return
+        now = time.monotonic()
+        if (now - self.last_status_update) * 1000 < UI_CONFIG["status_update_ms"]:
+            return
+        self.last_status_update = now
+        
+        if self.pending_status is not None:
+            self.status_label.config(text=str(self.pending_status))
+            self.pending_status = None
+        if self.pending_progress is not None:
+            self.progress['value'] = self.pending_progress
+            self.progress_text.set(f"İşlem: {self.pending_progress}/{self.progress['maximum']}")
+            self.pending_progress = None
 
     def update_status(self, message):
         """Durum güncellemesi"""
-        self.message_queue.put(("status", message))
+        self.events.status(message)
 
     def clear_logs(self):
         """Log alanını temizle"""
@@ -351,9 +498,11 @@ class MainWindow:
             return
         
         # UI durumunu güncelle
+        self.results_table.clear()
         self.message_queue.put(("disable_start", None))
         self.message_queue.put(("progress", 0))
         self.is_running = True
+        self.cancel_token = CancellationToken()
         
         # Veri toplama seçenekleri
         data_options = {
@@ -368,42 +517,78 @@ class MainWindow:
             data_options['collect_website'] = True
             self.collect_website_var.set(True)
         
+        # Tarama sonrası işlemler (Tk değişkenleri yalnızca arayüz iş parçacığında okunur)
+        run_options = {
+            'postprocess': self.postprocess_var.get(),
+            'dedup': self.dedup_var.get(),
+            'history': self.history_var.get(),
+        }
+        
         # Tarama işlemini başlat
         thread = threading.Thread(
             target=self.start_scraping,
-            args=(search_term, city, max_business, data_options)
+            args=(search_term, city, max_business, data_options, self.profile_var.get(), run_options)
         )
         thread.daemon = True
         thread.start()
         
-    def start_scraping(self, search_term, city, max_business, data_options):
-        """Tarama işlemini gerçekleştir"""
+    def start_scraping(self, search_term, city, max_business, data_options, profile=False, run_options=None):
+        """
+        Tarama işlemini gerçekleştir
+        
+        Args:
+            run_options: Tarama seçenekleri ('postprocess', 'dedup', 'history')
+        """
+        run_options = run_options or {}
+        # Profil: cProfile bu (tarama) iş parçacığını, örnekleyici arayüz dahil tüm iş parçacıklarını ölçer
+        profile_run = ProfileRun(PROFILE_CONFIG["mode"] or BOTH).start() if profile else None
+        if MEMORY_CONFIG["enabled"]:
+            memory_monitor.start(self.update_status)
         try:
             # Tarayıcıyı başlat
             self.update_status(f"Tarama başlatılıyor: {search_term}, {city}")
             self.message_queue.put(("max_progress", max_business))
+            estimate = format_estimate(max_business, data_options.get('collect_email', True))
+            if estimate:
+                self.update_status(estimate)
             
             # Scraper'ı oluştur
             scraper = MapsScraper(
-                queue_handler=self.message_queue
+                event_bus=self.events
             )
             
             # Veri yöneticisini temizle
             self.data_manager.clear_data()
             
-            # Tarama işlemini başlat
+            # Akışlı dışa aktarma açıksa kayıtlar geldikçe diske yazılır
+            if EXPORT_CONFIG["stream_enabled"]:
+                self.data_manager.start_stream()
+            
+            # Tarama işlemini başlat - her kayıt toplandığı anda veri yöneticisine eklenir.
+            # Durdurulursa toplanan kayıtlarla döner; aşağıdaki işlemler onlara uygulanır.
             results = scraper.scrape(
                 search_term=search_term,
                 city=city,
                 max_items=max_business,
-                is_running_check=lambda: self.is_running,
-                data_options=data_options
+                data_options=data_options,
+                result_callback=self.data_manager.add_record,
+                cancel_token=self.cancel_token,
+                record_history=run_options.get('history', False)
             )
             
-            # Sonuçları kaydet
+            # Sonuçları bildir
             if results:
-                self.data_manager.set_data(results)
                 self.update_status(f"Toplam {len(results)} işletme verisi toplandı.")
+                
+                # Telefon, e-posta ve website alanlarını normalleştir (birleştirme de bundan yararlanır)
+                if run_options.get('postprocess'):
+                    self.data_manager.postprocess(self.update_status)
+                
+                # Aynı işletmenin tekrar eden kayıtlarını birleştir
+                if run_options.get('dedup'):
+                    self.data_manager.deduplicate(self.update_status)
+                if run_options.get('postprocess') or run_options.get('dedup'):
+                    self.message_queue.put(("results_reload", None))
                 self.message_queue.put(("enable_start", None))
             else:
                 self.update_status("Hiç veri bulunamadı!")
@@ -416,12 +601,22 @@ class MainWindow:
             self.message_queue.put(("enable_start", None))
         finally:
             self.is_running = False
+            self.data_manager.flush()
+            stream_files = self.data_manager.close_stream()
+            if stream_files:
+                self.update_status(f"Kayıtlar akışla yazıldı: {', '.join(stream_files)}")
+            memory_monitor.stop()
+            if profile_run:
+                profile_run.stop()
+                self.update_status(profile_run.summary())
             self.update_status("İşlem tamamlandı.")
             self.message_queue.put(("enable_start", None))
     
     def stop_scraping(self):
-        """Tarama işlemini durdur"""
+        """Tarama işlemini durdur (süren beklemeler ve sayfa yüklemeleri hemen kesilir)"""
         self.is_running = False
+        if self.cancel_token:
+            self.cancel_token.cancel()
         self.update_status("Kullanıcı tarafından durduruldu. İşlemler sonlanıyor...")
     
     def export_results(self):
@@ -438,6 +633,27 @@ class MainWindow:
             self.update_status(f"Dışa aktarma hatası: {str(e)}")
             messagebox.showerror("Hata", f"Dışa aktarma sırasında hata oluştu: {str(e)}")
     
+    def export_view(self):
+        """Sonuç tablosunun filtrelenmiş görünümünü dışa aktar"""
+        if not self.results_table.view:
+            messagebox.showwarning("Uyarı", "Görünümde dışa aktarılacak kayıt yok!")
+            return
+        
+        try:
+            file_path = self.data_manager.export_data(records=self.results_table.visible_records())
+            self.update_status(f"Görünüm ({len(self.results_table.view)} kayıt) {file_path} dosyasına kaydedildi!")
+            messagebox.showinfo("Başarılı", f"Veriler {file_path} dosyasına kaydedildi!")
+        except Exception as e:
+            self.update_status(f"Dışa aktarma hatası: {str(e)}")
+            messagebox.showerror("Hata", f"Dışa aktarma sırasında hata oluştu: {str(e)}")
+    
     def run(self):
         """Uygulamayı başlat"""
-        self.window.mainloop()
\ No newline at end of file
+        try:
+            self.window.mainloop()
+        finally:
+            self.data_manager.close()
+            if self.file_log:
+                self.file_log.close()
+            if self.metrics_server:
+                self.metrics_server.shutdown()
\ No newline at end of file
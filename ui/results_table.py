@@ -0,0 +1,242 @@
+"""
+Canlı sonuç tablosu - yalnızca görünen satırları çizen sanal Treeview
+"""
+import tkinter as tk
+from tkinter import ttk
+from .styling import COLORS, FONTS
+
+# Tabloda gösterilen sütunlar: başlık, kayıt alanı, genişlik
+TABLE_COLUMNS = [
+    ("İsim", "name", 200),
+    ("Telefon", "phone", 120),
+    ("Website", "website", 180),
+    ("E-postalar", "emails", 200),
+    ("Adres", "address", 250),
+]
+
+HEADER_HEIGHT = 24  # Treeview başlık satırının yaklaşık yüksekliği (piksel)
+
+def cell_text(record, field):
+    """Kaydın alanını tabloda gösterilecek metne çevirir (eksikse boş)"""
+    if field == 'emails':
+        return "; ".join(record.emails)
+    value = getattr(record, field)
+    return "" if value is None else str(value)
+
+def sort_key(record, field):
+    """Sıralama anahtarı: boş değerler artan sıralamada sonda, metinler büyük/küçük harf duyarsız"""
+    text = cell_text(record, field)
+    return (not text, text.casefold())
+
+class ResultsTable(tk.Frame):
+    """
+    Kayıtları canlı gösteren sanal tablo
+    
+    Treeview'da yalnızca görünen satır sayısı kadar öğe bulunur; kaydırma
+    sırasında bu öğelerin değerleri güncellenir. Filtreleme ve sıralama,
+    kayıt listesi kopyalanmadan indeks listesi (görünüm) üzerinde yapılır.
+    """
+    def __init__(self, parent, filter_delay_ms=300, **kwargs):
+        """
+        Args:
+            parent: Üst widget
+            filter_delay_ms: Filtre yazımı bittikten sonra uygulanmadan önceki bekleme (ms)
+        """
+        super().__init__(parent, bg=COLORS["white"], **kwargs)
+        self.filter_delay_ms = filter_delay_ms
+        
+        self.records = []       # Tüm kayıtlar (eklenme sırasıyla)
+        self.view = []          # Filtreden geçen kayıtların indeksleri (sıralı)
+        self.first = 0          # Görünen ilk satırın görünümdeki konumu
+        self.visible_rows = 0
+        self.row_items = []     # Yeniden kullanılan Treeview öğeleri
+        
+        self.filter_text = ""
+        self.filter_job = None
+        self.sort_field = None
+        self.sort_reverse = False
+        self.sort_keys = []     # Sıralama alanının kayıt indeksine göre anahtarları
+        
+        self._build()
+        
+    def _build(self):
+        """Filtre satırı, tablo ve kaydırma çubuğunu oluştur"""
+        toolbar = tk.Frame(self, bg=COLORS["white"])
+        toolbar.pack(fill="x", pady=(0, 5))
+        
+        tk.Label(toolbar, text="Filtre:", font=FONTS["normal"], bg=COLORS["white"]).pack(side="left")
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add("write", self._on_filter_changed)
+        ttk.Entry(toolbar, textvariable=self.filter_var, width=40).pack(side="left", padx=5)
+        
+        self.count_label = tk.Label(toolbar, text="0 kayıt", font=FONTS["normal"], bg=COLORS["white"])
+        self.count_label.pack(side="right")
+        
+        body = tk.Frame(self, bg=COLORS["white"])
+        body.pack(fill="both", expand=True)
+        
+        columns = [field for _, field, _ in TABLE_COLUMNS]
+        self.tree = ttk.Treeview(body, columns=columns, show="headings", selectmode="browse")
+        for header, field, width in TABLE_COLUMNS:
+            self.tree.heading(field, text=header, command=lambda f=field: self.sort_by(f))
+            self.tree.column(field, width=width, stretch=True)
+            
+        self.scrollbar = ttk.Scrollbar(body, orient="vertical", command=self._on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+        
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_to(self.first - 3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_to(self.first + 3))
+        self.tree.bind("<Prior>", lambda e: self.scroll_to(self.first - self.visible_rows))
+        self.tree.bind("<Next>", lambda e: self.scroll_to(self.first + self.visible_rows))
+        
+    # --- Veri ---
+    
+    def add_records(self, records):
+        """
+        Yeni kayıtları ekler; görünüm sondaysa yeni satırlar görünür kalır
+        
+        Args:
+            records: BusinessRecord listesi
+        """
+        if not records:
+            return
+        follow = self.first + self.visible_rows >= len(self.view)
+        
+        start = len(self.records)
+        self.records.extend(records)
+        new_indices = [index for index in range(start, len(self.records)) if self._matches(index)]
+        if self.sort_field:
+            self.sort_keys.extend(sort_key(record, self.sort_field) for record in records)
+            self.view.extend(new_indices)
+            # Görünüm zaten sıralı; Timsort eklenen kısa diziyi doğrusal sürede birleştirir
+            self.view.sort(key=self.sort_keys.__getitem__, reverse=self.sort_reverse)
+        else:
+            self.view.extend(new_indices)
+            
+        if follow and not self.sort_field:
+            self.first = max(0, len(self.view) - self.visible_rows)
+        self.render()
+        
+    def set_records(self, records):
+        """Tüm kayıtları değiştirir (ör. birleştirme sonrası), filtre ve sıralama korunur"""
+        self.records = list(records)
+        self.first = 0
+        self._rebuild_view()
+        
+    def clear(self):
+        """Tabloyu boşaltır"""
+        self.set_records([])
+        
+    def visible_records(self):
+        """Filtreden geçen kayıtları görünüm sırasıyla döndürür (kopya oluşturmadan)"""
+        return (self.records[index] for index in self.view)
+        
+    def is_filtered(self):
+        """Filtre uygulanmış mı"""
+        return bool(self.filter_text)
+        
+    # --- Filtreleme ve sıralama ---
+    
+    def _matches(self, index):
+        """Kayıt filtre metnini herhangi bir sütunda içeriyor mu"""
+        if not self.filter_text:
+            return True
+        record = self.records[index]
+        return any(self.filter_text in cell_text(record, field).casefold() for _, field, _ in TABLE_COLUMNS)
+        
+    def _on_filter_changed(self, *args):
+        """Filtre yazımı sürerken her tuşta yeniden filtrelememek için gecikmeli uygula"""
+        if self.filter_job:
+            self.after_cancel(self.filter_job)
+        self.filter_job = self.after(self.filter_delay_ms, self.apply_filter)
+        
+    def apply_filter(self):
+        """Filtre kutusundaki metni uygular"""
+        self.filter_job = None
+        self.filter_text = self.filter_var.get().strip().casefold()
+        self.first = 0
+        self._rebuild_view()
+        
+    def sort_by(self, field):
+        """Sütuna göre sıralar; aynı sütuna tekrar tıklanınca yön değişir"""
+        if self.sort_field == field:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_field = field
+            self.sort_reverse = False
+        for header, column, _ in TABLE_COLUMNS:
+            arrow = (" ▼" if self.sort_reverse else " ▲") if column == field else ""
+            self.tree.heading(column, text=header + arrow)
+        self.first = 0
+        self._rebuild_view()
+        
+    def _rebuild_view(self):
+        """Görünüm indekslerini filtre ve sıralamaya göre yeniden oluşturur"""
+        if self.filter_text:
+            self.view = [index for index in range(len(self.records)) if self._matches(index)]
+        else:
+            self.view = list(range(len(self.records)))
+        if self.sort_field:
+            self.sort_keys = [sort_key(record, self.sort_field) for record in self.records]
+            self.view.sort(key=self.sort_keys.__getitem__, reverse=self.sort_reverse)
+        self.render()
+        
+    # --- Çizim ve kaydırma ---
+    
+    def _on_resize(self, event):
+        """Pencere boyutu değişince görünen satır sayısı kadar Treeview öğesi tut"""
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        rows = max(1, (event.height - HEADER_HEIGHT) // row_height)
+        if rows == self.visible_rows:
+            return
+        while len(self.row_items) < rows:
+            self.row_items.append(self.tree.insert("", "end", values=()))
+        while len(self.row_items) > rows:
+            self.tree.delete(self.row_items.pop())
+        self.visible_rows = rows
+        self.render()
+        
+    def scroll_to(self, first):
+        """Görünen ilk satırı değiştirir"""
+        first = max(0, min(first, len(self.view) - self.visible_rows))
+        if first != self.first:
+            self.first = first
+            self.render()
+            
+    def _on_scroll(self, action, amount, unit=None):
+        """Kaydırma çubuğu komutları: moveto <oran> veya scroll <adet> units/pages"""
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.view)))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.scroll_to(self.first + int(amount) * step)
+            
+    def _on_mousewheel(self, event):
+        """Windows/macOS fare tekerleği"""
+        self.scroll_to(self.first - (3 if event.delta > 0 else -3))
+        
+    def render(self):
+        """Yalnızca görünen satırların değerlerini günceller"""
+        total = len(self.view)
+        self.first = max(0, min(self.first, total - self.visible_rows))
+        
+        for offset, item in enumerate(self.row_items):
+            position = self.first + offset
+            if position < total:
+                record = self.records[self.view[position]]
+                self.tree.item(item, values=[cell_text(record, field) for _, field, _ in TABLE_COLUMNS])
+            else:
+                self.tree.item(item, values=())
+                
+        if total > self.visible_rows:
+            self.scrollbar.set(self.first / total, (self.first + self.visible_rows) / total)
+        else:
+            self.scrollbar.set(0, 1)
+            
+        if self.filter_text:
+            self.count_label.config(text=f"{total} / {len(self.records)} kayıt")
+        else:
+            self.count_label.config(text=f"{total} kayıt")
\ No newline at end of file
@@ -0,0 +1,268 @@
+"""
+Alan adı sınıflandırma indeksi (sosyal medya, platform, harita, işletme)
+"""
+import re
+import json
+import ipaddress
+import threading
+
+# Kategoriler
+SOCIAL = "social"          # Sosyal medya profilleri
+PLATFORM = "platform"      # Rehber, rezervasyon, pazar yeri, kısaltıcı vb.
+MAPS = "maps"              # Google Maps ve harita bağlantıları
+BUSINESS = "business"      # İşletmenin kendi websitesi
+
+CATEGORIES = (SOCIAL, PLATFORM, MAPS)
+
+# Genel sonek listesinin (Public Suffix List) uygulamada gereken alt kümesi.
+# Listede olmayan tek etiketli TLD'ler de sonek kabul edilir (PSL varsayılan kuralı).
+DEFAULT_SUFFIXES = [
+    # Türkiye
+    "com.tr", "net.tr", "org.tr", "gen.tr", "web.tr", "biz.tr", "info.tr", "tv.tr", "av.tr",
+    "dr.tr", "bbs.tr", "name.tr", "tel.tr", "bel.tr", "pol.tr", "mil.tr", "k12.tr", "edu.tr",
+    "gov.tr", "kep.tr", "nc.tr", "gov.nc.tr",
+    # Sık görülen diğer ikinci seviye sonekler
+    "co.uk", "org.uk", "me.uk", "ltd.uk", "plc.uk", "ac.uk", "gov.uk",
+    "com.au", "net.au", "org.au", "co.nz", "co.za", "co.jp", "ne.jp", "or.jp",
+    "com.br", "com.mx", "com.ar", "com.cy", "com.de", "co.de", "com.gr", "com.az", "com.ua",
+    "co.il", "co.in", "co.kr", "com.cn", "com.hk", "com.sg",
+    # Kullanıcıların kendi alt alan adını aldığı barındırma servisleri
+    "blogspot.com", "wixsite.com", "github.io", "netlify.app", "herokuapp.com",
+    "wordpress.com", "business.site", "web.app", "firebaseapp.com",
+]
+
+# Kural, alan adının kendisini ve tüm alt alan adlarını kapsar; "ad.*" biçimindeki kural
+# kayıt edilebilir alan adı "ad.<genel sonek>" olan tüm hostları kapsar (ör. google.de, google.co.uk)
+DEFAULT_RULES = {
+    SOCIAL: [
+        "facebook.com", "fb.com", "fb.me", "instagram.com", "twitter.com", "x.com", "t.co",
+        "linkedin.com", "youtube.com", "youtu.be", "tiktok.com", "pinterest.com", "vk.com",
+        "whatsapp.com", "wa.me", "t.me", "telegram.me", "threads.net", "snapchat.com",
+    ],
+    PLATFORM: [
+        "yelp.com", "tripadvisor.com", "tripadvisor.com.tr", "foursquare.com", "booking.com",
+        "yemeksepeti.com", "getir.com", "trendyol.com", "hepsiburada.com", "n11.com",
+        "sahibinden.com", "armut.com", "zomato.com", "menulux.com", "linktr.ee",
+        "bit.ly", "tinyurl.com", "goo.gl",
+    ],
+    MAPS: [
+        "google.com", "google.com.tr", "maps.app.goo.gl", "g.page", "g.co",
+        "googleusercontent.com", "gstatic.com", "googleapis.com", "maps.apple.com",
+        "yandex.com.tr", "here.com", "google.*",
+    ],
+}
+
+# Host yalnızca "şema://" veya "//" sonrasında ya da yalın host adı olarak (isteğe bağlı port ve yol ile) aranır;
+# "mailto:x", "tel:..." gibi hostsuz URL'ler eşleşmez
+HOST_PATTERN = re.compile(
+    r'^(?:(?:[a-zA-Z][a-zA-Z0-9+.-]*:)?//(?:[^@/?#]*@)?(?P<authority>\[[^\]/?#]*\]|[^/:?#]*)'
+    r'|(?P<bare>\[[^\]/?#]*\]|[^/:?#@\s]+)(?::\d*)?(?:[/?#]|$))'
+)
+
+def extract_host(url_or_host):
+    """
+    URL'den veya host adından küçük harfli host adını çıkarır
+    
+    Args:
+        url_or_host: "https://www.ornek.com/x" veya "www.ornek.com"
+        
+    Returns:
+        str: Host adı (URL'de host yoksa, ör. "mailto:x", None)
+    """
+    if not url_or_host or not isinstance(url_or_host, str):
+        return None
+    match = HOST_PATTERN.match(url_or_host.strip())
+    if not match:
+        return None
+    host = (match.group('authority') or match.group('bare') or '').lower().strip('.')
+    return host or None
+
+def is_ip_host(host):
+    """Host bir IPv4 adresi veya köşeli parantezli IPv6 adresi mi"""
+    if host.startswith('['):
+        host = host[1:-1] if host.endswith(']') else ''
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
+
+class _LabelTrie:
+    """Ters çevrilmiş alan adı etiketlerinden oluşan trie (com -> ornek -> www)"""
+    __slots__ = ('root',)
+    
+    def __init__(self):
+        self.root = {}
+        
+    def add(self, domain, value):
+        node = self.root
+        for label in reversed(domain.lower().strip('.').split('.')):
+            node = node.setdefault(label, {})
+        node[None] = value  # None anahtarı düğümün değerini tutar
+        
+    def longest_match(self, labels):
+        """
+        Etiketleri sondan başa gezerek en uzun eşleşen kuralı bulur
+        
+        Args:
+            labels: Host etiketleri (ör. ['www', 'ornek', 'com', 'tr'])
+            
+        Returns:
+            tuple: (eşleşen etiket sayısı, değer) veya (0, None)
+        """
+        node = self.root
+        depth, value = 0, None
+        for position, label in enumerate(reversed(labels), 1):
+            node = node.get(label)
+            if node is None:
+                break
+            if None in node:
+                depth, value = position, node[None]
+        return depth, value
+
+class DomainIndex:
+    """
+    Host adlarını genel sonek farkında ayrıştırıp kategoriye ayıran indeks
+    
+    Arama, host etiket sayısı kadar adımda tamamlanır. "google.com" kuralı
+    "maps.google.com" hostunu kapsar, ancak yolunda "google.com" geçen
+    "ornek.com/google.com" adresini kapsamaz.
+    """
+    def __init__(self, rules=None, suffixes=None):
+        """
+        Args:
+            rules: Kategori -> alan adı listesi (None = DEFAULT_RULES)
+            suffixes: Genel sonek listesi (None = DEFAULT_SUFFIXES)
+        """
+        self.rules = _LabelTrie()
+        self.suffixes = _LabelTrie()
+        self.any_suffix_rules = {}  # "google.*" -> {"google": kategori}
+        
+        for suffix in (DEFAULT_SUFFIXES if suffixes is None else suffixes):
+            self.suffixes.add(suffix, True)
+        for category, domains in (DEFAULT_RULES if rules is None else rules).items():
+            for domain in domains:
+                if domain.endswith('.*'):
+                    self.any_suffix_rules[domain[:-2].lower().strip('.')] = category
+                else:
+                    self.rules.add(domain, category)
+                
+    @classmethod
+    def from_file(cls, path):
+        """
+        JSON dosyasındaki ek kurallarla varsayılan indeksi genişletir
+        
+        Dosya biçimi: {"suffixes": [...], "social": [...], "platform": [...],
+        "maps": [...], "business": [...]}. "business" listesindeki alan adları
+        başka bir kurala takılsa bile işletme sayılır (ör. bir platformun
+        kendi alt alan adında barındırılan işletme sitesi).
+        
+        Args:
+            path: JSON dosyasının yolu
+            
+        Returns:
+            DomainIndex: İndeks
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+            
+        rules = {category: list(domains) for category, domains in DEFAULT_RULES.items()}
+        for category in CATEGORIES + (BUSINESS,):
+            rules.setdefault(category, []).extend(config.get(category, []))
+        return cls(rules=rules, suffixes=DEFAULT_SUFFIXES + list(config.get("suffixes", [])))
+        
+    def public_suffix(self, url_or_host):
+        """Hostun genel sonekini döndürür (ör. "com.tr")"""
+        host = extract_host(url_or_host)
+        if not host or is_ip_host(host):
+            return None
+        labels = host.split('.')
+        depth, _ = self.suffixes.longest_match(labels)
+        return '.'.join(labels[-max(depth, 1):])
+        
+    def registrable_domain(self, url_or_host):
+        """
+        Hostun kayıt edilebilir alan adını döndürür (ör. shop.ornek.com.tr -> ornek.com.tr)
+        
+        Args:
+            url_or_host: URL veya host adı
+            
+        Returns:
+            str: Kayıt edilebilir alan adı (host bir sonekin kendisi veya IP adresiyse host) veya None
+        """
+        host = extract_host(url_or_host)
+        if not host:
+            return None
+        if is_ip_host(host):
+            return host
+        labels = host.split('.')
+        depth, _ = self.suffixes.longest_match(labels)
+        depth = max(depth, 1)
+        if len(labels) <= depth:
+            return host
+        return '.'.join(labels[-(depth + 1):])
+        
+    def classify(self, url_or_host):
+        """
+        Hostu kategoriye ayırır
+        
+        Args:
+            url_or_host: URL veya host adı
+            
+        Returns:
+            str: social, platform, maps veya business (host yoksa veya IP adresiyse None)
+        """
+        host = extract_host(url_or_host)
+        if not host or is_ip_host(host):
+            return None
+        labels = host.split('.')
+        _, category = self.rules.longest_match(labels)
+        if category is None and self.any_suffix_rules:
+            depth, _ = self.suffixes.longest_match(labels)
+            depth = max(depth, 1)
+            if len(labels) > depth:
+                category = self.any_suffix_rules.get(labels[-(depth + 1)])
+        return category or BUSINESS
+        
+    def is_business(self, url_or_host):
+        """URL bir işletmenin kendi sitesine mi ait"""
+        return self.classify(url_or_host) == BUSINESS
+        
+    def same_site(self, first, second):
+        """İki URL aynı kayıt edilebilir alan adında mı (www. ve alt alan adları dahil)"""
+        first_domain = self.registrable_domain(first)
+        return first_domain is not None and first_domain == self.registrable_domain(second)
+
+_shared_index = None
+_shared_rules_file = None
+_shared_lock = threading.Lock()
+
+def get_domain_index():
+    """
+    Uygulama genelinde paylaşılan indeksi döndürür
+    
+    Returns:
+        DomainIndex: Paylaşılan indeks (yüklenmediyse varsayılan kurallarla oluşturulur)
+    """
+    global _shared_index
+    if _shared_index is None:
+        with _shared_lock:
+            if _shared_index is None:
+                _shared_index = DomainIndex()
+    return _shared_index
+
+def configure_domain_index(rules_file=None):
+    """
+    Paylaşılan indeksi kural dosyasıyla yeniden oluşturur
+    
+    Aynı dosya zaten yüklüyse bir şey yapmaz.
+    
+    Args:
+        rules_file: JSON kural dosyası (None = yalnızca varsayılan kurallar)
+    """
+    global _shared_index, _shared_rules_file
+    with _shared_lock:
+        if _shared_index is not None and rules_file == _shared_rules_file:
+            return
+        _shared_index = DomainIndex.from_file(rules_file) if rules_file else DomainIndex()
+        _shared_rules_file = rules_file
\ No newline at end of file
@@ -3,8 +3,9 @@ E-posta bulma yardımcıları
 """
 import re
 from selenium.webdriver.common.by import By
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urljoin
 from .validators import is_valid_email
+from .domain_index import get_domain_index
 
 class EmailFinder:
     """
@@ -36,6 +37,10 @@ class EmailFinder:
             self.update_status("E-posta taraması için tarayıcı bulunamadı!")
             return emails
             
+        if not get_domain_index().is_business(website_url):
+            self.update_status(f"{website_url} bir işletme websitesi değil, e-posta taraması yapılmayacak.")
+            return emails
+            
         try:
             # Yeni pencere aç
             self.update_status(f"E-posta taraması için {website_url} ziyaret ediliyor (yeni pencerede)...")
@@ -55,7 +60,7 @@ class EmailFinder:
             for link in contact_links[:2]:  # En fazla 2 iletişim sayfasını ziyaret et
                 try:
                     self.update_status(f"İletişim sayfası ziyaret ediliyor: {link}")
-                    self.browser.driver.get(link)
+                    self.browser.get(link)
                     self.browser.random_sleep()
                     
                     contact_emails = self.find_emails_on_page(self.browser.driver)
@@ -157,8 +162,8 @@ class EmailFinder:
         
         try:
             links = driver.find_elements(By.TAG_NAME, "a")
-            parsed_base = urlparse(base_url)
-            base_domain = parsed_base.netloc
+            domains = get_domain_index()
+            base_domain = domains.registrable_domain(base_url)
             
             for link in links:
                 try:
@@ -168,10 +173,9 @@ class EmailFinder:
                         
                     # Mutlak URL'ye çevir
                     absolute_url = urljoin(base_url, href)
-                    parsed_url = urlparse(absolute_url)
                     
-                    # Aynı domain'de olduğunu kontrol et
-                    if parsed_url.netloc != base_domain:
+                    # Aynı siteye (www. ve alt alan adları dahil) ait olduğunu kontrol et
+                    if domains.registrable_domain(absolute_url) != base_domain:
                         continue
                     
                     # Link metnini veya href değerini kontrol et
@@ -0,0 +1,548 @@
+"""
+HTML fikstürlerinden yanıt veren bellek içi sahte WebDriver
+
+Çıkarıcıların Python tarafını tarayıcısız ölçmek için find_elements,
+get_attribute, .text, page_source ve current_url çağrılarını saklanan HTML
+üzerinden yanıtlar. Her çağrı gerçek sürücüdeki bir gidiş-dönüşe karşılık
+gelir; komut adına göre sayılır ve isteğe bağlı gecikmeyle yavaşlatılabilir.
+
+Desteklenen seçiciler:
+- CSS: etiket, #id, .sınıf, [öznitelik], [öznitelik=, *=, ^=, $=, ~= değer],
+  :not(...), alt öğe (boşluk) ve doğrudan çocuk (>) birleştiricileri, virgül
+- XPath: //etiket[koşul] ve isteğe bağlı /ancestor::etiket; koşul, or/and ile
+  bağlanmış contains(@öznitelik | text() | ., 'metin') ifadeleri
+"""
+import re
+import time
+import threading
+from collections import Counter
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+try:
+    from selenium.common.exceptions import NoSuchElementException, InvalidSelectorException
+except ImportError:
+    class NoSuchElementException(Exception):
+        pass
+        
+    class InvalidSelectorException(Exception):
+        pass
+
+# selenium.webdriver.common.by.By ile aynı değerler
+CSS_SELECTOR = "css selector"
+TAG_NAME = "tag name"
+XPATH = "xpath"
+ID = "id"
+CLASS_NAME = "class name"
+
+VOID_TAGS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+                       'param', 'source', 'track', 'wbr'))
+# Metni görünmeyen etiketler (.text'e katılmaz)
+HIDDEN_TAGS = frozenset(('head', 'script', 'style', 'template', 'noscript', 'title'))
+# Metinde satır sonu oluşturan etiketler
+BLOCK_TAGS = frozenset(('address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt', 'fieldset',
+                        'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li',
+                        'main', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'tr', 'ul'))
+# Selenium get_attribute bu öznitelikler için mutlak adres döndürür
+URL_ATTRIBUTES = frozenset(('href', 'src', 'action'))
+
+SPACE_PATTERN = re.compile(r'[ \t\r\f\v]+')
+
+class Node:
+    """HTML ağacındaki bir öğe"""
+    __slots__ = ('tag', 'attrs', 'children', 'parent', 'classes')
+    
+    def __init__(self, tag, attrs, parent=None):
+        self.tag = tag
+        self.attrs = attrs
+        self.children = []      # Node veya metin (str)
+        self.parent = parent
+        self.classes = frozenset(attrs.get('class', '').split())
+        
+    def iter_descendants(self):
+        """Alt öğeleri belge sırasıyla gezer"""
+        stack = [child for child in reversed(self.children) if isinstance(child, Node)]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(child for child in reversed(node.children) if isinstance(child, Node))
+            
+    def ancestors(self):
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+            
+    def raw_text(self):
+        """Gizli etiketler dahil tüm metin (XPath '.' ve text() için)"""
+        parts = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                parts.append(node)
+            else:
+                stack.extend(reversed(node.children))
+        return "".join(parts)
+        
+    def visible_text(self):
+        """Selenium .text benzeri görünen metin: blok öğeler satır sonuyla ayrılır, boşluklar sadeleşir"""
+        parts = []
+        
+        def walk(node):
+            if node.tag in HIDDEN_TAGS:
+                return
+            block = node.tag in BLOCK_TAGS
+            if block:
+                parts.append("\n")
+            for child in node.children:
+                if isinstance(child, str):
+                    parts.append(child.replace("\n", " "))
+                else:
+                    walk(child)
+            if block:
+                parts.append("\n")
+                
+        walk(self)
+        lines = (SPACE_PATTERN.sub(" ", line).strip() for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+class _TreeBuilder(HTMLParser):
+    """html.parser ile hataya dayanıklı ağaç kurucu (kapanmayan etiketler üst öğede kapanır)"""
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node('#document', {})
+        self.stack = [self.root]
+        
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, {name: value if value is not None else "" for name, value in attrs}, self.stack[-1])
+        self.stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self.stack.append(node)
+            
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.stack.pop()
+            
+    def handle_endtag(self, tag):
+        for position in range(len(self.stack) - 1, 0, -1):
+            if self.stack[position].tag == tag:
+                del self.stack[position:]
+                return
+                
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+def parse_html(source):
+    """
+    HTML metnini öğe ağacına çevirir
+    
+    Returns:
+        Node: Belge kökü
+    """
+    builder = _TreeBuilder()
+    builder.feed(source)
+    builder.close()
+    return builder.root
+
+# --- CSS seçicileri ---
+
+CSS_TOKEN_PATTERN = re.compile(r"""
+    (?P<space>\s*>\s*|\s+)
+  | (?P<tag>\*|[a-zA-Z][\w-]*)
+  | \#(?P<id>[\w-]+)
+  | \.(?P<cls>[\w-]+)
+  | \[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[*^$~|]?=)\s*(?:'(?P<sq>[^']*)'|"(?P<dq>[^"]*)"|(?P<bare>[^\]\s]+)))?\s*\]
+""", re.VERBOSE)
+
+def _split_top_level(selector, separator=','):
+    """Parantez ve tırnak dışındaki ayırıcılardan böler"""
+    parts, depth, quote, current = [], 0, None, []
+    for char in selector:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in "'\"":
+            quote = char
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    parts.append("".join(current))
+    return [part.strip() for part in parts if part.strip()]
+
+def _parse_compound(selector, position):
+    """
+    Birleşik seçiciyi (ör. a.x[href*='y']:not(.z)) koşul listesine çevirir
+    
+    Returns:
+        tuple: (koşullar, yeni konum)
+    """
+    conditions = []
+    while position < len(selector):
+        if selector.startswith(':not(', position):
+            depth, end = 0, position + 4
+            for end in range(position + 4, len(selector)):
+                depth += {'(': 1, ')': -1}.get(selector[end], 0)
+                if depth == 0:
+                    break
+            inner = selector[position + 5:end]
+            conditions.append(('not', _parse_group(inner)))
+            position = end + 1
+            continue
+        match = CSS_TOKEN_PATTERN.match(selector, position)
+        if not match or match.group('space') is not None:
+            break
+        if match.group('tag'):
+            if match.group('tag') != '*':
+                conditions.append(('tag', match.group('tag').lower()))
+        elif match.group('id'):
+            conditions.append(('attr', 'id', '=', match.group('id')))
+        elif match.group('cls'):
+            conditions.append(('class', match.group('cls')))
+        elif match.group('attr'):
+            value = next((v for v in (match.group('sq'), match.group('dq'), match.group('bare')) if v is not None),
+                         None)
+            conditions.append(('attr', match.group('attr').lower(), match.group('op'), value))
+        position = match.end()
+    return conditions, position
+
+def _parse_complex(selector):
+    """
+    Birleştiricili seçiciyi sağdan sola eşleştirme için (birleştirici, koşullar) listesine çevirir
+    
+    Raises:
+        InvalidSelectorException: Seçici çözümlenemezse
+    """
+    steps = []
+    position = 0
+    combinator = None
+    while position < len(selector):
+        conditions, end = _parse_compound(selector, position)
+        if end == position:
+            raise InvalidSelectorException(f"Desteklenmeyen CSS seçicisi: {selector}")
+        steps.append((combinator, conditions))
+        position = end
+        match = CSS_TOKEN_PATTERN.match(selector, position)
+        if match and match.group('space') is not None:
+            combinator = '>' if '>' in match.group('space') else ' '
+            position = match.end()
+    return steps
+
+def _parse_group(selector):
+    return [_parse_complex(part) for part in _split_top_level(selector)]
+
+def _matches_compound(node, conditions):
+    for condition in conditions:
+        kind = condition[0]
+        if kind == 'tag':
+            if node.tag != condition[1]:
+                return False
+        elif kind == 'class':
+            if condition[1] not in node.classes:
+                return False
+        elif kind == 'not':
+            if any(_matches_complex(node, steps) for steps in condition[1]):
+                return False
+        else:
+            _, name, operator, expected = condition
+            value = node.attrs.get(name)
+            if value is None:
+                return False
+            if operator is None:
+                continue
+            if operator == '=' and value != expected:
+                return False
+            if operator == '*=' and (not expected or expected not in value):
+                return False
+            if operator == '^=' and (not expected or not value.startswith(expected)):
+                return False
+            if operator == '$=' and (not expected or not value.endswith(expected)):
+                return False
+            if operator == '~=' and expected not in value.split():
+                return False
+            if operator == '|=' and value != expected and not value.startswith(expected + '-'):
+                return False
+    return True
+
+def _matches_complex(node, steps):
+    """Seçiciyi sağdan sola eşleştirir (alt öğe birleştiricisinde geri izlemeli)"""
+    def match_from(node, index):
+        combinator, conditions = steps[index]
+        if not _matches_compound(node, conditions):
+            return False
+        if index == 0:
+            return True
+        if combinator == '>':
+            parent = node.parent
+            return parent is not None and parent.tag != '#document' and match_from(parent, index - 1)
+        return any(match_from(ancestor, index - 1) for ancestor in node.ancestors() if ancestor.tag != '#document')
+        
+    return match_from(node, len(steps) - 1)
+
+_css_cache = {}
+_css_cache_lock = threading.Lock()
+
+def compile_css(selector):
+    """Seçiciyi çözümler (sonuç önbelleğe alınır)"""
+    compiled = _css_cache.get(selector)
+    if compiled is None:
+        compiled = _parse_group(selector)
+        with _css_cache_lock:
+            _css_cache[selector] = compiled
+    return compiled
+
+def select(root, selector):
+    """
+    Kökün alt öğelerinden CSS seçicisine uyanları belge sırasıyla döndürür
+    
+    Args:
+        root: Node
+        selector: CSS seçicisi
+        
+    Returns:
+        list: Node listesi
+    """
+    groups = compile_css(selector)
+    return [node for node in root.iter_descendants() if any(_matches_complex(node, steps) for steps in groups)]
+
+# --- XPath (alt küme) ---
+
+XPATH_PATTERN = re.compile(r"^\.?//(?P<tag>\*|[\w-]+)(?:\[(?P<predicate>.*)\])?(?:/ancestor::(?P<ancestor>\*|[\w-]+))?$")
+CONTAINS_PATTERN = re.compile(r"contains\(\s*(@[\w-]+|text\(\)|\.)\s*,\s*(?:'([^']*)'|\"([^\"]*)\")\s*\)")
+
+def _compile_predicate(predicate):
+    """
+    contains(...) ifadelerinden oluşan koşulu fonksiyona çevirir
+    
+    Returns:
+        function: Node -> bool
+    """
+    if not predicate:
+        return lambda node: True
+    alternatives = []
+    for alternative in re.split(r"\s+or\s+", predicate):
+        terms = []
+        for term in re.split(r"\s+and\s+", alternative):
+            match = CONTAINS_PATTERN.fullmatch(term.strip())
+            if not match:
+                raise InvalidSelectorException(f"Desteklenmeyen XPath koşulu: {term}")
+            terms.append((match.group(1), match.group(2) if match.group(2) is not None else match.group(3)))
+        alternatives.append(terms)
+        
+    def value_of(node, source):
+        if source == '.':
+            return node.raw_text()
+        if source == 'text()':
+            return "".join(child for child in node.children if isinstance(child, str))
+        return node.attrs.get(source[1:])
+        
+    def evaluate(node):
+        for terms in alternatives:
+            if all((value_of(node, source) or "").find(expected) >= 0 for source, expected in terms):
+                return True
+        return False
+    return evaluate
+
+def select_xpath(root, expression):
+    """
+    Desteklenen XPath alt kümesiyle öğeleri bulur
+    
+    Raises:
+        InvalidSelectorException: İfade desteklenmiyorsa
+    """
+    match = XPATH_PATTERN.match(expression.strip())
+    if not match:
+        raise InvalidSelectorException(f"Desteklenmeyen XPath: {expression}")
+    tag = match.group('tag').lower()
+    predicate = _compile_predicate(match.group('predicate'))
+    found = [node for node in root.iter_descendants() if (tag == '*' or node.tag == tag) and predicate(node)]
+    ancestor_tag = match.group('ancestor')
+    if not ancestor_tag:
+        return found
+    result, seen = [], set()
+    for node in found:
+        for ancestor in node.ancestors():
+            if ancestor.tag != '#document' and (ancestor_tag == '*' or ancestor.tag == ancestor_tag.lower()):
+                if id(ancestor) not in seen:
+                    seen.add(id(ancestor))
+                    result.append(ancestor)
+    # Belge sırasına diz
+    order = {id(node): position for position, node in enumerate(root.iter_descendants())}
+    return sorted(result, key=lambda node: order[id(node)])
+
+# --- Sürücü ---
+
+class HtmlElement:
+    """WebElement benzeri öğe; her işlem sürücüde bir komut olarak sayılır"""
+    __slots__ = ('driver', 'node')
+    
+    def __init__(self, driver, node):
+        self.driver = driver
+        self.node = node
+        
+    @property
+    def tag_name(self):
+        self.driver._command("getElementTagName")
+        return self.node.tag
+        
+    @property
+    def text(self):
+        self.driver._command("getElementText")
+        return self.driver._timed(self.node.visible_text)
+        
+    def get_attribute(self, name):
+        self.driver._command("getElementAttribute")
+        name = name.lower()
+        if name in ('innerhtml', 'textcontent', 'innertext'):
+            return self.driver._timed(self.node.visible_text if name == 'innertext' else self.node.raw_text)
+        value = self.node.attrs.get(name)
+        if value is not None and name in URL_ATTRIBUTES:
+            return urljoin(self.driver.url, value)
+        return value
+        
+    def is_displayed(self):
+        self.driver._command("isElementDisplayed")
+        return True
+        
+    def find_elements(self, by=CSS_SELECTOR, value=None):
+        self.driver._command("findChildElements")
+        return self.driver._timed(self.driver._find, self.node, by, value)
+        
+    def find_element(self, by=CSS_SELECTOR, value=None):
+        self.driver._command("findChildElement")
+        elements = self.driver._timed(self.driver._find, self.node, by, value)
+        if not elements:
+            raise NoSuchElementException(f"Öğe bulunamadı: {by}={value}")
+        return elements[0]
+        
+    def __eq__(self, other):
+        return isinstance(other, HtmlElement) and other.node is self.node
+        
+    def __hash__(self):
+        return id(self.node)
+
+class HtmlDriver:
+    """
+    Saklanan HTML'den yanıt veren sahte sürücü
+    
+    commands, komut adı -> çağrı sayısı sayacıdır (gerçek sürücüdeki
+    gidiş-dönüş sayısının karşılığı). latency_ms verilirse her komut bu kadar
+    bekletilir. Sahte DOM üzerindeki arama ve metin hesaplamasına harcanan
+    işlemci süresi busy_seconds'ta toplanır; gerçek sürücüde bu iş tarayıcıda
+    yapıldığından çıkarıcının kendi süresi hesaplanırken düşülebilir.
+    """
+    def __init__(self, source="", url="about:blank", latency_ms=0):
+        """
+        Args:
+            source: Sayfa HTML'i
+            url: current_url değeri (göreli bağlantılar buna göre çözülür)
+            latency_ms: Komut başına yapay gecikme
+        """
+        self.latency = latency_ms / 1000
+        self.commands = Counter()
+        self.busy_seconds = 0.0
+        self.window_handles = ["main"]
+        self.current_window_handle = "main"
+        self.load(source, url)
+        
+    def load(self, source, url="about:blank"):
+        """Sayfayı değiştirir (ör. sonraki fikstür); komut sayaçları korunur"""
+        self.source = source
+        self.url = url
+        self.root = parse_html(source)
+        
+    def reset_commands(self):
+        """Komut sayaçlarını ve sahte DOM süresini sıfırlar"""
+        self.commands = Counter()
+        self.busy_seconds = 0.0
+        
+    @property
+    def command_count(self):
+        return sum(self.commands.values())
+        
+    def _command(self, name):
+        self.commands[name] += 1
+        if self.latency:
+            time.sleep(self.latency)
+            
+    def _timed(self, func, *args):
+        started = time.process_time()
+        try:
+            return func(*args)
+        finally:
+            self.busy_seconds += time.process_time() - started
+            
+    def _find(self, root, by, value):
+        if by == CSS_SELECTOR:
+            nodes = select(root, value)
+        elif by == TAG_NAME:
+            nodes = [node for node in root.iter_descendants() if node.tag == value.lower()]
+        elif by == XPATH:
+            nodes = select_xpath(root, value)
+        elif by == ID:
+            nodes = select(root, f"[id='{value}']")
+        elif by == CLASS_NAME:
+            nodes = select(root, f".{value}")
+        else:
+            raise InvalidSelectorException(f"Desteklenmeyen arama türü: {by}")
+        return [HtmlElement(self, node) for node in nodes]
+        
+    def find_elements(self, by=CSS_SELECTOR, value=None):
+        self._command("findElements")
+        return self._timed(self._find, self.root, by, value)
+        
+    def find_element(self, by=CSS_SELECTOR, value=None):
+        self._command("findElement")
+        elements = self._timed(self._find, self.root, by, value)
+        if not elements:
+            raise NoSuchElementException(f"Öğe bulunamadı: {by}={value}")
+        return elements[0]
+        
+    @property
+    def page_source(self):
+        self._command("getPageSource")
+        return self.source
+        
+    @property
+    def current_url(self):
+        self._command("getCurrentUrl")
+        return self.url
+        
+    @property
+    def title(self):
+        self._command("getTitle")
+        titles = [node for node in self.root.iter_descendants() if node.tag == 'title']
+        return titles[0].raw_text().strip() if titles else ""
+        
+    def execute_script(self, script, *args):
+        """Betik çalıştırılamaz; çağrı sayılır ve None döner"""
+        self._command("executeScript")
+        return None
+
+class HtmlBrowser:
+    """
+    Çıkarıcılara BrowserManager yerine verilebilen ince sarmalayıcı
+    
+    Beklemeler yapılmaz, yalnızca toplamı tutulur.
+    """
+    def __init__(self, driver):
+        self.driver = driver
+        self.sleep_seconds = 0.0
+        
+    def sleep(self, seconds):
+        self.sleep_seconds += seconds
+        
+    def random_sleep(self, min_time=None, max_time=None):
+        pass
+        
+    def collect_page_metrics(self, kind):
+        return None
+        
+    def snapshot_page(self, kind):
+        return False
\ No newline at end of file
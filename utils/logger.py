@@ -2,6 +2,8 @@
 Loglama yardımcıları
 """
 import logging
+import queue
+import threading
 import time
 import os
 import sys
@@ -62,4 +64,61 @@ class Logger:
     
     def debug(self, message):
         """Debug seviyesinde log"""
-        self.logger.debug(message)
\ No newline at end of file
+        self.logger.debug(message)
+
+class BackgroundFileLog:
+    """
+    Mesajları arka plan iş parçacığında dosyaya yazan günlük
+    
+    Çağıran taraf (ör. arayüz iş parçacığı) mesaj grubunu tek seferde
+    kuyruğa ekler; biçimlendirme ve disk yazma işlemi yazıcı iş
+    parçacığında yapılır.
+    """
+    
+    def __init__(self, log_dir="logs", prefix="scraper"):
+        """
+        Args:
+            log_dir: Günlük klasörü
+            prefix: Dosya adı öneki
+        """
+        if not os.path.exists(log_dir):
+            os.makedirs(log_dir)
+            
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        self.path = os.path.join(log_dir, f"{prefix}_{timestamp}.log")
+        
+        self.queue = queue.SimpleQueue()
+        self.thread = threading.Thread(target=self._write_loop, name="log-writer", daemon=True)
+        self.thread.start()
+        
+    def write_many(self, messages, level="INFO"):
+        """Mesajları dosyaya yazılmak üzere kuyruğa ekler"""
+        if messages:
+            self.queue.put((time.time(), level, list(messages)))
+            
+    def write_event(self, event):
+        """
+        Olay yolu abonesi olarak kullanılır; mesaj metni yazıcı iş parçacığında oluşturulur
+        
+        Args:
+            event: core.events.Event
+        """
+        self.queue.put((event.timestamp, event.level_name, (event,)))
+            
+    def _write_loop(self):
+        """Kuyruktaki mesaj gruplarını dosyaya yazar (None gelince durur)"""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            while True:
+                item = self.queue.get()
+                if item is None:
+                    break
+                created, level, messages = item
+                stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(created))
+                f.write("".join(f"{stamp} - {level} - {message}\n" for message in messages))
+                if self.queue.empty():
+                    f.flush()
+                    
+    def close(self):
+        """Kuyruktaki mesajları yazar ve dosyayı kapatır"""
+        self.queue.put(None)
+        self.thread.join()
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""
+Kayıt alanlarını karşılaştırma ve indeksleme için normalleştiren yardımcılar
+"""
+import re
+
+from .domain_index import extract_host, get_domain_index
+
+# Eksik alanlar için kullanılan yer tutucu değerler
+MISSING_VALUES = ("", "Bulunamadı", "Alınamadı", "Hata: Toplanamadı", "İsimsiz İşletme")
+
+NON_DIGIT_PATTERN = re.compile(r'\D')
+
+PLACE_ID_PATTERNS = [
+    re.compile(r'!1s(0x[0-9a-fA-F]+:0x[0-9a-fA-F]+)'),   # Google Maps özellik kimliği
+    re.compile(r'!19s(ChIJ[\w-]+)'),                      # Place ID (ChIJ...)
+    re.compile(r'place_id[:=](ChIJ[\w-]+)'),
+    re.compile(r'[?&]cid=(\d+)'),                         # Müşteri kimliği (cid)
+]
+
+def is_missing(value):
+    """
+    Değer eksik mi (None, boş veya yer tutucu) kontrol eder
+    
+    Args:
+        value: Kontrol edilecek değer
+        
+    Returns:
+        bool: Eksikse True
+    """
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return value.strip() in MISSING_VALUES
+    return False
+
+def extract_place_id(url):
+    """
+    Google Maps detay URL'sinden kalıcı işletme kimliğini çıkarır
+    
+    Args:
+        url: Detay sayfası URL'si
+        
+    Returns:
+        str: İşletme kimliği veya None
+    """
+    if is_missing(url):
+        return None
+    for pattern in PLACE_ID_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+    return None
+
+def normalize_phone(phone, country_code="90"):
+    """
+    Telefon numarasını E.164 biçimine (+ ve en fazla 15 rakam) çevirir
+    
+    Args:
+        phone: Ham telefon numarası
+        country_code: Ülke kodu eksikse eklenecek kod
+        
+    Returns:
+        str: "+905321234567" biçiminde numara veya None
+    """
+    if is_missing(phone):
+        return None
+        
+    digits = NON_DIGIT_PATTERN.sub('', phone)
+    if not phone.strip().startswith('+'):
+        if digits.startswith('00'):
+            digits = digits[2:]
+        elif digits.startswith('0'):
+            digits = country_code + digits[1:]
+        elif len(digits) == 10:
+            digits = country_code + digits
+            
+    return f"+{digits}" if 8 <= len(digits) <= 15 else None
+
+def website_domain(url):
+    """
+    Website URL'sinden karşılaştırma için alan adını çıkarır
+    
+    Args:
+        url: Website URL'si
+        
+    Returns:
+        str: "www." öneki olmadan küçük harfli alan adı veya None
+    """
+    if is_missing(url):
+        return None
+    host = extract_host(url)
+    if host and host.startswith('www.'):
+        host = host[4:]
+    return host or None
+
+COORDINATE_PATTERNS = [
+    re.compile(r'!3d(-?\d+\.\d+)!4d(-?\d+\.\d+)'),   # İşletmenin kendi konumu
+    re.compile(r'@(-?\d+\.\d+),(-?\d+\.\d+)'),        # Harita görünümünün merkezi
+]
+
+def extract_coordinates(url):
+    """
+    Google Maps detay URL'sinden enlem ve boylamı çıkarır
+    
+    Args:
+        url: Detay sayfası URL'si
+        
+    Returns:
+        tuple: (enlem, boylam) veya (None, None)
+    """
+    if is_missing(url):
+        return None, None
+    for pattern in COORDINATE_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return float(match.group(1)), float(match.group(2))
+    return None, None
+
+# Kanonik URL'den atılacak izleme parametreleri
+TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid', 'yclid', 'mc_eid', '_ga')
+
+URL_PARTS_PATTERN = re.compile(
+    r'^(?:(?P<scheme>[a-zA-Z][a-zA-Z0-9+.-]*):)?//(?:[^@/?#]*@)?(?P<host>[^/:?#]*)'
+    r'(?::(?P<port>\d*))?(?P<path>[^?#]*)(?:\?(?P<query>[^#]*))?'
+)
+
+def registrable_domain(host):
+    """
+    Alan adının kayıt edilebilir kısmını döndürür (ör. shop.ornek.com.tr -> ornek.com.tr)
+    
+    Args:
+        host: Host adı veya URL
+        
+    Returns:
+        str: Kayıt edilebilir alan adı veya None
+    """
+    if is_missing(host):
+        return None
+    return get_domain_index().registrable_domain(host)
+
+def canonical_url(url):
+    """
+    Website URL'sini kanonik biçime çevirir
+    
+    Şema ve host küçük harfe çevrilir, varsayılan port, parça (#) ve izleme
+    parametreleri atılır; yalnızca kök yol varsa "/" ile biter.
+    
+    Args:
+        url: Website URL'si
+        
+    Returns:
+        str: Kanonik URL veya None
+    """
+    if is_missing(url):
+        return None
+    url = url.strip()
+    if '//' not in url:
+        url = 'http://' + url
+    match = URL_PARTS_PATTERN.match(url)
+    if not match or not match.group('host'):
+        return None
+        
+    scheme = (match.group('scheme') or 'http').lower()
+    host = match.group('host').lower().rstrip('.')
+    port = match.group('port')
+    if port and not ((scheme == 'http' and port == '80') or (scheme == 'https' and port == '443')):
+        host = f"{host}:{port}"
+        
+    path = match.group('path') or '/'
+    query = match.group('query')
+    if query:
+        params = [param for param in query.split('&')
+                  if param and not param.lower().startswith(TRACKING_PARAMS)]
+        query = '&'.join(params)
+        
+    return f"{scheme}://{host}{path}" + (f"?{query}" if query else "")
\ No newline at end of file
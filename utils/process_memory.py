@@ -0,0 +1,163 @@
+"""
+Süreç ağacı bellek ölçüm yardımcıları
+"""
+import os
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+def is_supported():
+    """
+    Bellek ölçümü bu sistemde yapılabiliyor mu kontrol eder
+    
+    Returns:
+        bool: psutil kuruluysa veya /proc okunabiliyorsa True
+    """
+    return psutil is not None or os.path.isdir('/proc')
+
+def _proc_children_map():
+    """/proc üzerinden ebeveyn -> çocuk süreç eşlemesini çıkarır"""
+    children = {}
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{name}/stat', 'rb') as f:
+                stat = f.read().decode('utf-8', 'replace')
+            # Süreç adı parantez içinde boşluk içerebilir, son ')' sonrası alanları kullan
+            fields = stat[stat.rfind(')') + 2:].split()
+            ppid = int(fields[1])
+            children.setdefault(ppid, []).append(int(name))
+        except (OSError, ValueError, IndexError):
+            continue
+    return children
+
+def get_descendants(pid):
+    """
+    Bir sürecin tüm alt süreçlerini bulur
+    
+    Args:
+        pid: Kök süreç kimliği
+        
+    Returns:
+        list: Alt süreç kimlikleri
+    """
+    if psutil is not None:
+        try:
+            return [child.pid for child in psutil.Process(pid).children(recursive=True)]
+        except psutil.Error:
+            return []
+            
+    children = _proc_children_map()
+    result = []
+    stack = [pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            result.append(child)
+            stack.append(child)
+    return result
+
+def get_cmdline(pid):
+    """
+    Sürecin komut satırını döndürür
+    
+    Args:
+        pid: Süreç kimliği
+        
+    Returns:
+        str: Komut satırı veya boş metin
+    """
+    if psutil is not None:
+        try:
+            return " ".join(psutil.Process(pid).cmdline())
+        except psutil.Error:
+            return ""
+            
+    try:
+        with open(f'/proc/{pid}/cmdline', 'rb') as f:
+            return f.read().replace(b'\0', b' ').decode('utf-8', 'replace').strip()
+    except OSError:
+        return ""
+
+def get_rss(pid):
+    """
+    Tek bir sürecin yerleşik bellek (RSS) kullanımını döndürür
+    
+    Args:
+        pid: Süreç kimliği
+        
+    Returns:
+        int: Bayt cinsinden RSS (okunamazsa 0)
+    """
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return 0
+            
+    try:
+        with open(f'/proc/{pid}/statm') as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return 0
+
+def get_tree_rss(pid):
+    """
+    Bir süreç ve tüm alt süreçlerinin toplam RSS değerini döndürür
+    
+    Args:
+        pid: Kök süreç kimliği
+        
+    Returns:
+        int: Bayt cinsinden toplam RSS
+    """
+    if not pid or not is_supported():
+        return 0
+    return sum(get_rss(p) for p in [pid] + get_descendants(pid))
+
+def find_process_by_marker(parent_pid, marker):
+    """
+    Üst sürecin altında komut satırında verilen işareti içeren ilk kök süreci bulur
+    
+    Chrome'un tüm yardımcı süreçleri aynı --user-data-dir değerini taşır; ebeveyni de
+    işareti taşıyan süreçler atlanarak tarayıcının ana süreci bulunur.
+    
+    Args:
+        parent_pid: Aramanın başlayacağı süreç (ör. chromedriver)
+        marker: Komut satırında aranacak metin
+        
+    Returns:
+        int: Süreç kimliği veya None
+    """
+    if not parent_pid or not marker or not is_supported():
+        return None
+        
+    if psutil is not None:
+        try:
+            matches = {}
+            for child in psutil.Process(parent_pid).children(recursive=True):
+                try:
+                    if marker in " ".join(child.cmdline()):
+                        matches[child.pid] = child.ppid()
+                except psutil.Error:
+                    continue
+            for pid, ppid in matches.items():
+                if ppid not in matches:
+                    return pid
+        except psutil.Error:
+            pass
+        return None
+        
+    # /proc üzerinden genişlik öncelikli arama: ilk eşleşme ana süreçtir
+    children = _proc_children_map()
+    queue = list(children.get(parent_pid, []))
+    while queue:
+        pid = queue.pop(0)
+        if marker in get_cmdline(pid):
+            return pid
+        queue.extend(children.get(pid, []))
+    return None
\ No newline at end of file
@@ -4,6 +4,10 @@ Doğrulama fonksiyonları
 import re
 from urllib.parse import urlparse
 
+# Desenler modül yüklenirken bir kez derlenir
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+PHONE_PATTERN = re.compile(r'^[0-9\s\(\)\+\-]+$')
+
 def is_valid_email(email):
     """
     E-posta adresinin geçerli olup olmadığını kontrol eder
@@ -17,8 +21,7 @@ def is_valid_email(email):
     if not email or not isinstance(email, str):
         return False
         
-    pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-    return bool(pattern.match(email))
+    return bool(EMAIL_PATTERN.match(email))
 
 def is_valid_url(url):
     """
@@ -53,8 +56,7 @@ def is_valid_phone(phone):
         return False
         
     # Sadece sayı, boşluk, parantez ve + karakterleri içerebilir
-    pattern = re.compile(r'^[0-9\s\(\)\+\-]+$')
-    return bool(pattern.match(phone))
+    return bool(PHONE_PATTERN.match(phone))
 
 def has_minimum_length(text, min_length=3):
     """